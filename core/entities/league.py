@@ -6,6 +6,7 @@ from core.entities.team import Team
 from utils.database import SaveFile
 from utils.screen import highlight_table_row
 from core.simulation import scheduling as sc
+from core.simulation.calibration_context import CalibrationContext
 
 # TODO: using disk based file saving, concurrent access an issue. 
 
@@ -38,9 +39,9 @@ class League:
         self.season = season
         self.is_random_league = is_random_league
         
-        # Goal tracking for calibration
-        self.__season_total_goals = 0
-        self.__season_total_matches = 0
+        # Calibration, including the season goal tracking
+        self.__calibration = CalibrationContext(league_name, is_random_league,
+                                                [team.name for team in teams])
         if my_team is not None:
           self.my_team = teams[my_team].name
         else:
@@ -163,8 +164,8 @@ class League:
             "season": self.season,
             "myteam": self.my_team,
             "is_random_league": self.is_random_league,
-            "season_total_goals": self.__season_total_goals,
-            "season_total_matches": self.__season_total_matches
+            "season_total_goals": self.__calibration.season_total_goals,
+            "season_total_matches": self.__calibration.season_total_matches
         }
 
     def __order_standings(self, showStars=False):
@@ -271,7 +272,8 @@ class League:
             return
             
         msg0 = team1.name + " vs " + team2.name
-        result = game_simulator.play_match(team1, team2, league_name=self.league_name, is_random_league=self.is_random_league, league_instance=self)
+        result = game_simulator.play_match(team1, team2, league_name=self.league_name,
+                                           is_random_league=self.is_random_league, calibration=self.__calibration)
         msg1 = str(result[0]) + " - " + str(result[1])
         match_results.append([msg0, msg1])
         
@@ -341,6 +343,7 @@ class League:
                 # Add new team
                 new_team = new_teams.pop()
                 self.__teams[new_team.name] = new_team
+                self.__calibration.add_team(new_team.name)
                 self.__team_order[team_index] = new_team.name
             else:
                 break
@@ -370,10 +373,6 @@ class League:
         self.my_team = savedState["myteam"]
         self.is_random_league = savedState.get("is_random_league", False)  # Default to False for old saves
         
-        # Restore goal tracking stats
-        self.__season_total_goals = savedState.get("season_total_goals", 0)
-        self.__season_total_matches = savedState.get("season_total_matches", 0)
-
         # Restore teams with optimized storage
         self.__teams = {}
         self.__team_order = []
@@ -383,6 +382,11 @@ class League:
             self.__teams[team.name] = team
             self.__team_order.append(team.name)
 
+        # Capture the league calibration once for the restored state, with its goal tracking stats
+        self.__calibration = CalibrationContext(self.league_name, self.is_random_league, self.__team_order,
+                                                savedState.get("season_total_goals", 0),
+                                                savedState.get("season_total_matches", 0))
+
         self.__number_teams = len(self.__teams)
         self.valid = (self.__number_teams > 2) and (self.__number_teams > self.__relegation_zone) and \
                         sc.calendar_valid(self.__berger_schedule)
@@ -433,7 +437,9 @@ class League:
             return (0, 0)
         
         # Run the simulation with league context
-        home_score, away_score = game_simulator.play_match(home_team, away_team, league_name=self.league_name, is_random_league=self.is_random_league, league_instance=self)
+        home_score, away_score = game_simulator.play_match(home_team, away_team, league_name=self.league_name,
+                                                           is_random_league=self.is_random_league,
+                                                           calibration=self.__calibration)
         
         # Track goals for rolling average
         self.add_match_goals(home_score, away_score)
@@ -450,22 +456,24 @@ class League:
                 return i
         return None
     
+    def calibration_context(self) -> CalibrationContext:
+        """Get the calibration context captured at creation or restore."""
+        return self.__calibration
+    
     def add_match_goals(self, home_goals: int, away_goals: int):
         """Track goals for rolling average calculation."""
-        self.__season_total_goals += home_goals + away_goals
-        self.__season_total_matches += 1
+        self.__calibration.record(home_goals, away_goals)
     
     def get_season_average_goals(self) -> float:
         """Get current season rolling average goals per match."""
-        if self.__season_total_matches == 0:
+        if self.__calibration.season_total_matches == 0:
             return 0.0
-        return self.__season_total_goals / self.__season_total_matches
+        return self.__calibration.season_total_goals / self.__calibration.season_total_matches
     
     def get_season_match_count(self) -> int:
         """Get number of matches played this season."""
-        return self.__season_total_matches
+        return self.__calibration.season_total_matches
     
     def reset_season_stats(self):
         """Reset season goal tracking stats."""
-        self.__season_total_goals = 0
-        self.__season_total_matches = 0
+        self.__calibration.reset()
@@ -16,7 +16,7 @@ class Team:
     :param name: team name
     :param elo: team elo (defaults to 1500 if invalid/missing)
     :param full_definition: if not none includes the complete set of team stats (name, _Team__elo, 
-      _Team__old_elo, played, goals, stats, stars, result_streak)
+      _Team__old_elo, played, goals, stats, stars, result_streak, league_info)
     """
     try:
       if full_definition:
@@ -28,6 +28,9 @@ class Team:
         self.stats = full_definition.get("stats", [0, 0, 0])
         self.stars = full_definition.get("stars", 0)
         self.result_streak = full_definition.get("result_streak", 0)
+        # Saved team data metadata (ratings the match engine reads, see simulator.attack_factor)
+        if full_definition.get("league_info"):
+          self.league_info = full_definition["league_info"]
         return
     except (KeyError, TypeError) as e:
       print(f"Warning: Invalid team definition provided: {e}")
@@ -0,0 +1,248 @@
+"""
+League Calibration Context
+
+Everything the match engine needs to calibrate goals for a league is derived once,
+when the league is created or restored, instead of on every match:
+
+1. The target average goals for the league (from GoalsCalibration)
+2. The goal profile for that target: draw multiplier, goal distributions,
+   extra goal chance and goal cap
+3. For random leagues, the original league average of every team, so the
+   effective (lower scoring) profile of a fixture is a dictionary lookup
+4. The season rolling average, kept as running totals with the resulting
+   adjustment factor updated incrementally after each match. Profiles fitted
+   offline (see calibration_fitter) hit their target and skip this feedback.
+
+Per-match work is then limited to arithmetic on these precomputed values.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Iterable, Optional, Tuple
+
+from core.simulation.goals_calibration import get_calibration
+
+
+@dataclass(frozen=True)
+class GoalProfile:
+    """Per-target constants used by the match engine to generate scores."""
+    target_avg: float
+    draw_multiplier: float
+    home_win_goals: Tuple[int, ...]
+    away_loss_goals: Tuple[int, ...]
+    draw_scores: Tuple[int, ...]
+    extra_goal_chance: float
+    max_goals: int
+    calibrated: bool = True
+    # Apply the rolling average adjustment (hand-tuned profiles only, fitted ones hit their target)
+    feedback: bool = True
+
+
+def build_goal_profile(target_avg: float, fitted: Optional[dict] = None) -> GoalProfile:
+    """
+    Derive the goal profile for a calibrated league with the given target average.
+
+    Fitted parameters from the calibration artifact are used when available. Otherwise
+    the hand-tuned ladders apply: conservative goal distributions targeting 80-100% of
+    league averages, corrected at runtime by the rolling average feedback.
+    """
+    if fitted:
+        return GoalProfile(
+            target_avg=target_avg,
+            draw_multiplier=fitted['draw_multiplier'],
+            home_win_goals=tuple(fitted['home_win_goals']),
+            away_loss_goals=tuple(fitted['away_loss_goals']),
+            draw_scores=tuple(fitted['draw_scores']),
+            extra_goal_chance=fitted['extra_goal_chance'],
+            max_goals=fitted['max_goals'],
+            feedback=False,
+        )
+
+    # More draws in low-scoring leagues
+    if target_avg < 2.6:
+        draw_multiplier = 0.35
+    elif target_avg < 2.9:
+        draw_multiplier = 0.30
+    else:
+        draw_multiplier = 0.25
+
+    # Base distributions for different average goal ranges - conservative approach
+    if target_avg < 2.5:  # Very low scoring leagues
+        home_win_goals = (1, 1, 1, 2, 2)
+        away_loss_goals = (0, 0, 1, 1)
+        draw_scores = (0, 1, 1, 1)
+    elif target_avg < 2.7:  # Low scoring leagues
+        home_win_goals = (1, 1, 1, 2, 2)
+        away_loss_goals = (0, 0, 1, 1)
+        draw_scores = (1, 1, 1, 1)
+    elif target_avg < 2.9:  # Medium scoring leagues
+        home_win_goals = (1, 1, 2, 2, 2)
+        away_loss_goals = (0, 1, 1, 1)
+        draw_scores = (1, 1, 1, 1)
+    elif target_avg < 3.1:  # Medium-high scoring leagues
+        home_win_goals = (1, 1, 2, 2, 2)
+        away_loss_goals = (0, 1, 1, 1)
+        draw_scores = (1, 1, 1, 2)
+    else:  # High scoring leagues (3.1+) - slightly increased for very high targets
+        home_win_goals = (1, 2, 2, 2, 3)
+        away_loss_goals = (0, 1, 1, 1, 1)
+        draw_scores = (1, 1, 2, 2)
+
+    # Reduced extra goal chances to avoid overshooting targets
+    if target_avg < 2.5:
+        extra_goal_chance = 0.02  # Very conservative for low scoring leagues
+    elif target_avg < 2.8:
+        extra_goal_chance = 0.03  # Conservative for low scoring leagues
+    elif target_avg < 3.1:
+        extra_goal_chance = 0.04  # Moderate for medium-high scoring leagues
+    else:
+        extra_goal_chance = 0.06  # Slight increase for very high-scoring leagues
+
+    return GoalProfile(
+        target_avg=target_avg,
+        draw_multiplier=draw_multiplier,
+        home_win_goals=home_win_goals,
+        away_loss_goals=away_loss_goals,
+        draw_scores=draw_scores,
+        extra_goal_chance=extra_goal_chance,
+        # Ensure realistic scores (cap at 4 goals for most leagues)
+        max_goals=5 if target_avg > 3.0 else 4,
+    )
+
+
+# Balanced distributions used when no league calibration is available
+DEFAULT_PROFILE = GoalProfile(
+    target_avg=2.75,
+    draw_multiplier=0.28,
+    home_win_goals=(1, 1, 2, 2, 2, 2),
+    away_loss_goals=(0, 1, 1, 1, 1),
+    draw_scores=(1, 1, 1, 1, 2),
+    extra_goal_chance=0.04,
+    max_goals=4,
+    calibrated=False,
+)
+
+
+class CalibrationContext:
+    """
+    League-bound calibration state captured at League creation or restore.
+
+    The context is owned by a League and passed to the match engine. It holds the
+    league goal profile, per-team profiles for random leagues and the running
+    season totals behind the rolling average adjustment. The totals are the
+    league's only record of them: League reads and saves them from here.
+    """
+
+    # Matches needed before the rolling average is considered meaningful
+    MIN_MATCHES_FOR_ADJUSTMENT = 5
+
+    def __init__(self, league_name: Optional[str] = None, is_random_league: bool = False,
+                 team_names: Iterable[str] = (), season_total_goals: int = 0,
+                 season_total_matches: int = 0):
+        """
+        Build the context for a league.
+
+        Args:
+            league_name: League name, None for an uncalibrated context
+            is_random_league: Whether fixtures use the teams' original leagues
+            team_names: Team names, only needed for random leagues
+            season_total_goals: Goals scored so far this season (restored games)
+            season_total_matches: Matches played so far this season (restored games)
+        """
+        self.league_name = league_name
+        self.is_random_league = is_random_league and bool(league_name)
+
+        if league_name:
+            self.profile = self._profile_for_league(league_name)
+        else:
+            self.profile = DEFAULT_PROFILE
+
+        # Random leagues: team name -> original league average (None if unknown)
+        self._team_averages: Dict[str, Optional[float]] = {}
+        # Random leagues: lower team average -> effective profile
+        self._pair_profiles: Dict[float, GoalProfile] = {}
+        if self.is_random_league:
+            for name in team_names:
+                self.add_team(name)
+
+        self.season_total_goals = season_total_goals
+        self.season_total_matches = season_total_matches
+        self.rolling_adjustment = 1.0
+        self._update_rolling_adjustment()
+
+    @staticmethod
+    def _profile_for_league(league_name: str) -> GoalProfile:
+        """Build the calibrated profile for a league name."""
+        calibration = get_calibration()
+        return build_goal_profile(calibration.get_league_average(league_name),
+                                  calibration.get_league_profile(league_name))
+
+    def add_team(self, team_name: str):
+        """Register a team joining a random league (creation or promotion)."""
+        if self.is_random_league and team_name not in self._team_averages:
+            self._team_averages[team_name] = get_calibration().get_team_league_average(team_name)
+
+    def profile_for(self, home_name: str, away_name: str) -> GoalProfile:
+        """
+        Get the goal profile for a fixture.
+
+        Random leagues use the lower of the two teams' original league averages, mapped
+        to the closest matching league, for more defensive matches.
+        """
+        if not self.is_random_league:
+            return self.profile
+
+        home_avg = self._team_averages.get(home_name)
+        away_avg = self._team_averages.get(away_name)
+        if home_avg is None or away_avg is None:
+            return self.profile
+
+        lower_avg = min(home_avg, away_avg)
+        profile = self._pair_profiles.get(lower_avg)
+        if profile is None:
+            profile = self.profile
+            # Find the closest matching league
+            for league_key, avg in get_calibration().goals_data.items():
+                if abs(avg - lower_avg) < 0.1:
+                    profile = self._profile_for_league(league_key)
+                    break
+            self._pair_profiles[lower_avg] = profile
+        return profile
+
+    def adjustment_for(self, profile: GoalProfile) -> float:
+        """Get the rolling average adjustment to apply with the given profile."""
+        if profile is self.profile:
+            return self.rolling_adjustment
+        return self._rolling_adjustment(profile)
+
+    def record(self, home_goals: int, away_goals: int):
+        """Add a played match to the season totals and refresh the adjustment."""
+        self.season_total_goals += home_goals + away_goals
+        self.season_total_matches += 1
+        self._update_rolling_adjustment()
+
+    def reset(self):
+        """Reset the season totals (new season)."""
+        self.season_total_goals = 0
+        self.season_total_matches = 0
+        self.rolling_adjustment = 1.0
+
+    def _update_rolling_adjustment(self):
+        self.rolling_adjustment = self._rolling_adjustment(self.profile)
+
+    def _rolling_adjustment(self, profile: GoalProfile) -> float:
+        """Adjustment factor pulling the season average towards the profile target."""
+        if not profile.feedback or not profile.calibrated or \
+                self.season_total_matches < self.MIN_MATCHES_FOR_ADJUSTMENT:
+            return 1.0
+
+        current_avg = self.season_total_goals / self.season_total_matches
+        target_avg = profile.target_avg
+        if current_avg == 0:
+            return 1.3
+        if current_avg > target_avg:
+            # Current average is too high, reduce goals slightly
+            return max(0.7, target_avg / current_avg)
+        if current_avg < target_avg * 0.9:
+            # Current average is significantly low, increase goals slightly
+            return min(1.3, (target_avg * 0.95) / current_avg)
+        return 1.0
@@ -0,0 +1,362 @@
+"""
+Offline Calibration Fitter
+
+Searches the match engine parameters of every league against the targets in
+assets/league_average_goals.csv and writes them to the calibration artifact
+(assets/league_calibration.json) that the engine loads at startup.
+
+Fitting uses the analytic model of the engine instead of simulating seasons:
+
+1. Fixtures are sampled once per league with NumPy from the league's real team
+   ELO ratings (or equal strength teams when the league is not in the team data),
+   including home advantage and the injury modifier, giving the win probabilities
+   the engine sees, and with the attack factor of each side (simulator.attack_factor)
+   that scales its extra goal chance.
+2. For a goal profile, expected goals and draw rate per fixture follow exactly from
+   the discrete goal distributions, the extra goal chance and the goal cap.
+   Expected goals are linear in the extra goal chance, so that parameter is solved
+   in closed form for each candidate.
+3. The remaining parameters (draw multiplier, goal distributions, goal cap) are
+   searched on a grid. Candidates must hit the goals target; the draw rate is
+   pulled towards a Poisson reference draw rate for the target average.
+
+Fitted profiles hit their target on average, so they disable the runtime rolling
+average feedback.
+
+Usage:
+    python -m core.simulation.calibration_fitter
+"""
+
+import math
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from core.simulation.goals_calibration import (
+    DEFAULT_CSV_PATH, canonical_league_key, compile_artifact, read_league_targets
+)
+
+
+# Candidate goal distributions: (home_win_goals, away_loss_goals, draw_scores)
+CANDIDATE_DISTRIBUTIONS = [
+    ((1, 1, 1, 1, 2), (0, 0, 0, 0, 1), (0, 0, 1, 1)),
+    ((1, 1, 1, 1, 2), (0, 0, 0, 1), (0, 0, 1, 1)),
+    ((1, 1, 1, 2, 2), (0, 0, 1, 1), (0, 1, 1, 1)),
+    ((1, 1, 1, 2, 2), (0, 0, 1, 1), (1, 1, 1, 1)),
+    ((1, 1, 1, 2, 2), (0, 1, 1, 1), (0, 1, 1, 1)),
+    ((1, 1, 2, 2, 2), (0, 1, 1, 1), (1, 1, 1, 1)),
+    ((1, 1, 2, 2, 2), (0, 1, 1, 1), (1, 1, 1, 2)),
+    ((1, 2, 2, 2, 3), (0, 1, 1, 1, 1), (1, 1, 2, 2)),
+    ((1, 1, 2, 2, 2, 2), (0, 1, 1, 1, 1), (1, 1, 1, 1, 2)),
+    ((1, 1, 2, 2, 3), (0, 0, 1, 1, 2), (0, 1, 1, 2)),
+    ((1, 1, 2, 3), (0, 0, 1), (0, 0, 1, 1, 2)),
+    ((1, 2, 2, 3, 3), (0, 1, 1, 1, 2), (0, 1, 1, 2)),
+    ((1, 2, 2, 3, 4), (0, 0, 1, 1, 2), (0, 1, 1, 2, 2)),
+]
+DRAW_MULTIPLIERS = [round(0.20 + 0.01 * i, 2) for i in range(26)]
+GOAL_CAPS = [4, 5, 6]
+MAX_EXTRA_GOAL_CHANCE = 0.15
+
+# Engine constants mirrored from Team.winning_probability and play_match
+HOME_OFFSET = 50
+INJURY_RANGE = (0.85, 1.0)
+DEFAULT_ELO = 1500.0
+
+# Share of goals scored by the home side in the Poisson draw rate reference
+HOME_GOAL_SHARE = 0.55
+# Goals error (goals per match) within which a candidate counts as hitting the target
+GOALS_TOLERANCE = 0.01
+
+
+@dataclass
+class FitResult:
+    """Best parameters found for one league."""
+    key: str
+    target_avg: float
+    expected_avg: float
+    expected_draw_rate: float
+    draw_multiplier: float
+    home_win_goals: Tuple[int, ...]
+    away_loss_goals: Tuple[int, ...]
+    draw_scores: Tuple[int, ...]
+    extra_goal_chance: float
+    max_goals: int
+
+    def profile_params(self) -> dict:
+        """Parameters stored in the calibration artifact."""
+        return {
+            'draw_multiplier': self.draw_multiplier,
+            'home_win_goals': list(self.home_win_goals),
+            'away_loss_goals': list(self.away_loss_goals),
+            'draw_scores': list(self.draw_scores),
+            'extra_goal_chance': round(self.extra_goal_chance, 5),
+            'max_goals': self.max_goals,
+        }
+
+
+def poisson_draw_rate(target_avg: float, home_share: float = HOME_GOAL_SHARE) -> float:
+    """Draw probability of two independent Poisson scorers sharing target_avg goals."""
+    home_rate = target_avg * home_share
+    away_rate = target_avg - home_rate
+    term = math.exp(-target_avg)
+    total = term
+    for k in range(1, 20):
+        term *= home_rate * away_rate / (k * k)
+        total += term
+    return total
+
+
+def sample_fixtures(elos: Sequence[float], samples: int, rng: np.random.Generator,
+                    attack_factors: Optional[np.ndarray] = None) -> Tuple[np.ndarray, ...]:
+    """
+    Sample fixture win probabilities as computed by Team.winning_probability.
+
+    Args:
+        elos: ELO ratings of the league teams (at least 2)
+        samples: Number of fixtures to sample
+        rng: NumPy random generator
+        attack_factors: attack_factors[i, j] is the attack factor of team i against
+            team j (all 1.0 when omitted)
+
+    Returns:
+        (home_win_probability, away_win_probability, home_attack_factor,
+        away_attack_factor) arrays
+    """
+    elos = np.asarray(elos, dtype=float)
+    home = rng.integers(0, len(elos), samples)
+    # Pick a different away team for every fixture
+    away = (home + rng.integers(1, len(elos), samples)) % len(elos)
+    home_injury = rng.uniform(*INJURY_RANGE, samples)
+    away_injury = rng.uniform(*INJURY_RANGE, samples)
+
+    home_delta = (elos[home] + HOME_OFFSET) * home_injury - elos[away]
+    away_delta = elos[away] * away_injury - elos[home]
+    home_p = 1 / (10 ** (home_delta / -400) + 1)
+    away_p = 1 / (10 ** (away_delta / -400) + 1)
+    if attack_factors is None:
+        return home_p, away_p, np.ones(samples), np.ones(samples)
+    return home_p, away_p, attack_factors[home, away], attack_factors[away, home]
+
+
+def _branch_scores(distribution) -> List[List[Tuple[int, int, float]]]:
+    """
+    Base score tables of the home win, draw and away win branches of the engine.
+
+    Returns:
+        Three lists of (home_goals, away_goals, probability), one entry per distinct score
+    """
+    home_win_goals, away_loss_goals, draw_scores = distribution
+    pair_p = 1 / (len(home_win_goals) * len(away_loss_goals))
+
+    home_win: Dict[Tuple[int, int], float] = {}
+    away_win: Dict[Tuple[int, int], float] = {}
+    for winner in home_win_goals:
+        for loser in away_loss_goals:
+            # The engine lifts the winner one goal above the loser when needed
+            winner_goals = loser + 1 if loser >= winner else winner
+            home_win[(winner_goals, loser)] = home_win.get((winner_goals, loser), 0) + pair_p
+            away_win[(loser, winner_goals)] = away_win.get((loser, winner_goals), 0) + pair_p
+    draw: Dict[Tuple[int, int], float] = {}
+    for score in draw_scores:
+        draw[(score, score)] = draw.get((score, score), 0) + 1 / len(draw_scores)
+    return [[(h, a, p) for (h, a), p in table.items()] for table in (home_win, draw, away_win)]
+
+
+class _LeagueModel:
+    """Analytic engine model over a fixed sample of fixtures."""
+
+    def __init__(self, home_p: np.ndarray, away_p: np.ndarray, home_factor: np.ndarray, away_factor: np.ndarray):
+        self.home_p = home_p
+        self.away_p = away_p
+        # Per-fixture extra goal probability per unit of extra goal chance
+        self.home_extra_rate = home_p * home_factor
+        self.away_extra_rate = away_p * away_factor
+        self._weights: Dict[float, np.ndarray] = {}
+
+    def branch_weights(self, draw_multiplier: float) -> np.ndarray:
+        """Home win, draw and away win probabilities per fixture (3 x N)."""
+        weights = self._weights.get(draw_multiplier)
+        if weights is None:
+            draw = draw_multiplier * (1 - np.abs(self.home_p - self.away_p))
+            total = self.home_p + self.away_p + draw
+            home = self.home_p / total
+            draw = draw / total
+            weights = np.vstack([home, draw, 1 - home - draw])
+            self._weights[draw_multiplier] = weights
+        return weights
+
+    def evaluate(self, branches, draw_multiplier: float, cap: int, target_avg: float):
+        """
+        Solve the extra goal chance for the target and evaluate the profile.
+
+        Returns:
+            (expected_avg, draw_rate, extra_goal_chance)
+        """
+        weights = self.branch_weights(draw_multiplier)
+
+        # Expected goals = base + extra_goal_chance * slope (per fixture, averaged)
+        base = np.zeros_like(self.home_p)
+        slope = np.zeros_like(self.home_p)
+        for weight, table in zip(weights, branches):
+            capped = sum(p * (min(h, cap) + min(a, cap)) for h, a, p in table)
+            home_open = sum(p for h, _, p in table if h < cap)
+            away_open = sum(p for _, a, p in table if a < cap)
+            base += weight * capped
+            slope += weight * (self.home_extra_rate * home_open + self.away_extra_rate * away_open)
+
+        mean_base = float(base.mean())
+        mean_slope = float(slope.mean())
+        if mean_slope > 0:
+            extra = (target_avg - mean_base) / mean_slope
+        else:
+            extra = 0.0
+        extra = min(MAX_EXTRA_GOAL_CHANCE, max(0.0, extra))
+        expected_avg = mean_base + extra * mean_slope
+
+        home_extra = self.home_extra_rate * extra
+        away_extra = self.away_extra_rate * extra
+        draw_rate = np.zeros_like(self.home_p)
+        for weight, table in zip(weights, branches):
+            branch_draw = np.zeros_like(self.home_p)
+            for h, a, p in table:
+                for home_bonus, home_q in ((0, 1 - home_extra), (1, home_extra)):
+                    for away_bonus, away_q in ((0, 1 - away_extra), (1, away_extra)):
+                        if min(h + home_bonus, cap) == min(a + away_bonus, cap):
+                            branch_draw += p * home_q * away_q
+            draw_rate += weight * branch_draw
+
+        return expected_avg, float(draw_rate.mean()), extra
+
+
+def fit_league(key: str, target_avg: float, elos: Optional[Sequence[float]] = None,
+               samples: int = 5000, seed: int = 0, attack_factors: Optional[np.ndarray] = None) -> FitResult:
+    """
+    Fit the engine parameters of one league.
+
+    Args:
+        key: Canonical league key
+        target_avg: Target average goals per match
+        elos: ELO ratings of the league teams, equal strength teams when omitted
+        samples: Number of sampled fixtures
+        seed: Random seed for the fixture sample
+        attack_factors: Attack factor matrix of the teams (see sample_fixtures)
+
+    Returns:
+        FitResult with the best parameters
+    """
+    if not elos or len(elos) < 2:
+        elos = [DEFAULT_ELO] * 20
+        attack_factors = None
+    rng = np.random.default_rng(seed)
+    model = _LeagueModel(*sample_fixtures(elos, samples, rng, attack_factors))
+    draw_target = poisson_draw_rate(target_avg)
+
+    best = None
+    best_loss = (math.inf, math.inf)
+    for distribution in CANDIDATE_DISTRIBUTIONS:
+        branches = _branch_scores(distribution)
+        for cap in GOAL_CAPS:
+            for draw_multiplier in DRAW_MULTIPLIERS:
+                expected_avg, draw_rate, extra = model.evaluate(branches, draw_multiplier, cap, target_avg)
+                # Hit the goals target first, then get closest to the reference draw rate
+                loss = (max(0.0, abs(expected_avg - target_avg) - GOALS_TOLERANCE), abs(draw_rate - draw_target))
+                if loss < best_loss:
+                    best_loss = loss
+                    best = FitResult(
+                        key=key,
+                        target_avg=target_avg,
+                        expected_avg=expected_avg,
+                        expected_draw_rate=draw_rate,
+                        draw_multiplier=draw_multiplier,
+                        home_win_goals=distribution[0],
+                        away_loss_goals=distribution[1],
+                        draw_scores=distribution[2],
+                        extra_goal_chance=extra,
+                        max_goals=cap,
+                    )
+    return best
+
+
+def league_teams() -> Dict[str, list]:
+    """Teams per canonical country+league key from the team data, as the game loads them."""
+    from core.storage.elo_estimator import ELOEstimator
+    from core.storage.team_storage import TeamStorage, DEFAULT_RAW_CSV_PATH
+
+    storage = TeamStorage(ELOEstimator())
+    if not storage.load_from_raw_data(DEFAULT_RAW_CSV_PATH):
+        return {}
+    teams_by_key = {}
+    for league_name, countries in storage.teams_by_league.items():
+        for country, teams in countries.items():
+            teams_by_key[canonical_league_key(country + league_name)] = teams
+    return teams_by_key
+
+
+def league_elos() -> Dict[str, List[float]]:
+    """Team ELO ratings per canonical country+league key from the team data."""
+    return {key: [team.elo for team in teams] for key, teams in league_teams().items()}
+
+
+def attack_factor_matrix(teams) -> np.ndarray:
+    """attack_factor of every ordered pair of teams (the diagonal is unused)."""
+    from core.simulation.simulator import attack_factor
+
+    return np.array([[attack_factor(attacker, defender) for defender in teams] for attacker in teams])
+
+
+def fit_all(csv_path: str = None, samples: int = 5000, seed: int = 0,
+            use_team_data: bool = True) -> List[FitResult]:
+    """
+    Fit every league in the goals CSV.
+
+    Args:
+        csv_path: Goals CSV, defaults to assets/league_average_goals.csv
+        samples: Number of sampled fixtures per league
+        seed: Random seed
+        use_team_data: Use real team ratings when the league is in the team data
+
+    Returns:
+        List of FitResult in CSV order
+    """
+    teams_by_key = league_teams() if use_team_data else {}
+    results = []
+    for country, league, target_avg in read_league_targets(csv_path or DEFAULT_CSV_PATH):
+        key = canonical_league_key(country + league)
+        teams = teams_by_key.get(key)
+        if teams:
+            results.append(fit_league(key, target_avg, [team.elo for team in teams], samples, seed,
+                                      attack_factor_matrix(teams)))
+        else:
+            results.append(fit_league(key, target_avg, None, samples, seed))
+    return results
+
+
+def write_artifact(results: List[FitResult], csv_path: str = None, artifact_path: str = None) -> str:
+    """Write the fitted profiles to the calibration artifact."""
+    profiles = {result.key: result.profile_params() for result in results}
+    return compile_artifact(csv_path, artifact_path, profiles=profiles)
+
+
+def main():
+    """Fit all leagues and write the calibration artifact."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Fit per-league match engine parameters')
+    parser.add_argument('--samples', type=int, default=5000, help='sampled fixtures per league')
+    parser.add_argument('--seed', type=int, default=0, help='random seed')
+    parser.add_argument('--no-team-data', action='store_true', help='fit with equal strength teams only')
+    parser.add_argument('--output', default=None, help='artifact path')
+    args = parser.parse_args()
+
+    results = fit_all(samples=args.samples, seed=args.seed, use_team_data=not args.no_team_data)
+    print(f"{'League':<28} {'Target':<7} {'Model':<7} {'Draws':<6} {'DrawX':<6} {'Extra':<6} {'Cap':<3}")
+    print('-' * 70)
+    for r in results:
+        print(f"{r.key[:28]:<28} {r.target_avg:<7.2f} {r.expected_avg:<7.3f} {r.expected_draw_rate:<6.3f} "
+              f"{r.draw_multiplier:<6.2f} {r.extra_goal_chance:<6.3f} {r.max_goals:<3}")
+    print(f"\nCalibration artifact written to {write_artifact(results, artifact_path=args.output)}")
+
+
+if __name__ == '__main__':
+    main()
@@ -3,43 +3,169 @@ Goals Calibration Module
 
 This module loads and provides average goals per match data for different leagues
 to ensure realistic match simulation results.
+
+League names are resolved through a canonical key index that is built once at
+load time. Keys are accent-, case- and separator-insensitive, so "Germany - 2. Bundesliga",
+"2._Bundesliga" and "2 Bundesliga" all resolve to the same entry. A bare league name
+resolves only if no two countries share it ("Bundesliga" needs its country). The index can
+be loaded straight from the CSV (standard library only) or from a precompiled
+JSON artifact produced by `compile_artifact`. The artifact also carries the
+per-league engine parameters fitted offline by `calibration_fitter`.
 """
 
+import csv
+import hashlib
+import json
 import os
-import pandas as pd
-from typing import Dict, Optional
+import unicodedata
+from functools import lru_cache
+from typing import Dict, Iterator, Optional, Tuple
+
+
+ASSETS_DIR = os.path.join(os.path.dirname(__file__), '..', '..', 'assets')
+DEFAULT_CSV_PATH = os.path.join(ASSETS_DIR, 'league_average_goals.csv')
+DEFAULT_ARTIFACT_PATH = os.path.join(ASSETS_DIR, 'league_calibration.json')
+
+# Format 2 drops bare league keys shared by several countries
+ARTIFACT_FORMAT = 2
+DEFAULT_AVERAGE = 2.75
+# Canonical keys remembered for repeated lookups of the same league names
+KEY_CACHE_SIZE = 1024
+
+
+@lru_cache(maxsize=KEY_CACHE_SIZE)
+def canonical_league_key(name: str) -> str:
+    """
+    Normalise a league name into its canonical lookup key.
+
+    Accents are stripped (NFKD decomposition drops combining marks), case is folded
+    and every non alphanumeric character (spaces, underscores, dashes, dots) is removed.
+
+    Args:
+        name: League name in any of the formats used across the game
+
+    Returns:
+        Canonical key, e.g. "Germany - 2. Bundesliga" -> "germany2bundesliga"
+    """
+    decomposed = unicodedata.normalize('NFKD', name)
+    return ''.join(ch for ch in decomposed if ch.isalnum()).casefold()
+
+
+def read_league_targets(csv_path: str) -> Iterator[Tuple[str, str, float]]:
+    """
+    Read the league targets from the goals CSV.
+
+    Yields:
+        (country, league, average goals per match) in file order
+    """
+    with open(csv_path, 'r', encoding='utf-8', newline='') as f:
+        # Skip blank lines (the shipped CSV starts with one) before reading the header
+        rows = (row for row in csv.reader(f) if row)
+        header = next(rows, None)
+        if header is None:
+            return
+        country_col = header.index('Country')
+        league_col = header.index('League')
+        average_col = header.index('Average Goals per Match')
+        for row in rows:
+            yield row[country_col], row[league_col], float(row[average_col])
+
+
+def _league_keys(csv_path: str) -> Tuple[Dict[str, float], Dict[str, str]]:
+    """
+    Country-qualified keys of the goals CSV and the bare keys that can stand in for them.
+
+    Returns:
+        (country+league key -> average, bare league key -> country+league key); bare
+        keys shared by leagues of several countries are left out
+    """
+    averages: Dict[str, float] = {}
+    bare: Dict[str, Optional[str]] = {}
+    for country, league, average in read_league_targets(csv_path):
+        key = canonical_league_key(country + league)
+        averages[key] = average
+        league_key = canonical_league_key(league)
+        # None marks a league name used in more than one country
+        bare[league_key] = key if bare.get(league_key, key) == key else None
+    return averages, {league_key: key for league_key, key in bare.items()
+                      if key is not None and league_key not in averages}
+
+
+def _file_digest(path: str) -> str:
+    """Return the SHA1 digest of a file's content."""
+    with open(path, 'rb') as f:
+        return hashlib.sha1(f.read()).hexdigest()
 
 
 class GoalsCalibration:
     """Manages average goals per match data for different leagues."""
     
-    def __init__(self):
+    def __init__(self, csv_path: str = None, artifact_path: str = None):
+        """
+        Load the calibration index.
+
+        Args:
+            csv_path: Source CSV, defaults to assets/league_average_goals.csv
+            artifact_path: Precompiled artifact, defaults to assets/league_calibration.json.
+                The artifact is used only when it was compiled from the current CSV.
+        """
+        self.csv_path = csv_path or DEFAULT_CSV_PATH
+        self.artifact_path = artifact_path or DEFAULT_ARTIFACT_PATH
+        self.default_average = DEFAULT_AVERAGE
+        # canonical key -> average goals per match
         self.goals_data: Dict[str, float] = {}
+        # canonical key -> fitted engine parameters (from the artifact, see calibration_fitter)
+        self.profiles: Dict[str, dict] = {}
         self._load_goals_data()
     
     def _load_goals_data(self):
-        """Load average goals data from CSV file."""
-        csv_path = os.path.join(os.path.dirname(__file__), '..', '..', 'assets', 'league_average_goals.csv')
+        """Load average goals data, preferring an up to date precompiled artifact."""
+        try:
+            source_digest = _file_digest(self.csv_path)
+        except OSError as e:
+            print(f"Warning: Could not load goals calibration data: {e}")
+            return
+
+        if self._load_artifact(source_digest):
+            return
         
         try:
-            df = pd.read_csv(csv_path)
-            # Create a dictionary with league name as key
-            for _, row in df.iterrows():
-                # Handle different league name formats
-                league_key = row['League'].replace(' ', '_')
-                self.goals_data[league_key] = row['Average Goals per Match']
+            self.goals_data = self._build_index(self.csv_path)
+        except (OSError, KeyError, ValueError) as e:
+            print(f"Warning: Could not load goals calibration data: {e}")
                 
-                # Also store with original name for flexibility
-                self.goals_data[row['League']] = row['Average Goals per Match']
+    def _load_artifact(self, source_digest: str) -> bool:
+        """
+        Load the canonical index from the precompiled artifact.
                 
-                # Store country-league combination
-                country_league = f"{row['Country']}_{row['League']}"
-                self.goals_data[country_league] = row['Average Goals per Match']
+        Returns:
+            bool: True if the artifact exists, has a known format and matches the CSV digest
+        """
+        try:
+            with open(self.artifact_path, 'r', encoding='utf-8') as f:
+                artifact = json.load(f)
+        except (OSError, ValueError):
+            return False
                 
-        except Exception as e:
-            print(f"Warning: Could not load goals calibration data: {e}")
-            # Set default average if file can't be loaded
-            self.default_average = 2.75
+        if artifact.get('format') != ARTIFACT_FORMAT or artifact.get('source_sha1') != source_digest:
+            return False
+
+        self.goals_data = {key: float(avg) for key, avg in artifact.get('index', {}).items()}
+        self.profiles = artifact.get('profiles', {})
+        return bool(self.goals_data)
+
+    @staticmethod
+    def _build_index(csv_path: str) -> Dict[str, float]:
+        """
+        Build the canonical key index from the CSV file.
+
+        Each row is indexed under its country+league key, and under its bare league key
+        unless another country has a league of that name: "Premier League" and
+        "England - Premier League" both resolve, "Bundesliga" does not.
+        """
+        index, bare = _league_keys(csv_path)
+        index.update((league_key, index[key]) for league_key, key in bare.items())
+        return index
     
     def get_league_average(self, league_name: str) -> float:
         """
@@ -51,24 +177,26 @@ class GoalsCalibration:
         Returns:
             Average goals per match for the league, or default if not found
         """
-        # Try different variations of the league name
-        variations = [
-            league_name,
-            league_name.replace('_', ' '),
-            league_name.replace(' ', '_'),
-        ]
+        return self.goals_data.get(canonical_league_key(league_name), self.default_average)
         
-        for variant in variations:
-            if variant in self.goals_data:
-                return self.goals_data[variant]
+    def get_league_profile(self, league_name: str) -> Optional[dict]:
+        """
+        Get the fitted engine parameters for a league.
         
-        # Return default if not found
-        return getattr(self, 'default_average', 2.75)
+        Args:
+            league_name: Name of the league
+
+        Returns:
+            Parameter dict written by the calibration fitter, or None if the league was not fitted
+        """
+        if not self.profiles:
+            return None
+        return self.profiles.get(canonical_league_key(league_name))
     
     def get_team_league_average(self, team_name: str) -> Optional[float]:
         """
         Try to determine the league average based on team name.
-        This searches through all leagues to find which one contains the team.
+        The team is located through the player storage catalog of the per-team CSVs.
         
         Args:
             team_name: Name of the team
@@ -76,32 +204,17 @@ class GoalsCalibration:
         Returns:
             Average goals for the team's league, or None if not found
         """
-        # Load team data to find their league
-        import os
-        data_dir = os.path.join(os.path.dirname(__file__), '..', '..', 'assets', 'data')
+        from core.storage.player_storage import player_storage
         
-        try:
-            # Search through all country/league directories
-            for country in os.listdir(data_dir):
-                country_path = os.path.join(data_dir, country)
-                if not os.path.isdir(country_path) or country in ['backups']:
-                    continue
+        team_file = player_storage.find_team_file(team_name)
+        if team_file is None:
+            return None
                     
-                for league in os.listdir(country_path):
-                    league_path = os.path.join(country_path, league)
-                    if not os.path.isdir(league_path):
-                        continue
-                        
-                    # Check if team exists in this league
-                    team_file = os.path.join(league_path, f"{team_name}.csv")
-                    if os.path.exists(team_file):
-                        # Found the team, return this league's average
-                        return self.get_league_average(league.replace('_', ' '))
-                        
-        except Exception:
-            pass
-            
-        return None
+        # Prefer the country-qualified key, league names repeat across countries
+        country_key = canonical_league_key(team_file.country + team_file.league)
+        if country_key in self.goals_data:
+            return self.goals_data[country_key]
+        return self.get_league_average(team_file.league)
     
     def get_calibration_factor(self, league_name: str, current_average: float) -> float:
         """
@@ -127,6 +240,50 @@ class GoalsCalibration:
         return max(0.7, min(1.3, factor))
 
 
+def compile_artifact(csv_path: str = None, artifact_path: str = None, profiles: Dict[str, dict] = None) -> str:
+    """
+    Precompile the canonical league index into a JSON artifact.
+
+    Args:
+        csv_path: Source CSV, defaults to assets/league_average_goals.csv
+        artifact_path: Output path, defaults to assets/league_calibration.json
+        profiles: Fitted engine parameters by canonical country+league key. When omitted,
+            the profiles of an existing artifact compiled from the same CSV are kept.
+
+    Returns:
+        str: Path of the written artifact
+    """
+    csv_path = csv_path or DEFAULT_CSV_PATH
+    artifact_path = artifact_path or DEFAULT_ARTIFACT_PATH
+    source_digest = _file_digest(csv_path)
+
+    if profiles is None:
+        profiles = {}
+        try:
+            with open(artifact_path, 'r', encoding='utf-8') as f:
+                previous = json.load(f)
+            if previous.get('source_sha1') == source_digest:
+                profiles = previous.get('profiles', {})
+        except (OSError, ValueError):
+            pass
+
+    # Index the fitted profiles under the same keys as the averages
+    averages, bare = _league_keys(csv_path)
+    fitted = profiles
+    profiles = {key: fitted[key] for key in averages if key in fitted}
+    profiles.update((league_key, profiles[key]) for league_key, key in bare.items() if key in profiles)
+
+    artifact = {
+        'format': ARTIFACT_FORMAT,
+        'source_sha1': source_digest,
+        'index': GoalsCalibration._build_index(csv_path),
+        'profiles': profiles,
+    }
+    with open(artifact_path, 'w', encoding='utf-8') as f:
+        json.dump(artifact, f, indent=1, sort_keys=True)
+    return artifact_path
+
+
 # Global instance
 _calibration = None
 
@@ -135,4 +292,8 @@ def get_calibration():
     global _calibration
     if _calibration is None:
         _calibration = GoalsCalibration()
-    return _calibration
\ No newline at end of file
+    return _calibration
+
+
+if __name__ == '__main__':
+    print(f"Calibration artifact written to {compile_artifact()}")
@@ -8,6 +8,7 @@ for realistic match outcomes. The simulation considers:
 2. Team form and injury modifiers  
 3. Realistic score distributions based on match outcome
 4. Proper draw probability calculations
+5. Attack against defence ratings (squad-derived where player data exists) for extra goals
 
 Match Flow:
 1. Calculate team winning probabilities using ELO ratings
@@ -25,7 +26,13 @@ Match Modifiers (for future use):
 
 import random
 from core.entities.team import Team
-from core.simulation.goals_calibration import get_calibration
+from core.simulation.calibration_context import CalibrationContext, GoalProfile
+
+# Rating points of attack over the opponent's defence that double the extra goal chance
+STRENGTH_SCALE = 40.0
+# Bounds of the attack factor on the extra goal chance
+MIN_ATTACK_FACTOR = 0.5
+MAX_ATTACK_FACTOR = 1.5
 
 
 class MatchType:
@@ -58,78 +65,62 @@ class MatchType:
         return 20
 
 
-def match_result(home_win_probability, away_win_probability, league_name=None, league_instance=None):
+def match_result(home_win_probability, away_win_probability, league_name=None, league_instance=None,
+                 calibration=None):
     """
     Enhanced match result calculation using ELO-based probabilities
     with league-specific goal calibration.
+
+    The calibration context carries the precomputed goal profile and rolling
+    average adjustment. Without one, a context is built for league_name.
     """
-    # Get calibration data if league is specified
-    calibration = get_calibration() if league_name else None
-    target_avg = calibration.get_league_average(league_name) if calibration and league_name else 2.75
-    
-    # Apply rolling average calibration if league instance is available
-    rolling_avg_adjustment = 1.0
-    if league_instance and calibration and league_name:
-        current_avg = league_instance.get_season_average_goals()
-        match_count = league_instance.get_season_match_count()
-        
-        # Only apply adjustment after a few matches to get meaningful average
-        if match_count >= 5:
-            if current_avg > target_avg:
-                # Current average is too high, reduce goals slightly
-                rolling_avg_adjustment = max(0.7, target_avg / current_avg)
-            elif current_avg < target_avg * 0.9:
-                # Current average is significantly low, increase goals slightly
-                rolling_avg_adjustment = min(1.3, (target_avg * 0.95) / current_avg)
-    
-    # Calculate draw probability based on team strength similarity - Increased draws for lower scoring
+    if calibration is None:
+        calibration = _resolve_calibration(league_name, False, league_instance)
+    profile = calibration.profile
+    return _score(home_win_probability, away_win_probability, profile, calibration.adjustment_for(profile))
+
+
+def _resolve_calibration(league_name, is_random_league, league_instance, team_names=()):
+    """Get the calibration context of a league, or build one for a standalone match."""
+    if league_instance is not None:
+        return league_instance.calibration_context()
+    return CalibrationContext(league_name, is_random_league, team_names)
+
+
+def attack_factor(attacker: Team, defender: Team) -> float:
+    """
+    Scale of the attacker's extra goal chance from its attack against the defender's defence.
+
+    Both ratings are precomputed at load time from the clubs' best XI (league_info,
+    strength_source 'squad'). When either team has no squad ratings (team data
+    ratings, custom teams) the factor is 1.0.
+    """
+    attacker_info = getattr(attacker, 'league_info', None)
+    defender_info = getattr(defender, 'league_info', None)
+    if not attacker_info or not defender_info \
+            or attacker_info.get('strength_source') != 'squad' or defender_info.get('strength_source') != 'squad':
+        return 1.0
+    try:
+        factor = 1 + (attacker_info['attack'] - defender_info['defence']) / STRENGTH_SCALE
+    except (KeyError, TypeError):
+        return 1.0
+    return min(max(factor, MIN_ATTACK_FACTOR), MAX_ATTACK_FACTOR)
+
+
+def _score(home_win_probability, away_win_probability, profile: GoalProfile, rolling_avg_adjustment,
+           home_attack_factor=1.0, away_attack_factor=1.0):
+    """Generate a score from win probabilities, a goal profile and the teams' attack factors."""
+    # Calculate draw probability based on team strength similarity
     strength_diff = abs(home_win_probability - away_win_probability)
-    if league_name and calibration:
-        if target_avg < 2.6:
-            draw_multiplier = 0.35  # More draws in low-scoring leagues
-        elif target_avg < 2.9:
-            draw_multiplier = 0.30
-        else:
-            draw_multiplier = 0.25
-    else:
-        draw_multiplier = 0.28
-    
-    draw_probability = draw_multiplier * (1 - strength_diff)
+    draw_probability = profile.draw_multiplier * (1 - strength_diff)
     
     # Normalize probabilities
     total = home_win_probability + away_win_probability + draw_probability
     home_win_prob = home_win_probability / total
-    away_win_prob = away_win_probability / total
     draw_prob = draw_probability / total
     
-    # Conservative goal distributions targeting 80-100% of league averages
-    if league_name and calibration:
-        # Define base distributions for different average goal ranges - conservative approach
-        if target_avg < 2.5:  # Very low scoring leagues
-            home_win_goals = [1, 1, 1, 2, 2]
-            away_loss_goals = [0, 0, 1, 1]
-            draw_scores = [0, 1, 1, 1]
-        elif target_avg < 2.7:  # Low scoring leagues
-            home_win_goals = [1, 1, 1, 2, 2]
-            away_loss_goals = [0, 0, 1, 1]
-            draw_scores = [1, 1, 1, 1]
-        elif target_avg < 2.9:  # Medium scoring leagues
-            home_win_goals = [1, 1, 2, 2, 2]
-            away_loss_goals = [0, 1, 1, 1]
-            draw_scores = [1, 1, 1, 1]
-        elif target_avg < 3.1:  # Medium-high scoring leagues
-            home_win_goals = [1, 1, 2, 2, 2]
-            away_loss_goals = [0, 1, 1, 1]
-            draw_scores = [1, 1, 1, 2]
-        else:  # High scoring leagues (3.1+) - slightly increased for very high targets
-            home_win_goals = [1, 2, 2, 2, 3]
-            away_loss_goals = [0, 1, 1, 1, 1]
-            draw_scores = [1, 1, 2, 2]
-    else:
-        # Default distributions - balanced
-        home_win_goals = [1, 1, 2, 2, 2, 2]
-        away_loss_goals = [0, 1, 1, 1, 1]
-        draw_scores = [1, 1, 1, 1, 2]
+    home_win_goals = profile.home_win_goals
+    away_loss_goals = profile.away_loss_goals
     
     # Determine match outcome first
     outcome_roll = random.random()
@@ -142,7 +133,7 @@ def match_result(home_win_probability, away_win_probability, league_name=None, l
             base_home_goals = base_away_goals + 1
     elif outcome_roll < home_win_prob + draw_prob:
         # Draw - use league-adjusted draw scores
-        draw_score = random.choice(draw_scores)
+        draw_score = random.choice(profile.draw_scores)
         base_home_goals = base_away_goals = draw_score
     else:
         # Away win - use league-adjusted scoring
@@ -156,38 +147,23 @@ def match_result(home_win_probability, away_win_probability, league_name=None, l
     home_goals = base_home_goals
     away_goals = base_away_goals
     
-    # Conservative extra goal probability targeting 80-100% of targets
-    if league_name and calibration:
-        # Reduced extra goal chances to avoid overshooting targets
-        if target_avg < 2.5:
-            base_extra_goal_chance = 0.02  # Very conservative for low scoring leagues
-        elif target_avg < 2.8:
-            base_extra_goal_chance = 0.03  # Conservative for low scoring leagues
-        elif target_avg < 3.1:
-            base_extra_goal_chance = 0.04  # Moderate for medium-high scoring leagues
-        else:
-            base_extra_goal_chance = 0.06  # Slight increase for very high-scoring leagues
-        
-        # Apply rolling average adjustment
-        extra_goal_chance = base_extra_goal_chance * rolling_avg_adjustment
-    else:
-        extra_goal_chance = 0.04  # Balanced default
-        
-    # Very conservative chance for extra goals
-    if random.random() < home_win_probability * extra_goal_chance:
+    # Very conservative chance for extra goals, scaled by the rolling average adjustment
+    extra_goal_chance = profile.extra_goal_chance * rolling_avg_adjustment
+    if random.random() < home_win_probability * extra_goal_chance * home_attack_factor:
         home_goals += 1
-    if random.random() < away_win_probability * extra_goal_chance:
+    if random.random() < away_win_probability * extra_goal_chance * away_attack_factor:
         away_goals += 1
     
-    # Ensure realistic scores (cap at 4 goals for most leagues)
-    max_goals = 5 if target_avg > 3.0 else 4
+    # Ensure realistic scores
+    max_goals = profile.max_goals
     home_goals = min(home_goals, max_goals)
     away_goals = min(away_goals, max_goals)
     
     return home_goals, away_goals
 
 
-def play_match(home_team: Team, away_team: Team, match_modifier=40, home_offset=50, league_name=None, is_random_league=False, league_instance=None):
+def play_match(home_team: Team, away_team: Team, match_modifier=40, home_offset=50, league_name=None, is_random_league=False, league_instance=None,
+               calibration=None):
     """
     Main match simulation function that orchestrates the complete match process.
     
@@ -202,6 +178,8 @@ def play_match(home_team: Team, away_team: Team, match_modifier=40, home_offset=
         away_team (Team): The away team object  
         match_modifier (int): ELO adjustment factor (default 40 for league matches)
         home_offset (int): Home advantage bonus to ELO (default 50)
+        calibration (CalibrationContext): League calibration context; when omitted it is taken
+            from league_instance or built for league_name
         
     Returns:
         tuple: (home_goals, away_goals) - The final match score
@@ -215,24 +193,15 @@ def play_match(home_team: Team, away_team: Team, match_modifier=40, home_offset=
     home_winning_probability = Team.winning_probability(home_team, away_team, home_offset)
     away_wining_probability = Team.winning_probability(away_team, home_team, 0)
     
-    # For random leagues, determine effective league based on teams
-    effective_league = league_name
-    if is_random_league and league_name:
-        calibration = get_calibration()
-        # Get the average for each team's original league
-        home_avg = calibration.get_team_league_average(home_team.name)
-        away_avg = calibration.get_team_league_average(away_team.name)
-        
-        # Use the lower average for more defensive matches
-        if home_avg is not None and away_avg is not None:
-            lower_avg = min(home_avg, away_avg)
-            # Find the closest matching league
-            for league, avg in calibration.goals_data.items():
-                if abs(avg - lower_avg) < 0.1:
-                    effective_league = league
-                    break
-        
-    home_goals, away_goals = match_result(home_winning_probability, away_wining_probability, effective_league, league_instance)
+    if calibration is None:
+        calibration = _resolve_calibration(league_name, is_random_league, league_instance,
+                                           (home_team.name, away_team.name))
+    # For random leagues the profile depends on the teams' original leagues
+    profile = calibration.profile_for(home_team.name, away_team.name)
+    
+    home_goals, away_goals = _score(home_winning_probability, away_wining_probability, profile,
+                                    calibration.adjustment_for(profile),
+                                    attack_factor(home_team, away_team), attack_factor(away_team, home_team))
     home_team.new_rating(match_modifier, home_goals - away_goals, home_winning_probability)
     away_team.new_rating(match_modifier, away_goals - home_goals, away_wining_probability)
     home_team.add_match(home_goals, away_goals)
@@ -0,0 +1,205 @@
+"""
+Content-Addressed Backup Store
+
+This module stores team data snapshots with deduplication:
+
+- Objects: every team record is serialized canonically (sorted keys, compact JSON),
+  compressed with zlib and stored once under its SHA-256 (objects/ab/cdef...)
+- Snapshots: a gzip manifest per snapshot (snapshots/<id>.jsonl.gz) with a header
+  line followed by one [team_name, object hash] line per team
+
+A team record unchanged between two snapshots is the same object, so a weekly
+snapshot only adds the records that changed plus its manifest. Snapshots are read
+back by streaming the manifest and loading objects one at a time, and objects no
+snapshot references any more are removed by gc().
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import zlib
+from datetime import datetime
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+
+MANIFEST_FORMAT = 1
+MANIFEST_SUFFIX = '.jsonl.gz'
+
+
+def _atomic_write(path: str, data: bytes):
+    """Write a file through a temporary file so readers never see partial content."""
+    temp_path = f"{path}.tmp"
+    with open(temp_path, 'wb') as f:
+        f.write(data)
+    os.replace(temp_path, path)
+
+
+class BackupStore:
+    """Snapshots of team records sharing content-addressed, compressed objects."""
+
+    def __init__(self, root_dir: str):
+        self.root_dir = root_dir
+        self.objects_dir = os.path.join(root_dir, 'objects')
+        self.snapshots_dir = os.path.join(root_dir, 'snapshots')
+
+    def _object_path(self, digest: str) -> str:
+        return os.path.join(self.objects_dir, digest[:2], digest[2:])
+
+    def _manifest_path(self, snapshot_id: str) -> str:
+        return os.path.join(self.snapshots_dir, snapshot_id + MANIFEST_SUFFIX)
+
+    def put_object(self, record: dict) -> str:
+        """
+        Store a record unless an identical one is stored already.
+
+        Returns:
+            SHA-256 of the record's canonical JSON
+        """
+        data = json.dumps(record, sort_keys=True, separators=(',', ':')).encode('utf-8')
+        digest = hashlib.sha256(data).hexdigest()
+        path = self._object_path(digest)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            _atomic_write(path, zlib.compress(data, 6))
+        return digest
+
+    def get_object(self, digest: str) -> dict:
+        with open(self._object_path(digest), 'rb') as f:
+            return json.loads(zlib.decompress(f.read()))
+
+    def create_snapshot(self, records: Iterable[Tuple[str, dict]], timestamp: datetime = None) -> str:
+        """
+        Store a snapshot of team records.
+
+        Args:
+            records: (team_name, record) pairs, stored in this order
+            timestamp: Snapshot time, now if None
+
+        Returns:
+            Snapshot id (the timestamp as YYYYmmdd_HHMMSS, suffixed if taken)
+        """
+        timestamp = timestamp or datetime.now()
+        os.makedirs(self.snapshots_dir, exist_ok=True)
+        snapshot_id = timestamp.strftime('%Y%m%d_%H%M%S')
+        suffix = 1
+        while os.path.exists(self._manifest_path(snapshot_id)):
+            suffix += 1
+            snapshot_id = f"{timestamp.strftime('%Y%m%d_%H%M%S')}_{suffix}"
+
+        entries = [(team_name, self.put_object(record)) for team_name, record in records]
+        lines = [json.dumps({'format': MANIFEST_FORMAT, 'timestamp': timestamp.isoformat(),
+                             'team_count': len(entries)})]
+        lines.extend(json.dumps(entry, ensure_ascii=False) for entry in entries)
+        # Written after its objects, so a manifest never references missing objects
+        _atomic_write(self._manifest_path(snapshot_id),
+                      gzip.compress(('\n'.join(lines) + '\n').encode('utf-8'), mtime=0))
+        return snapshot_id
+
+    def snapshots(self) -> List[str]:
+        """Snapshot ids, oldest first."""
+        if not os.path.isdir(self.snapshots_dir):
+            return []
+        return sorted(name[:-len(MANIFEST_SUFFIX)] for name in os.listdir(self.snapshots_dir)
+                      if name.endswith(MANIFEST_SUFFIX))
+
+    def snapshot_info(self, snapshot_id: str) -> dict:
+        """Header of a snapshot (timestamp, team_count)."""
+        with gzip.open(self._manifest_path(snapshot_id), 'rt', encoding='utf-8') as f:
+            return json.loads(f.readline())
+
+    def _iter_manifest(self, snapshot_id: str) -> Iterator[Tuple[str, str]]:
+        with gzip.open(self._manifest_path(snapshot_id), 'rt', encoding='utf-8') as f:
+            f.readline()  # header
+            for line in f:
+                if line.strip():
+                    team_name, digest = json.loads(line)
+                    yield team_name, digest
+
+    def iter_snapshot(self, snapshot_id: str) -> Iterator[Tuple[str, dict]]:
+        """Stream the (team_name, record) pairs of a snapshot, one object read at a time."""
+        for team_name, digest in self._iter_manifest(snapshot_id):
+            yield team_name, self.get_object(digest)
+
+    def restore(self, snapshot_id: str, output_path: str):
+        """
+        Rebuild a snapshot as a JSON backup file (timestamp, team_count, teams).
+
+        Teams are written as they are streamed from the store, so memory use does
+        not grow with the snapshot size.
+        """
+        info = self.snapshot_info(snapshot_id)
+        temp_path = f"{output_path}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            f.write('{"timestamp": %s, "team_count": %d, "teams": {' % (json.dumps(info['timestamp']),
+                                                                        info['team_count']))
+            for index, (team_name, record) in enumerate(self.iter_snapshot(snapshot_id)):
+                f.write('%s%s: %s' % (', ' if index else '', json.dumps(team_name), json.dumps(record)))
+            f.write('}}\n')
+        os.replace(temp_path, output_path)
+
+    def import_json_backup(self, backup_path: str) -> Optional[str]:
+        """
+        Store a JSON backup file (the format written by restore) as a snapshot.
+
+        Returns:
+            Snapshot id, None if a snapshot with the backup's timestamp exists
+        """
+        with open(backup_path, 'r', encoding='utf-8') as f:
+            backup = json.load(f)
+        timestamp = datetime.fromisoformat(backup['timestamp'])
+        if os.path.exists(self._manifest_path(timestamp.strftime('%Y%m%d_%H%M%S'))):
+            return None
+        return self.create_snapshot(backup.get('teams', {}).items(), timestamp)
+
+    def delete_snapshot(self, snapshot_id: str):
+        """Delete a snapshot's manifest (its objects are removed by gc)."""
+        os.remove(self._manifest_path(snapshot_id))
+
+    def prune(self, keep: int) -> List[str]:
+        """
+        Keep the most recent snapshots and remove the objects only older ones used.
+
+        Returns:
+            Deleted snapshot ids
+        """
+        deleted = self.snapshots()[:-keep] if keep > 0 else self.snapshots()
+        for snapshot_id in deleted:
+            self.delete_snapshot(snapshot_id)
+        if deleted:
+            self.gc()
+        return deleted
+
+    def gc(self) -> int:
+        """
+        Remove objects no snapshot references.
+
+        Returns:
+            Number of removed objects
+        """
+        referenced: Set[str] = set()
+        for snapshot_id in self.snapshots():
+            referenced.update(digest for _, digest in self._iter_manifest(snapshot_id))
+        removed = 0
+        if not os.path.isdir(self.objects_dir):
+            return removed
+        for prefix in os.listdir(self.objects_dir):
+            prefix_dir = os.path.join(self.objects_dir, prefix)
+            for name in os.listdir(prefix_dir):
+                if prefix + name not in referenced:
+                    os.remove(os.path.join(prefix_dir, name))
+                    removed += 1
+            if not os.listdir(prefix_dir):
+                os.rmdir(prefix_dir)
+        return removed
+
+    def get_statistics(self) -> Dict[str, int]:
+        """Snapshot and object counts and the stored bytes (objects and manifests)."""
+        objects = stored_bytes = 0
+        for root in (self.objects_dir, self.snapshots_dir):
+            for directory, _, files in os.walk(root):
+                for name in files:
+                    stored_bytes += os.path.getsize(os.path.join(directory, name))
+                    if root == self.objects_dir:
+                        objects += 1
+        return {'snapshots': len(self.snapshots()), 'objects': objects, 'stored_bytes': stored_bytes}
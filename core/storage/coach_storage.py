@@ -0,0 +1,54 @@
+"""
+Coach Records
+
+This module reads the raw coach dumps (assets/raw/male_coaches.csv and
+female_coaches.csv) into typed records keyed by coach id. Names and
+nationalities are interned, so they share memory with the team and player data.
+"""
+
+import csv
+import os
+import sys
+from typing import Dict, NamedTuple, Optional
+
+
+RAW_DIR = os.path.join(os.path.dirname(__file__), '..', '..', 'assets', 'raw')
+DEFAULT_COACHES_CSV_PATH = os.path.join(RAW_DIR, 'male_coaches.csv')
+
+
+class CoachRecord(NamedTuple):
+    """Typed coach row of the raw CSV."""
+    coach_id: int
+    short_name: str
+    long_name: str
+    dob: Optional[str]
+    nationality: str
+    face_url: Optional[str]
+
+
+def read_coaches(csv_path: str = None) -> Dict[int, CoachRecord]:
+    """
+    Read a raw coach CSV.
+
+    Args:
+        csv_path: Path to the coach CSV, defaults to assets/raw/male_coaches.csv
+
+    Returns:
+        {coach_id: CoachRecord}; rows without a numeric id are skipped
+    """
+    coaches: Dict[int, CoachRecord] = {}
+    with open(csv_path or DEFAULT_COACHES_CSV_PATH, 'r', encoding='utf-8', newline='') as f:
+        for row in csv.DictReader(f):
+            try:
+                coach_id = int(float(row['coach_id']))
+            except (KeyError, ValueError):
+                continue
+            coaches[coach_id] = CoachRecord(
+                coach_id=coach_id,
+                short_name=sys.intern(row.get('short_name', '')),
+                long_name=sys.intern(row.get('long_name', '')),
+                dob=row.get('dob') or None,
+                nationality=sys.intern(row.get('nationality_name', '')),
+                face_url=row.get('coach_face_url') or None,
+            )
+    return coaches
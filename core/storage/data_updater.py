@@ -10,17 +10,72 @@ Currently supports:
 Data Sources:
 - Primary: Kaggle EA Sports FC 25 dataset (manual download required)
 - Alternative: FIFA Index web scraping (basic implementation)
+
+EA Sports updates are incremental: every row of the CSV is fingerprinted, the file
+is diffed against the fingerprints of the previous update, and only inserted,
+updated and deleted rows are applied. Applied ratings are kept in a state file and
+re-applied as rating overrides on the next start, and every update appends its
+changes to a compact journal (update_journal.jsonl).
+
+The game runs the weekly update in the background (start_background_update): a
+fresh TeamStorage is built and updated off to the side, and the game swaps it in
+between matches with team_storage.swap_pending().
 """
 
+import hashlib
 import json
 import os
+import threading
 import time
 from datetime import datetime, timedelta
-from typing import Dict, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
 import urllib.request
 import urllib.parse
 import urllib.error
-from core.storage.team_storage import team_storage
+from core.storage.backup_store import BackupStore
+from core.storage.team_storage import TeamStorage, team_storage
+
+
+FEED_STATE_FORMAT = 1
+
+
+def row_fingerprint(row: Dict[str, str]) -> str:
+    """Digest of a CSV row's columns and values (independent of column order)."""
+    digest = hashlib.sha256()
+    for column, value in sorted(row.items(), key=lambda item: str(item[0])):
+        digest.update(f"{column}\x1f{value}\x1e".encode('utf-8'))
+    return digest.hexdigest()[:32]
+
+
+def diff_rows(rows: Iterable[Dict[str, str]], fingerprints: Dict[str, str],
+              key: str = 'team_name') -> Tuple[Dict[str, str], Dict[str, Dict[str, str]], List[str], List[str]]:
+    """
+    Diff CSV rows against the fingerprints of a previous version.
+    
+    Args:
+        rows: Rows of the new version (a later row with the same key wins)
+        fingerprints: Fingerprint by key of the previous version
+        key: Column identifying a row
+        
+    Returns:
+        (fingerprint by key of the new version, changed rows by key,
+         inserted keys, deleted keys); only changed rows are kept in memory
+    """
+    current: Dict[str, str] = {}
+    changed: Dict[str, Dict[str, str]] = {}
+    for row in rows:
+        name = (row.get(key) or '').strip()
+        if not name:
+            continue
+        fingerprint = row_fingerprint(row)
+        current[name] = fingerprint
+        if fingerprints.get(name) != fingerprint:
+            changed[name] = row
+        else:
+            changed.pop(name, None)
+    inserted = [name for name in changed if name not in fingerprints]
+    deleted = [name for name in fingerprints if name not in current]
+    return current, changed, inserted, deleted
 
 
 class DataUpdater:
@@ -37,6 +92,14 @@ class DataUpdater:
         self.data_dir = data_dir
         self.update_log_file = os.path.join(data_dir, 'update_log.json')
         self.backup_dir = os.path.join(data_dir, 'backups')
+        # Snapshots share compressed team records by content hash (see BackupStore)
+        self.backup_store = BackupStore(self.backup_dir)
+        self.backup_retention = 52  # Snapshots kept, a year of weekly updates
+        # Legacy JSON backups already imported, so pruned snapshots are not imported again
+        self.legacy_imports_file = os.path.join(self.backup_dir, 'legacy_imports.json')
+        # Row fingerprints and applied ratings of the last EA Sports update
+        self.feed_state_file = os.path.join(data_dir, 'ea_sports_state.json')
+        self.journal_file = os.path.join(data_dir, 'update_journal.jsonl')
         
         # Ensure directories exist
         os.makedirs(data_dir, exist_ok=True)
@@ -44,6 +107,7 @@ class DataUpdater:
         
         # Update frequency (7 days)
         self.update_interval_days = 7
+        self._update_thread: Optional[threading.Thread] = None
         
     def check_for_updates(self) -> bool:
         """
@@ -64,22 +128,27 @@ class DataUpdater:
             print(f"Error checking for updates: {e}")
             return False
     
-    def perform_update(self, show_progress: bool = True) -> bool:
+    def perform_update(self, show_progress: bool = True, storage: TeamStorage = None) -> bool:
         """
         Perform the weekly data update.
         
         Args:
             show_progress: Whether to show progress messages
+            storage: Team storage to update, defaults to the global team storage
             
         Returns:
             bool: True if update was successful, False otherwise
         """
+        storage = storage or team_storage
         try:
             if show_progress:
                 print("🔄 Checking for team rating updates...")
             
+            # Updates touch every team
+            storage.wait_until_loaded()
+            
             # Create backup of current data
-            backup_success = self._create_backup()
+            backup_success = self._create_backup(storage)
             if not backup_success:
                 if show_progress:
                     print("⚠️  Warning: Could not create backup, continuing anyway...")
@@ -92,13 +161,13 @@ class DataUpdater:
             if os.path.exists(kaggle_path):
                 if show_progress:
                     print("📊 Found EA Sports FC 25 data, updating...")
-                update_success = self._update_from_ea_sports_csv(kaggle_path)
+                update_success = self._update_from_ea_sports_csv(kaggle_path, storage)
             
             # Method 2: Basic web scraping fallback (placeholder implementation)
             if not update_success:
                 if show_progress:
                     print("🌐 Attempting basic rating updates...")
-                update_success = self._update_ratings_basic()
+                update_success = self._update_ratings_basic(storage)
             
             # Update log regardless of success
             self._log_update_attempt(update_success)
@@ -160,35 +229,26 @@ class DataUpdater:
         except Exception as e:
             print(f"Warning: Could not update log file: {e}")
     
-    def _create_backup(self) -> bool:
-        """Create a backup of current team data."""
+    def _create_backup(self, storage: TeamStorage = None) -> bool:
+        """Create a backup snapshot of current team data."""
+        storage = storage or team_storage
         try:
-            if not team_storage.teams_by_name:
+            if not storage.teams_by_name:
                 return True  # No data to backup
-                
-            backup_file = os.path.join(
-                self.backup_dir, 
-                f"teams_backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-            )
             
-            # Export current team data
-            backup_data = {
-                'timestamp': datetime.now().isoformat(),
-                'team_count': len(team_storage.teams_by_name),
-                'teams': {}
-            }
+            self._import_legacy_backups()
             
-            for team_name, team in team_storage.teams_by_name.items():
-                backup_data['teams'][team_name] = {
+            # Only records that changed since earlier snapshots take new space
+            self.backup_store.create_snapshot(
+                (team_name, {
                     'name': team.name,
                     'elo': team.elo,
                     'league_info': getattr(team, 'league_info', {})
-                }
+                })
+                for team_name, team in storage.teams_by_name.items()
+            )
             
-            with open(backup_file, 'w') as f:
-                json.dump(backup_data, f, indent=2)
-                
-            # Clean old backups (keep last 5)
+            # Drop snapshots beyond the retention and the records only they used
             self._cleanup_old_backups()
             
             return True
@@ -197,77 +257,198 @@ class DataUpdater:
             print(f"Backup creation failed: {e}")
             return False
     
+    def _import_legacy_backups(self):
+        """
+        Store the JSON backups of earlier versions (teams_backup_*.json) as snapshots once.
+        
+        Imported file names are recorded in legacy_imports.json, so a legacy backup is
+        not imported again after retention pruned its snapshot.
+        """
+        try:
+            with open(self.legacy_imports_file, 'r', encoding='utf-8') as f:
+                imported = set(json.load(f))
+        except (OSError, ValueError, TypeError):
+            imported = set()
+        
+        names = [name for name in sorted(os.listdir(self.backup_dir))
+                 if name.startswith('teams_backup_') and name.endswith('.json') and name not in imported]
+        if not names:
+            return
+        snapshots = set(self.backup_store.snapshots())
+        for name in names:
+            if name[len('teams_backup_'):-len('.json')] not in snapshots:
+                self.backup_store.import_json_backup(os.path.join(self.backup_dir, name))
+            imported.add(name)
+        
+        temp_path = f"{self.legacy_imports_file}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(sorted(imported), f, indent=1)
+        os.replace(temp_path, self.legacy_imports_file)
+    
     def _cleanup_old_backups(self):
-        """Keep only the 5 most recent backups."""
+        """Keep only the most recent backup snapshots."""
         try:
-            backup_files = [f for f in os.listdir(self.backup_dir) if f.startswith('teams_backup_')]
-            backup_files.sort(reverse=True)
-            
-            for old_backup in backup_files[5:]:
-                os.remove(os.path.join(self.backup_dir, old_backup))
-                
+            self.backup_store.prune(self.backup_retention)
         except Exception:
             pass  # Non-critical operation
     
-    def _update_from_ea_sports_csv(self, csv_path: str) -> bool:
+    def restore_backup(self, snapshot_id: str, output_path: str):
+        """
+        Rebuild a backup snapshot as a JSON file (see BackupStore.restore).
+        
+        Args:
+            snapshot_id: Snapshot id from backup_store.snapshots()
+            output_path: JSON file to write
+        """
+        self.backup_store.restore(snapshot_id, output_path)
+    
+    def _update_from_ea_sports_csv(self, csv_path: str, storage: TeamStorage = None) -> bool:
         """
         Update team ratings from EA Sports FC CSV data.
         
+        Only rows that changed since the previous update are applied: new and
+        changed rows update their team's rating, and rows removed from the file
+        revert their team to the rating of the team data.
+        
         Args:
             csv_path: Path to the EA Sports FC CSV file
+            storage: Team storage to update, defaults to the global team storage
             
         Returns:
             bool: True if successful
         """
+        storage = storage or team_storage
         try:
             import csv
             
-            updates_made = 0
-            
+            state = self._load_feed_state()
             with open(csv_path, 'r', encoding='utf-8') as file:
-                reader = csv.DictReader(file)
-                
-                for row in reader:
-                    team_name = row.get('team_name', '').strip()
-                    if not team_name:
-                        continue
-                    
-                    # Find team in storage
-                    team = team_storage.get_team(team_name)
-                    if team:
-                        try:
-                            # Get current overall rating with fallback
-                            current_rating = 50.0  # Default fallback
-                            if hasattr(team, 'league_info') and team.league_info:
-                                current_rating = team.league_info.get('overall_rating', 50.0)
-                            
-                            # Get new overall rating with fallback
-                            new_overall_str = row.get('overall', '')
-                            if new_overall_str and new_overall_str.strip():
-                                new_overall = float(new_overall_str)
-                            else:
-                                new_overall = current_rating  # Keep current if no new data
-                            
-                            new_elo = self._convert_overall_to_elo(new_overall)
-                            
-                            # Update if different (and both ratings are valid)
-                            if new_overall != current_rating and abs(team.elo - new_elo) > 10:
-                                team.elo = new_elo
-                                if hasattr(team, 'league_info'):
-                                    team.league_info['overall_rating'] = new_overall
-                                updates_made += 1
-                                
-                        except (ValueError, TypeError):
-                            # Skip teams with invalid data but don't break the process
-                            continue
+                fingerprints, changed_rows, inserted, deleted = diff_rows(csv.DictReader(file),
+                                                                          state['fingerprints'])
+            if not changed_rows and not deleted:
+                return False
             
-            return updates_made > 0
+            ratings = {}
+            changes = []
+            skipped = set()  # Rows not applied: their old fingerprint is kept so they are retried
+            for team_name, row in changed_rows.items():
+                team = storage.get_team(team_name)
+                if not team:
+                    skipped.add(team_name)
+                    continue
+                try:
+                    new_overall = self._rating_update(team, row)
+                except (ValueError, TypeError):
+                    # Skip teams with invalid data but don't break the process
+                    skipped.add(team_name)
+                    continue
+                if new_overall is not None:
+                    ratings[team_name] = new_overall
+                    current_overall = None
+                    if hasattr(team, 'league_info') and team.league_info:
+                        current_overall = team.league_info.get('overall_rating')
+                    changes.append({
+                        'team': team_name,
+                        'op': 'insert' if team_name in inserted else 'update',
+                        'overall': [current_overall, new_overall],
+                    })
+            
+            reverted = [team_name for team_name in deleted if team_name in state['overrides']]
+            changes.extend({'team': team_name, 'op': 'delete', 'overall': [state['overrides'][team_name], None]}
+                           for team_name in reverted)
+            changed_teams = storage.apply_rating_updates(ratings, reverted)
+            
+            for team_name in skipped:
+                if team_name in state['fingerprints']:
+                    fingerprints[team_name] = state['fingerprints'][team_name]
+                else:
+                    del fingerprints[team_name]
+            state['fingerprints'] = fingerprints
+            state['overrides'].update(ratings)
+            for team_name in reverted:
+                del state['overrides'][team_name]
+            self._save_feed_state(state)
+            self._append_journal({
+                'timestamp': datetime.now().isoformat(),
+                'source': os.path.basename(csv_path),
+                'rows': len(fingerprints),
+                'inserted': len(inserted),
+                'updated': len(changed_rows) - len(inserted),
+                'deleted': len(deleted),
+                'changes': changes,
+            })
+            return bool(changed_teams)
             
         except Exception as e:
             print(f"Error updating from EA Sports CSV: {e}")
             return False
     
-    def _update_ratings_basic(self) -> bool:
+    def _rating_update(self, team, row: Dict[str, str]) -> Optional[float]:
+        """
+        New overall rating of a team from a CSV row, None if the change is too small.
+        
+        Raises:
+            ValueError: If the row's overall rating is not a number
+        """
+        # Get current overall rating with fallback
+        current_rating = 50.0  # Default fallback
+        if hasattr(team, 'league_info') and team.league_info:
+            current_rating = team.league_info.get('overall_rating', 50.0)
+        
+        # Get new overall rating with fallback
+        new_overall_str = row.get('overall', '')
+        if new_overall_str and new_overall_str.strip():
+            new_overall = float(new_overall_str)
+        else:
+            new_overall = current_rating  # Keep current if no new data
+        
+        new_elo = self._convert_overall_to_elo(new_overall)
+        
+        # Update if different (and both ratings are valid)
+        if new_overall != current_rating and abs(team.elo - new_elo) > 10:
+            return new_overall
+        return None
+    
+    def _load_feed_state(self) -> dict:
+        """Fingerprints and applied ratings of the last EA Sports update (empty if none)."""
+        try:
+            with open(self.feed_state_file, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+            if state.get('format') == FEED_STATE_FORMAT:
+                return state
+        except (OSError, ValueError):
+            pass
+        return {'format': FEED_STATE_FORMAT, 'fingerprints': {}, 'overrides': {}}
+    
+    def _save_feed_state(self, state: dict):
+        temp_path = f"{self.feed_state_file}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(state, f, separators=(',', ':'))
+        os.replace(temp_path, self.feed_state_file)
+    
+    def _append_journal(self, entry: dict):
+        """Append one update to the journal (one compact JSON object per line)."""
+        with open(self.journal_file, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(entry, separators=(',', ':')) + '\n')
+    
+    def restore_rating_overrides(self, storage: TeamStorage = None) -> int:
+        """
+        Re-apply the ratings of previous EA Sports updates to the team storage.
+        
+        Teams not loaded yet (lazy mode) get them when their league is loaded.
+        
+        Args:
+            storage: Team storage to update, defaults to the global team storage
+        
+        Returns:
+            int: Number of overridden teams
+        """
+        overrides = self._load_feed_state()['overrides']
+        if overrides:
+            (storage or team_storage).apply_rating_updates(overrides)
+        return len(overrides)
+    
+    def _update_ratings_basic(self, storage: TeamStorage = None) -> bool:
         """
         Basic rating update method (placeholder implementation).
         In a real implementation, this could scrape from FIFA Index or similar.
@@ -275,6 +456,7 @@ class DataUpdater:
         Returns:
             bool: True if successful
         """
+        storage = storage or team_storage
         try:
             # Placeholder: Apply small random variations to simulate rating changes
             # In a real implementation, this would fetch actual updated ratings
@@ -282,7 +464,7 @@ class DataUpdater:
             import random
             updates_made = 0
             
-            for team_name, team in team_storage.teams_by_name.items():
+            for team_name, team in storage.teams_by_name.items():
                 # Simulate rating changes for top teams only
                 if team.elo > 1600:  # Only update strong teams
                     variation = random.uniform(-20, 20)  # ±20 ELO points
@@ -341,6 +523,48 @@ class DataUpdater:
         except (ValueError, TypeError, OverflowError):
             return 1500.0
     
+    def start_background_update(self):
+        """
+        Run the weekly check and update in a background thread.
+        
+        When an update is due, a fresh team storage is built from the raw data and
+        updated off to the side, then staged on the global team storage; the game
+        installs it between matches with team_storage.swap_pending(). The storage in
+        use is never modified, so startup does not wait for the update.
+        """
+        if self._update_thread and self._update_thread.is_alive():
+            return
+        self._update_thread = threading.Thread(target=self._background_update, name='data-update', daemon=True)
+        self._update_thread.start()
+    
+    def wait_for_background_update(self, timeout: float = None) -> bool:
+        """
+        Wait for the background update to finish.
+        
+        Returns:
+            bool: True if no background update is running any more
+        """
+        if self._update_thread:
+            self._update_thread.join(timeout)
+            return not self._update_thread.is_alive()
+        return True
+    
+    def _background_update(self):
+        """Background update: build, update and stage a replacement team storage."""
+        try:
+            if not self.check_for_updates():
+                return
+            # The replacement is built only once the storage in use is complete, so
+            # the update does not compete with loading the teams the game needs
+            team_storage.wait_until_loaded()
+            replacement = team_storage.build_replacement()
+            if replacement is None:
+                return
+            if self.perform_update(show_progress=False, storage=replacement):
+                team_storage.stage_replacement(replacement)
+        except Exception as e:
+            print(f"❌ Error during background update: {e}")
+    
     def get_update_status(self) -> Dict:
         """Get current update status information."""
         try:
@@ -380,6 +604,19 @@ def check_and_update_data(show_progress: bool = True) -> bool:
     Returns:
         bool: True if update was performed, False otherwise
     """
+    # Ratings of earlier updates are kept as overrides of the team data
+    data_updater.restore_rating_overrides()
     if data_updater.check_for_updates():
         return data_updater.perform_update(show_progress)
-    return False
\ No newline at end of file
+    return False
+
+
+def start_background_update():
+    """
+    Convenience function to check for and perform data updates in the background.
+    
+    Ratings of earlier updates are restored right away; a due update is staged on
+    the team storage and installed by team_storage.swap_pending().
+    """
+    data_updater.restore_rating_overrides()
+    data_updater.start_background_update()
\ No newline at end of file
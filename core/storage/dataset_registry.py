@@ -0,0 +1,187 @@
+"""
+Dataset Registry
+
+This module loads the raw datasets of assets/raw into separate namespaces, one per
+dataset family ("male", "female"), each with its own teams, players and coaches:
+
+- Teams: a TeamStorage per namespace, with its own ELO estimator so women's teams
+  are never used as references for men's teams (the "male" namespace is the global
+  team_storage used by the game)
+- Players: a PlayerStorage per namespace (per-team files for "male", the raw
+  player dump for "female")
+- Coaches: coach records by coach id
+
+Datasets are loaded concurrently in a thread pool; the large player dumps are parsed
+in worker processes (see PlayerStorage.load_dump) and team storages come from their
+on-disk caches, so loading a second namespace adds little to startup time. Repeated
+strings (league, country, club and nationality names) are interned once for all
+namespaces.
+"""
+
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, NamedTuple, Optional
+
+from core.storage.coach_storage import CoachRecord, RAW_DIR, read_coaches
+from core.storage.elo_estimator import ELOEstimator
+from core.storage.player_storage import PlayerStorage, player_storage
+from core.storage.team_storage import TeamStorage, team_storage
+
+
+TEAMS, PLAYERS, COACHES = 'teams', 'players', 'coaches'
+KINDS = (TEAMS, PLAYERS, COACHES)
+
+# Team data version loaded into every namespace
+DEFAULT_FIFA_VERSION = 24.0
+
+
+class DatasetSpec(NamedTuple):
+    """A raw dataset file of a namespace (path None for the per-team player files)."""
+    namespace: str
+    kind: str
+    path: Optional[str]
+
+
+DEFAULT_DATASETS = (
+    DatasetSpec('male', TEAMS, os.path.join(RAW_DIR, 'male_teams.csv')),
+    DatasetSpec('male', PLAYERS, None),
+    DatasetSpec('male', COACHES, os.path.join(RAW_DIR, 'male_coaches.csv')),
+    DatasetSpec('female', TEAMS, os.path.join(RAW_DIR, 'female_teams.csv')),
+    DatasetSpec('female', PLAYERS, os.path.join(RAW_DIR, 'female_players.csv')),
+    DatasetSpec('female', COACHES, os.path.join(RAW_DIR, 'female_coaches.csv')),
+)
+
+
+@dataclass
+class DatasetNamespace:
+    """The loaded datasets of one namespace."""
+    name: str
+    teams: Optional[TeamStorage] = None
+    players: Optional[PlayerStorage] = None
+    coaches: Optional[Dict[int, CoachRecord]] = None
+
+
+def _intern_team_strings(storage: TeamStorage):
+    """Intern the string metadata of every team (teams restored from a cache are not interned)."""
+    for team in storage.teams_by_name.values():
+        info = team.league_info
+        for key in ('league_name', 'country', 'home_stadium', 'strength_source'):
+            if isinstance(info.get(key), str):
+                info[key] = sys.intern(info[key])
+
+
+class DatasetRegistry:
+    """Registry of dataset namespaces loaded concurrently."""
+
+    def __init__(self, specs: Iterable[DatasetSpec] = DEFAULT_DATASETS):
+        self.specs: List[DatasetSpec] = list(specs)
+        self.namespaces: Dict[str, DatasetNamespace] = {}
+        self.fifa_version = DEFAULT_FIFA_VERSION
+
+    def register(self, namespace: str, kind: str, path: Optional[str]):
+        """Add or replace the dataset of a kind in a namespace."""
+        if kind not in KINDS:
+            raise ValueError(f"Unknown dataset kind: {kind}")
+        self.specs = [spec for spec in self.specs if (spec.namespace, spec.kind) != (namespace, kind)]
+        self.specs.append(DatasetSpec(namespace, kind, path))
+
+    def load(self, namespaces: Iterable[str] = None, kinds: Iterable[str] = KINDS,
+             workers: int = None) -> Dict[str, Dict[str, bool]]:
+        """
+        Load datasets concurrently.
+
+        Args:
+            namespaces: Namespaces to load, all registered ones if None
+            kinds: Dataset kinds to load
+            workers: Loader threads, one per dataset if None
+
+        Returns:
+            {namespace: {kind: success}}
+        """
+        wanted = set(namespaces) if namespaces is not None else None
+        kinds = set(kinds)
+        specs = [spec for spec in self.specs
+                 if (wanted is None or spec.namespace in wanted) and spec.kind in kinds]
+        for spec in specs:
+            self.namespaces.setdefault(spec.namespace, DatasetNamespace(spec.namespace))
+
+        results: Dict[str, Dict[str, bool]] = {}
+        if not specs:
+            return results
+        with ThreadPoolExecutor(max_workers=workers or len(specs), thread_name_prefix='dataset-load') as executor:
+            futures = [(spec, executor.submit(self._load_dataset, spec)) for spec in specs]
+            for spec, future in futures:
+                try:
+                    success = future.result()
+                except Exception as e:
+                    print(f"Error loading {spec.namespace} {spec.kind}: {e}")
+                    success = False
+                results.setdefault(spec.namespace, {})[spec.kind] = success
+
+        # Share loaded coach records with the namespace's team coach index
+        for name in results:
+            namespace = self.namespaces[name]
+            if namespace.teams is not None and namespace.coaches is not None:
+                namespace.teams.set_coaches(namespace.coaches)
+        return results
+
+    def _load_dataset(self, spec: DatasetSpec) -> bool:
+        """Load one dataset into its namespace (runs in a loader thread)."""
+        namespace = self.namespaces[spec.namespace]
+        if spec.kind == TEAMS:
+            # The male namespace backs the game's global storage and estimator; squad
+            # strengths come from the male per-team player files
+            storage = team_storage if spec.namespace == 'male' else \
+                TeamStorage(ELOEstimator(), squad_strengths=False)
+            if not storage.load_from_raw_data(spec.path, self.fifa_version):
+                return False
+            _intern_team_strings(storage)
+            namespace.teams = storage
+        elif spec.kind == PLAYERS:
+            if spec.path is None:
+                # Per-team files: only the catalog now, each team on first access
+                storage = player_storage if spec.namespace == 'male' else PlayerStorage()
+                storage.team_files()
+            else:
+                storage = PlayerStorage(data_dir=None)
+                name = os.path.splitext(os.path.basename(spec.path))[0]
+                storage.load_dump(name, spec.path)
+            namespace.players = storage
+        else:
+            namespace.coaches = read_coaches(spec.path)
+        return True
+
+    def namespace(self, name: str) -> Optional[DatasetNamespace]:
+        """Loaded datasets of a namespace, None if nothing was loaded for it."""
+        return self.namespaces.get(name)
+
+    def get_statistics(self) -> dict:
+        """Get registry statistics per namespace."""
+        return {
+            name: {
+                'teams': len(namespace.teams.teams_by_name) if namespace.teams else 0,
+                'players': namespace.players.get_statistics() if namespace.players else None,
+                'coaches': len(namespace.coaches) if namespace.coaches is not None else 0,
+            }
+            for name, namespace in self.namespaces.items()
+        }
+
+
+# Global dataset registry instance
+dataset_registry = DatasetRegistry()
+
+
+def initialize_datasets(namespaces: Iterable[str] = ('male', 'female')) -> bool:
+    """
+    Load the datasets of the given namespaces concurrently.
+
+    Args:
+        namespaces: Namespaces to load; "male" also initializes the global team storage
+
+    Returns:
+        bool: True if every dataset loaded
+    """
+    results = dataset_registry.load(namespaces)
+    return all(all(kinds.values()) for kinds in results.values())
@@ -0,0 +1,123 @@
+"""
+Persistent ELO Estimate Cache
+
+This module stores the ELO estimates of teams without ratings across runs, so a
+rebuild of the team storage only estimates teams whose inputs changed.
+
+Estimates are grouped by (league, country) context. Each context records the
+reference version it was estimated against (ELOEstimator.reference_version: the
+known teams of the league and of its country); when that changes, the context's
+estimates are dropped on the next lookup. Within a context, estimates are keyed by
+a fingerprint of the team's TeamMetrics and the league context flag.
+
+Estimates can also draw on references from other countries, which do not
+invalidate a context; the whole file is invalidated when the estimator code
+changes.
+"""
+
+import hashlib
+import json
+import os
+from typing import Dict, Optional
+
+from core.storage import elo_estimator as _elo_estimator_module
+from core.storage import elo_index as _elo_index_module
+from core.storage.elo_estimator import ELOEstimator, TeamMetrics, metrics_fingerprint
+
+
+CACHE_FORMAT = 1
+
+
+def _code_digest() -> str:
+    """SHA-256 of the estimator source, so estimator changes invalidate every estimate."""
+    digest = hashlib.sha256(str(CACHE_FORMAT).encode())
+    for path in (_elo_estimator_module.__file__, _elo_index_module.__file__):
+        with open(path, 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+class ELOEstimateCache:
+    """ELO estimates persisted in a JSON file, invalidated per (league, country) context."""
+
+    def __init__(self, path: str):
+        self.path = path
+        # "league\0country" -> {'version': reference version, 'estimates': {key: elo}}
+        self._contexts: Dict[str, dict] = {}
+        self._loaded = False
+        self._dirty = False
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _context_key(metrics: TeamMetrics) -> str:
+        return f"{metrics.league_name}\0{metrics.country}"
+
+    @staticmethod
+    def _estimate_key(metrics: TeamMetrics, league_context: bool) -> str:
+        return f"{metrics_fingerprint(metrics)}:{int(league_context)}"
+
+    def load(self):
+        """Read the cache file (once); a missing, unreadable or outdated file starts empty."""
+        if self._loaded:
+            return
+        self._loaded = True
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get('format') == CACHE_FORMAT and data.get('code') == _code_digest():
+            self._contexts = data.get('contexts', {})
+
+    def get(self, estimator: ELOEstimator, metrics: TeamMetrics, league_context: bool = True) -> Optional[float]:
+        """
+        Get the cached estimate of a team.
+
+        Args:
+            estimator: Estimator holding the current reference teams
+            metrics: Metrics of the team
+            league_context: League context flag of the estimate
+
+        Returns:
+            The estimate, or None if it is not cached or its context changed
+        """
+        self.load()
+        context_key = self._context_key(metrics)
+        context = self._contexts.get(context_key)
+        if context is not None and context['version'] != estimator.reference_version(metrics.league_name,
+                                                                                     metrics.country):
+            del self._contexts[context_key]
+            self._dirty = True
+            context = None
+        elo = context['estimates'].get(self._estimate_key(metrics, league_context)) if context else None
+        if elo is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return elo
+
+    def put(self, estimator: ELOEstimator, metrics: TeamMetrics, elo: float, league_context: bool = True):
+        """Store the estimate of a team."""
+        self.load()
+        version = estimator.reference_version(metrics.league_name, metrics.country)
+        context = self._contexts.get(self._context_key(metrics))
+        if context is None or context['version'] != version:
+            context = self._contexts[self._context_key(metrics)] = {'version': version, 'estimates': {}}
+        context['estimates'][self._estimate_key(metrics, league_context)] = elo
+        self._dirty = True
+
+    def save(self):
+        """Write the cache file if anything changed."""
+        if not self._dirty:
+            return
+        data = {'format': CACHE_FORMAT, 'code': _code_digest(), 'contexts': self._contexts}
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            temp_path = f"{self.path}.tmp"
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f)
+            os.replace(temp_path, self.path)
+            self._dirty = False
+        except OSError as e:
+            print(f"Warning: Could not write ELO estimate cache: {e}")
@@ -9,11 +9,91 @@ Key Features:
 - Hierarchical fallback system
 - League-aware estimation
 - Historical data integration
+- Batch estimation: all teams of a load are scored against a NumPy matrix of the
+  known teams in blocks, with the same results as estimating them one by one
+- Indexed lookups: single estimates search a sorted overall index and KD-trees of
+  the metric space (see elo_index), kept up to date by add_known_team, instead of
+  scanning every known team; league averages come from running aggregates per
+  (league, country)
 """
 
+import hashlib
 import math
-from typing import Dict, List, Optional, Tuple, Any
-from dataclasses import dataclass
+from typing import Dict, List, Optional, Set, Tuple, Any
+from dataclasses import astuple, dataclass, field
+
+import numpy as np
+
+from core.storage.elo_index import OverallIndex, PartitionedKDIndex
+
+
+# Targets scored against the reference matrix at once in batch estimation
+BATCH_BLOCK_SIZE = 256
+
+# Errors of invalid metric values (non-numeric, zero or out of range) in a similarity method;
+# the method is skipped for the affected teams, anything else propagates
+_ESTIMATION_ERRORS = (ValueError, TypeError, ZeroDivisionError, OverflowError, FloatingPointError)
+
+# (metric, similarity scale) of the rating metrics in multi-metric similarity
+_MULTI_METRICS = (
+    ('overall', 15), ('attack', 15), ('midfield', 15), ('defence', 15),
+    ('international_prestige', 5), ('domestic_prestige', 5),
+)
+
+
+def _float_or_nan(value, positive: bool = False) -> float:
+    """
+    Numeric metric value for the batch matrices.
+    
+    NaN marks values the per-team similarity functions skip: missing, non-numeric,
+    zero (falsy), or not positive when positive is set.
+    """
+    if not value:
+        return math.nan
+    try:
+        number = float(value)
+    except (ValueError, TypeError):
+        return math.nan
+    if positive and not number > 0:
+        return math.nan
+    return number
+
+
+def _target_float_or_nan(value, positive: bool = False) -> float:
+    """
+    _float_or_nan for a batch target.
+    
+    A NaN value raises ValueError instead: the per-team methods do not skip NaN like
+    a missing value, so the batch falls back to them for the block (see estimate_elos).
+    """
+    try:
+        is_nan = math.isnan(float(value))
+    except (ValueError, TypeError):
+        is_nan = False
+    if is_nan:
+        raise ValueError("NaN metric value")
+    return _float_or_nan(value, positive)
+
+
+def _top_k(scores: np.ndarray, k: int) -> List[np.ndarray]:
+    """
+    Indices of the k best scores of every row, best first.
+    
+    Excluded entries are -inf. Ties keep the lower index first, like the stable sort
+    of the per-team methods.
+    """
+    n = scores.shape[1]
+    if n > k:
+        kth_index = np.argpartition(scores, n - k, axis=1)[:, n - k:n - k + 1]
+        kth = np.take_along_axis(scores, kth_index, axis=1)[:, 0]
+    else:
+        kth = np.full(len(scores), -np.inf)
+    selected = []
+    for row, threshold in zip(scores, kth):
+        candidates = np.flatnonzero((row >= threshold) & (row > -np.inf))
+        order = np.lexsort((candidates, -row[candidates]))
+        selected.append(candidates[order[:k]])
+    return selected
 
 
 @dataclass
@@ -33,6 +113,28 @@ class TeamMetrics:
     country: str = ""
 
 
+@dataclass
+class _ContextPartition:
+    """
+    Indexes and running aggregates of the known teams of one (league, country) context.
+    
+    The sums are adjusted in O(1) when a team is added or overwritten (old values out,
+    new values in), so they equal a sum from scratch up to float rounding.
+    """
+    overall_index: OverallIndex
+    multi_index: PartitionedKDIndex
+    orders: Set[int] = field(default_factory=set)
+    elo_sum: float = 0.0
+    overall_count: int = 0
+    overall_sum: float = 0.0
+    version: Optional[str] = None  # digest of the context's known teams, None when stale
+
+
+def metrics_fingerprint(metrics: TeamMetrics) -> str:
+    """Stable digest of every field of a team's metrics."""
+    return hashlib.sha256(repr(astuple(metrics)).encode('utf-8')).hexdigest()
+
+
 class ELOEstimator:
     """Advanced ELO estimation using similarity matching and multiple metrics."""
     
@@ -48,11 +150,142 @@ class ELOEstimator:
             'club_worth': 0.03,        # Financial indicator
             'league_level': 0.02       # Competition level
         }
+        # Known teams as NumPy arrays for batch estimation, None when stale
+        self._reference = None
+        
+        # Similarity indexes of the known teams, globally and per (league, country)
+        # context with running aggregates of each context; teams are identified by their position in known_teams ("order"),
+        # which also breaks similarity ties
+        self._order: Dict[str, int] = {}
+        self._names: List[str] = []
+        self._indexed: Dict[int, tuple] = {}  # order -> (context, overall, multi point, prestige point)
+        self._overall_index = OverallIndex()
+        self._multi_index = self._new_multi_index()
+        self._prestige_index = PartitionedKDIndex((3, 3, 2), (0.4, 0.3, 0.3))
+        self._contexts: Dict[Tuple[str, str], _ContextPartition] = {}
+        self._country_versions: Dict[str, str] = {}  # country -> reference digest (see reference_version)
         
     def add_known_team(self, team_name: str, elo: float, metrics: TeamMetrics):
         """Add a team with known ELO and metrics to the reference database."""
         if elo and 1000 <= elo <= 2000:  # Only add valid ELO scores
+            order = self._order.get(team_name)
+            if order is None:
+                order = self._order[team_name] = len(self._names)
+                self._names.append(team_name)
+            else:
+                self._unindex_team(order)
             self.known_teams[team_name] = (elo, metrics)
+            self._index_team(order, metrics)
+            self._reference = None
+    
+    def _new_multi_index(self) -> PartitionedKDIndex:
+        return PartitionedKDIndex(
+            [scale for _, scale in _MULTI_METRICS] + [2],
+            [self.metric_weights[name] for name, _ in _MULTI_METRICS] + [self.metric_weights['club_worth']])
+    
+    @staticmethod
+    def _log_worth(metrics: TeamMetrics) -> float:
+        worth = _float_or_nan(metrics.club_worth_eur, positive=True)
+        return worth if math.isnan(worth) else math.log10(worth)
+    
+    def _multi_point(self, metrics: TeamMetrics) -> Tuple[float, ...]:
+        """Position in the multi-metric space, NaN for metrics the similarity skips."""
+        return tuple(_float_or_nan(getattr(metrics, name), positive=True)
+                     for name, _ in _MULTI_METRICS) + (self._log_worth(metrics),)
+    
+    def _prestige_point(self, metrics: TeamMetrics) -> Tuple[float, ...]:
+        """Position in the prestige space, NaN for metrics the similarity skips."""
+        return (_float_or_nan(metrics.international_prestige), _float_or_nan(metrics.domestic_prestige),
+                self._log_worth(metrics))
+    
+    def _index_team(self, order: int, metrics: TeamMetrics):
+        context = (metrics.league_name, metrics.country)
+        overall = _float_or_nan(metrics.overall)
+        multi_point, prestige_point = self._multi_point(metrics), self._prestige_point(metrics)
+        self._indexed[order] = (context, overall, multi_point, prestige_point)
+        
+        partition = self._contexts.get(context)
+        if partition is None:
+            partition = self._contexts[context] = _ContextPartition(OverallIndex(), self._new_multi_index())
+        partition.version = None
+        self._country_versions.pop(metrics.country, None)
+        if not math.isnan(overall):
+            self._overall_index.add(order, overall)
+            partition.overall_index.add(order, overall)
+        self._multi_index.add(order, multi_point)
+        partition.multi_index.add(order, multi_point)
+        self._prestige_index.add(order, prestige_point)
+        
+        partition.orders.add(order)
+        partition.elo_sum += self.known_teams[self._names[order]][0]
+        if not math.isnan(overall):
+            partition.overall_count += 1
+            partition.overall_sum += overall
+    
+    def _unindex_team(self, order: int):
+        """Remove a known team from the indexes and its context sums (before it is overwritten)."""
+        context, overall, multi_point, prestige_point = self._indexed.pop(order)
+        partition = self._contexts[context]
+        partition.version = None
+        self._country_versions.pop(context[1], None)
+        if not math.isnan(overall):
+            self._overall_index.remove(order, overall)
+            partition.overall_index.remove(order, overall)
+        self._multi_index.remove(order, multi_point)
+        partition.multi_index.remove(order, multi_point)
+        self._prestige_index.remove(order, prestige_point)
+        partition.orders.discard(order)
+        # known_teams still holds the team's previous ELO
+        partition.elo_sum -= self.known_teams[self._names[order]][0]
+        if not math.isnan(overall):
+            partition.overall_count -= 1
+            partition.overall_sum -= overall
+    
+    def _context_version(self, partition: _ContextPartition) -> str:
+        if partition.version is None:
+            digest = hashlib.sha256()
+            for order in sorted(partition.orders):
+                name = self._names[order]
+                elo, metrics = self.known_teams[name]
+                digest.update(f"{name}\0{elo!r}\0{metrics_fingerprint(metrics)}\n".encode('utf-8'))
+            partition.version = digest.hexdigest()
+        return partition.version
+    
+    def reference_version(self, league_name: str, country: str) -> str:
+        """
+        Version of the known teams of a league and of its country.
+        
+        Changes whenever a known team of the same (league, country) or of another
+        league of the same country is added or replaced; persisted estimates (see
+        ELOEstimateCache) are invalidated by it.
+        
+        Args:
+            league_name: League name
+            country: League country
+            
+        Returns:
+            Hex digest
+        """
+        country_version = self._country_versions.get(country)
+        if country_version is None:
+            digest = hashlib.sha256()
+            for (league, league_country), partition in sorted(self._contexts.items()):
+                if league_country == country:
+                    digest.update(f"{league}\0{self._context_version(partition)}\n".encode('utf-8'))
+            country_version = self._country_versions[country] = digest.hexdigest()
+        partition = self._contexts.get((league_name, country))
+        context_version = self._context_version(partition) if partition else ''
+        return hashlib.sha256(f"{context_version}:{country_version}".encode('utf-8')).hexdigest()
+    
+    def _context_partition(self, target_metrics: TeamMetrics, league_context: bool = True) -> Optional[_ContextPartition]:
+        """Partition of the target's context, None without one or without context boost."""
+        if not league_context:
+            return None
+        return self._contexts.get((target_metrics.league_name, target_metrics.country))
+    
+    def _candidates(self, orders) -> List[Tuple[float, TeamMetrics]]:
+        """Known teams of the candidate orders as (elo, metrics), in known_teams order."""
+        return [self.known_teams[self._names[order]] for order in sorted(set(orders))]
     
     def estimate_elo(self, target_metrics: TeamMetrics, league_context: bool = True) -> float:
         """
@@ -87,6 +320,219 @@ class ELOEstimator:
         # Final fallback
         return self._get_fallback_elo(target_metrics)
     
+    def estimate_elos(self, targets: List[TeamMetrics], league_context: bool = True) -> List[float]:
+        """
+        Estimate the ELO of many teams at once.
+        
+        Gives the same estimates as calling estimate_elo for each target. The known
+        teams are converted to NumPy arrays once; the similarity methods score blocks
+        of targets against all of them and pick the top matches with argpartition.
+        
+        Args:
+            targets: Metrics of the teams needing ELO estimation
+            league_context: Whether to prioritize teams from same league/country
+            
+        Returns:
+            Estimated ELO of every target, in order
+        """
+        results: List[Optional[float]] = [None] * len(targets)
+        if self.known_teams:
+            reference = self._reference_arrays()
+            pending = list(range(len(targets)))
+            methods = [
+                (self._batch_overall_similarity, self._estimate_by_overall_similarity),
+                (self._batch_multi_metric_similarity, self._estimate_by_multi_metric_similarity),
+                (None, self._estimate_by_league_context),  # O(1) per team from the context aggregates
+                (self._batch_prestige_similarity, self._estimate_by_prestige_similarity),
+            ]
+            for batch_method, method in methods:
+                if not pending:
+                    break
+                estimates = {}
+                for start in range(0, len(pending), BATCH_BLOCK_SIZE):
+                    block = pending[start:start + BATCH_BLOCK_SIZE]
+                    if batch_method is not None:
+                        try:
+                            estimates.update(zip(block, batch_method(reference, [targets[i] for i in block],
+                                                                     league_context)))
+                            continue
+                        except _ESTIMATION_ERRORS:
+                            pass
+                    # Per-team path (no batch version, or invalid metric values in the block)
+                    for i in block:
+                        try:
+                            estimates[i] = method(targets[i], league_context)
+                        except _ESTIMATION_ERRORS:
+                            estimates[i] = None
+                still_pending = []
+                for i in pending:
+                    estimated_elo = estimates.get(i)
+                    if estimated_elo and 1000 <= estimated_elo <= 2000:
+                        results[i] = estimated_elo
+                    else:
+                        still_pending.append(i)
+                pending = still_pending
+        
+        return [elo if elo is not None else self._get_fallback_elo(target)
+                for elo, target in zip(results, targets)]
+    
+    def _reference_arrays(self) -> dict:
+        """Known teams as NumPy arrays (in known_teams order), rebuilt after changes."""
+        if self._reference is None:
+            entries = list(self.known_teams.values())
+            metrics = [m for _, m in entries]
+            contexts: Dict[Tuple[str, str], int] = {}
+            self._reference = {
+                'elo': [elo for elo, _ in entries],
+                'metrics': metrics,
+                'context': np.array([contexts.setdefault((m.league_name, m.country), len(contexts))
+                                     for m in metrics], dtype=np.int64),
+                'context_ids': contexts,
+                'overall': np.array([_float_or_nan(m.overall) for m in metrics]),
+                'positive': np.array([[_float_or_nan(getattr(m, name), positive=True) for name, _ in _MULTI_METRICS]
+                                      for m in metrics]).reshape(len(metrics), len(_MULTI_METRICS)),
+                'prestige': np.array([[_float_or_nan(m.international_prestige), _float_or_nan(m.domestic_prestige)]
+                                      for m in metrics]).reshape(len(metrics), 2),
+                'log_worth': np.log10([_float_or_nan(m.club_worth_eur, positive=True) for m in metrics]),
+            }
+        return self._reference
+    
+    @staticmethod
+    def _same_context(reference: dict, targets: List[TeamMetrics]) -> np.ndarray:
+        """Matrix of targets x known teams, True where league and country match."""
+        ids = np.array([reference['context_ids'].get((t.league_name, t.country), -1) for t in targets])
+        return ids[:, None] == reference['context'][None, :]
+    
+    def _weighted_top_matches(self, reference: dict, scores: np.ndarray, k: int, rescore) -> List[Optional[float]]:
+        """
+        Weighted ELO average of the top k matches of every target row.
+        
+        The top matches are taken from the batch scores, then rescored with the
+        per-team similarity (rescore(row, reference index)) and averaged in the same
+        order, so the estimates equal the per-team methods.
+        """
+        elos = reference['elo']
+        estimates = []
+        for row, selected in enumerate(_top_k(scores, k)):
+            if not len(selected):
+                estimates.append(None)
+                continue
+            top_matches = sorted(((rescore(row, int(i)), elos[i]) for i in selected), key=lambda x: x[0], reverse=True)
+            total_weight = sum(sim for sim, _ in top_matches)
+            if total_weight == 0:
+                estimates.append(None)
+                continue
+            weighted_elo = sum(sim * elo for sim, elo in top_matches) / total_weight
+            estimates.append(max(1000, min(2000, weighted_elo)))
+        return estimates
+    
+    @staticmethod
+    def _weighted_similarity_matrix(pairs) -> np.ndarray:
+        """
+        Weighted mean of exp(-|target - reference| / scale) over the metrics both sides have.
+        
+        Args:
+            pairs: (target values, reference values, scale, weight) per metric, NaN where missing
+            
+        Returns:
+            Matrix of targets x known teams, 0 where no metric is shared
+        """
+        total_similarity = None
+        total_weight = None
+        for target_values, reference_values, scale, weight in pairs:
+            similarity = np.subtract(target_values[:, None], reference_values[None, :])
+            np.abs(similarity, out=similarity)
+            similarity *= -1 / scale
+            np.exp(similarity, out=similarity)
+            missing = np.isnan(similarity)
+            similarity[missing] = 0.0
+            similarity *= weight
+            available_weight = np.where(missing, 0.0, weight)
+            if total_similarity is None:
+                total_similarity, total_weight = similarity, available_weight
+            else:
+                total_similarity += similarity
+                total_weight += available_weight
+        shared = total_weight > 0
+        np.divide(total_similarity, total_weight, out=total_similarity, where=shared)
+        total_similarity[~shared] = 0.0
+        return total_similarity
+    
+    def _batch_overall_similarity(self, reference: dict, targets: List[TeamMetrics],
+                                  league_context: bool) -> List[Optional[float]]:
+        """Batch version of _estimate_by_overall_similarity."""
+        target_overall = np.array([_target_float_or_nan(t.overall) for t in targets])
+        with np.errstate(invalid='ignore'):
+            scores = np.exp(-np.abs(target_overall[:, None] - reference['overall'][None, :]) / 10)
+        if league_context:
+            scores = np.where(self._same_context(reference, targets), scores * 1.2, scores)
+        scores[np.isnan(scores)] = -np.inf
+        
+        metrics = reference['metrics']
+        
+        def rescore(row: int, index: int) -> float:
+            target = targets[row]
+            similarity = self._calculate_overall_similarity(float(target.overall), float(metrics[index].overall))
+            if league_context and self._is_same_context(target, metrics[index]):
+                similarity *= 1.2
+            return similarity
+        
+        estimates = self._weighted_top_matches(reference, scores, 5, rescore)
+        # Targets without an overall rating are not estimated by this method
+        return [estimate if not np.isnan(overall) else None for estimate, overall in zip(estimates, target_overall)]
+    
+    def _batch_multi_metric_similarity(self, reference: dict, targets: List[TeamMetrics],
+                                       league_context: bool) -> List[Optional[float]]:
+        """Batch version of _estimate_by_multi_metric_similarity."""
+        target_values = np.array([[_target_float_or_nan(getattr(t, name), positive=True)
+                                   for name, _ in _MULTI_METRICS]
+                                  for t in targets]).reshape(len(targets), len(_MULTI_METRICS))
+        target_worth = np.log10([_target_float_or_nan(t.club_worth_eur, positive=True) for t in targets])
+        
+        # Selection scores only: the top matches are rescored exactly (see _weighted_top_matches)
+        pairs = [(target_values[:, column], reference['positive'][:, column], scale, self.metric_weights[name])
+                 for column, (name, scale) in enumerate(_MULTI_METRICS)]
+        pairs.append((target_worth, reference['log_worth'], 2, self.metric_weights['club_worth']))
+        scores = self._weighted_similarity_matrix(pairs)
+        if league_context:
+            scores = np.where(self._same_context(reference, targets), scores * 1.15, scores)
+        scores[~(scores > 0)] = -np.inf
+        
+        metrics = reference['metrics']
+        
+        def rescore(row: int, index: int) -> float:
+            target = targets[row]
+            similarity = self._calculate_multi_metric_similarity(target, metrics[index])
+            if league_context and self._is_same_context(target, metrics[index]):
+                similarity *= 1.15
+            return similarity
+        
+        return self._weighted_top_matches(reference, scores, 7, rescore)
+    
+    def _batch_prestige_similarity(self, reference: dict, targets: List[TeamMetrics],
+                                   league_context: bool) -> List[Optional[float]]:
+        """Batch version of _estimate_by_prestige_similarity."""
+        target_prestige = np.array([[_target_float_or_nan(t.international_prestige),
+                                     _target_float_or_nan(t.domestic_prestige)]
+                                    for t in targets]).reshape(len(targets), 2)
+        target_worth = np.log10([_target_float_or_nan(t.club_worth_eur, positive=True) for t in targets])
+        
+        pairs = [(target_prestige[:, 0], reference['prestige'][:, 0], 3, 0.4),
+                 (target_prestige[:, 1], reference['prestige'][:, 1], 3, 0.3),
+                 (target_worth, reference['log_worth'], 2, 0.3)]
+        scores = self._weighted_similarity_matrix(pairs)
+        scores[~(scores > 0)] = -np.inf
+        
+        metrics = reference['metrics']
+        
+        def rescore(row: int, index: int) -> float:
+            return self._calculate_prestige_similarity(targets[row], metrics[index])
+        
+        estimates = self._weighted_top_matches(reference, scores, 6, rescore)
+        # Targets without prestige or club worth are not estimated by this method
+        return [estimate if (t.international_prestige or t.domestic_prestige or t.club_worth_eur) else None
+                for estimate, t in zip(estimates, targets)]
+    
     def _estimate_by_overall_similarity(self, target_metrics: TeamMetrics, league_context: bool) -> Optional[float]:
         """Estimate ELO based on overall rating similarity."""
         if not target_metrics.overall:
@@ -95,7 +541,13 @@ class ELOEstimator:
         similar_teams = []
         target_overall = float(target_metrics.overall)
         
-        for team_name, (elo, metrics) in self.known_teams.items():
+        # Closest ratings, plus the closest same-context ones the boost may lift into the top 5
+        orders = self._overall_index.nearest(target_overall, 5)
+        partition = self._context_partition(target_metrics, league_context)
+        if partition:
+            orders += partition.overall_index.nearest(target_overall, 5)
+        
+        for elo, metrics in self._candidates(orders):
             if not metrics.overall:
                 continue
             
@@ -125,7 +577,13 @@ class ELOEstimator:
         """Estimate ELO using comprehensive multi-metric similarity."""
         similar_teams = []
         
-        for team_name, (elo, metrics) in self.known_teams.items():
+        target_point = self._multi_point(target_metrics)
+        orders = self._multi_index.best(target_point, 7)
+        partition = self._context_partition(target_metrics, league_context)
+        if partition:
+            orders += partition.multi_index.best(target_point, 7)
+        
+        for elo, metrics in self._candidates(orders):
             similarity_score = self._calculate_multi_metric_similarity(target_metrics, metrics)
             
             if similarity_score > 0:
@@ -154,24 +612,18 @@ class ELOEstimator:
         if not league_context or not target_metrics.league_name:
             return None
         
-        # Find teams from same league
-        league_teams = []
-        for team_name, (elo, metrics) in self.known_teams.items():
-            if (metrics.league_name == target_metrics.league_name and 
-                metrics.country == target_metrics.country):
-                league_teams.append((elo, metrics))
-        
-        if len(league_teams) < 3:  # Need enough sample size
+        # Running aggregates of the teams from same league
+        partition = self._context_partition(target_metrics)
+        if partition is None or len(partition.orders) < 3:  # Need enough sample size
             return None
         
         # Calculate league average
-        league_avg_elo = sum(elo for elo, _ in league_teams) / len(league_teams)
+        league_avg_elo = partition.elo_sum / len(partition.orders)
         
         # Adjust based on target team's relative strength within league
         if target_metrics.overall:
-            league_overall_values = [float(m.overall) for _, m in league_teams if m.overall]
-            if league_overall_values:
-                league_avg_overall = sum(league_overall_values) / len(league_overall_values)
+            if partition.overall_count:
+                league_avg_overall = partition.overall_sum / partition.overall_count
                 relative_strength = float(target_metrics.overall) / league_avg_overall
                 
                 # Adjust ELO based on relative strength
@@ -191,7 +643,7 @@ class ELOEstimator:
         
         similar_teams = []
         
-        for team_name, (elo, metrics) in self.known_teams.items():
+        for elo, metrics in self._candidates(self._prestige_index.best(self._prestige_point(target_metrics), 6)):
             similarity = self._calculate_prestige_similarity(target_metrics, metrics)
             
             if similarity > 0:
@@ -417,11 +869,8 @@ class ELOEstimator:
         ])
         
         # Check if same league teams exist
-        same_league_count = sum(
-            1 for _, (_, metrics) in self.known_teams.items()
-            if (metrics.league_name == target_metrics.league_name and 
-                metrics.country == target_metrics.country)
-        )
+        partition = self._context_partition(target_metrics)
+        same_league_count = len(partition.orders) if partition else 0
         
         if available_metrics >= 4 and same_league_count >= 3:
             return "high"
@@ -429,6 +878,30 @@ class ELOEstimator:
             return "medium"
         else:
             return "low"
+    
+    def get_league_summary(self, league_name: str, country: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the aggregates of the known teams of a league.
+        
+        Args:
+            league_name: League name
+            country: League country
+            
+        Returns:
+            Dictionary with team_count, average_elo, average_overall, min_overall and
+            max_overall (overall values None without ratings), or None without known teams
+        """
+        partition = self._contexts.get((league_name, country))
+        if not partition or not partition.orders:
+            return None
+        overall_range = partition.overall_index.range()
+        return {
+            'team_count': len(partition.orders),
+            'average_elo': partition.elo_sum / len(partition.orders),
+            'average_overall': partition.overall_sum / partition.overall_count if partition.overall_count else None,
+            'min_overall': overall_range[0] if overall_range else None,
+            'max_overall': overall_range[1] if overall_range else None,
+        }
 
 
 # Global ELO estimator instance
@@ -0,0 +1,302 @@
+"""
+Similarity Indexes for ELO Estimation
+
+This module provides the incremental indexes ELOEstimator uses to find the most
+similar known teams without scanning all of them:
+
+- OverallIndex: known teams sorted by overall rating; the closest ratings are
+  found by bisection.
+- PartitionedKDIndex: KD-trees over the weighted metric space, one per metric
+  availability mask (teams missing a metric are compared on the others only, so
+  teams with the same available metrics share a tree). The best matches are found
+  by best-first branch-and-bound on an upper bound of the similarity in each box.
+
+Both return candidate sets: every team that can be among the top k, plus teams
+tied with the k-th. The estimator rescores the candidates with its exact
+similarity functions, so results equal a full scan.
+
+Context boost: a same-context team can outrank closer teams from elsewhere. The
+estimator keeps a second set of indexes per (league, country) context and merges
+the top k of the target's context with the global top k: any team from another
+context in the boosted top k is also in the global top k, and any same-context
+one in the context top k, because the boost only raises scores.
+"""
+
+import heapq
+import math
+from bisect import bisect_left, insort
+from itertools import count
+from typing import Dict, List, Optional, Sequence, Tuple
+
+
+# Slack on similarity comparisons, covering rounding differences between bounds and scores
+SCORE_EPSILON = 1e-9
+
+# Points per KD-tree leaf before it splits
+LEAF_SIZE = 16
+
+
+class OverallIndex:
+    """Known teams sorted by overall rating."""
+
+    def __init__(self):
+        # (overall, order) pairs; order is the team's position in the reference database
+        self._sorted: List[Tuple[float, int]] = []
+
+    def __len__(self) -> int:
+        return len(self._sorted)
+
+    def add(self, order: int, overall: float):
+        insort(self._sorted, (overall, order))
+
+    def remove(self, order: int, overall: float):
+        index = bisect_left(self._sorted, (overall, order))
+        if index < len(self._sorted) and self._sorted[index] == (overall, order):
+            del self._sorted[index]
+
+    def range(self) -> Optional[Tuple[float, float]]:
+        """(lowest, highest) overall rating, None when empty."""
+        if not self._sorted:
+            return None
+        return self._sorted[0][0], self._sorted[-1][0]
+
+    def nearest(self, overall: float, k: int) -> List[int]:
+        """
+        The k teams with the closest overall rating, plus teams tied with the k-th.
+
+        Ties break by order, so at most the k lowest orders of each rating are returned.
+
+        Args:
+            overall: Target overall rating
+            k: Number of teams
+
+        Returns:
+            Orders of the candidate teams
+        """
+        values = self._sorted
+        left = right = bisect_left(values, (overall, -1))
+        selected: List[int] = []
+        kth_distance = None
+        while left > 0 or right < len(values):
+            left_distance = overall - values[left - 1][0] if left > 0 else math.inf
+            right_distance = values[right][0] - overall if right < len(values) else math.inf
+            distance = min(left_distance, right_distance)
+            if kth_distance is not None and distance > kth_distance + SCORE_EPSILON:
+                break
+            # Take the next group of equal ratings on the closer side
+            if left_distance <= right_distance:
+                start = bisect_left(values, (values[left - 1][0], -1), 0, left)
+                selected.extend(order for _, order in values[start:min(left, start + k)])
+                left = start
+            else:
+                end = bisect_left(values, (values[right][0], math.inf), right)
+                selected.extend(order for _, order in values[right:min(end, right + k)])
+                right = end
+            # Each team is taken once, so this counts k distinct teams
+            if kth_distance is None and len(selected) >= k:
+                kth_distance = distance
+        return selected
+
+
+class _Node:
+    __slots__ = ('lo', 'hi', 'entries', 'axis', 'split', 'left', 'right')
+
+    def __init__(self, dims: int):
+        self.lo = [math.inf] * dims
+        self.hi = [-math.inf] * dims
+        # Leaf entries: [point, sorted orders of the teams at that point]; None for inner nodes
+        self.entries: Optional[List[list]] = []
+        self.axis = -1
+        self.split = 0.0
+        self.left: Optional['_Node'] = None
+        self.right: Optional['_Node'] = None
+
+    def extend(self, point: Sequence[float], axes: Sequence[int]):
+        lo, hi = self.lo, self.hi
+        for axis in axes:
+            value = point[axis]
+            if value < lo[axis]:
+                lo[axis] = value
+            if value > hi[axis]:
+                hi[axis] = value
+
+
+class MetricKDTree:
+    """
+    Bucket KD-tree over points sharing the same available axes.
+
+    Points are inserted and removed one at a time; leaves split at the median of
+    their widest axis. Teams at the same point share a leaf entry. Bounding boxes
+    only grow on removal, which keeps them valid.
+    """
+
+    def __init__(self, dims: int, axes: Sequence[int]):
+        self.dims = dims
+        self.axes = tuple(axes)
+        self.root = _Node(dims)
+        self.size = 0
+
+    def _leaf(self, point: Sequence[float], extend: bool = False) -> _Node:
+        node = self.root
+        while True:
+            if extend:
+                node.extend(point, self.axes)
+            if node.entries is not None:
+                return node
+            node = node.left if point[node.axis] < node.split else node.right
+
+    def _entry(self, leaf: _Node, point: Sequence[float]) -> Optional[list]:
+        for entry in leaf.entries:
+            if all(entry[0][axis] == point[axis] for axis in self.axes):
+                return entry
+        return None
+
+    def insert(self, order: int, point: Tuple[float, ...]):
+        leaf = self._leaf(point, extend=True)
+        self.size += 1
+        entry = self._entry(leaf, point)
+        if entry is not None:
+            insort(entry[1], order)
+            return
+        leaf.entries.append([point, [order]])
+        if len(leaf.entries) > LEAF_SIZE:
+            self._split(leaf)
+
+    def _split(self, node: _Node):
+        axis = max(self.axes, key=lambda a: node.hi[a] - node.lo[a])
+        values = sorted(point[axis] for point, _ in node.entries)
+        split = values[len(values) // 2]
+        if split == values[0]:
+            # Skip past the duplicates of the minimum so the left side is not empty
+            split = next((value for value in values if value > values[0]), None)
+            if split is None:
+                return  # All points equal on the widest axis: keep the leaf
+        node.axis, node.split = axis, split
+        node.left, node.right = _Node(self.dims), _Node(self.dims)
+        for entry in node.entries:
+            child = node.left if entry[0][axis] < split else node.right
+            child.extend(entry[0], self.axes)
+            child.entries.append(entry)
+        node.entries = None
+
+    def remove(self, order: int, point: Tuple[float, ...]) -> bool:
+        leaf = self._leaf(point)
+        entry = self._entry(leaf, point)
+        if entry is None:
+            return False
+        orders = entry[1]
+        index = bisect_left(orders, order)
+        if index == len(orders) or orders[index] != order:
+            return False
+        del orders[index]
+        if not orders:
+            leaf.entries.remove(entry)
+        self.size -= 1
+        return True
+
+    def best(self, target: Sequence[float], terms: Sequence[Tuple[int, float, float]], k: int) -> List[int]:
+        """
+        Points with the k highest similarities, plus points tied with the k-th.
+
+        Similarity is sum(weight * exp(-|target - point| / scale)) / sum(weight) over terms.
+        Ties break by order, so at most the k lowest orders of each point are returned.
+
+        Args:
+            target: Target point (all axes)
+            terms: (axis, scale, weight) of the axes compared
+            k: Number of points
+
+        Returns:
+            Orders of the candidate points
+        """
+        total_weight = sum(weight for _, _, weight in terms)
+        if not self.size or total_weight <= 0:
+            return []
+        exp = math.exp
+
+        def bound(node: _Node) -> float:
+            total = 0.0
+            for axis, scale, weight in terms:
+                value = target[axis]
+                distance = max(node.lo[axis] - value, value - node.hi[axis], 0.0)
+                total += weight * exp(-distance / scale)
+            return total / total_weight
+
+        top_scores: List[float] = []  # min-heap of the k best scores
+        found: List[Tuple[float, List[int]]] = []
+        threshold = -math.inf
+        tie = count()
+        frontier = [(-bound(self.root), next(tie), self.root)]
+        while frontier:
+            negative_bound, _, node = heapq.heappop(frontier)
+            if -negative_bound < threshold - SCORE_EPSILON:
+                break
+            if node.entries is None:
+                for child in (node.left, node.right):
+                    child_bound = bound(child)
+                    if child_bound >= threshold - SCORE_EPSILON:
+                        heapq.heappush(frontier, (-child_bound, next(tie), child))
+                continue
+            for point, orders in node.entries:
+                score = 0.0
+                for axis, scale, weight in terms:
+                    score += weight * exp(-abs(target[axis] - point[axis]) / scale)
+                score /= total_weight
+                if score < threshold - SCORE_EPSILON:
+                    continue
+                orders = orders[:k]
+                found.append((score, orders))
+                for _ in orders:
+                    if len(top_scores) < k:
+                        heapq.heappush(top_scores, score)
+                    elif score > top_scores[0]:
+                        heapq.heapreplace(top_scores, score)
+                    else:
+                        break
+                if len(top_scores) == k:
+                    threshold = top_scores[0]
+        return [order for score, orders in found if score >= threshold - SCORE_EPSILON for order in orders]
+
+
+class PartitionedKDIndex:
+    """
+    KD-trees over a metric space, one per availability mask of the metrics.
+
+    Metric values are floats, NaN where the metric is missing. A target is compared
+    with each tree on the metrics both have.
+    """
+
+    def __init__(self, scales: Sequence[float], weights: Sequence[float]):
+        self.scales = tuple(scales)
+        self.weights = tuple(weights)
+        self.dims = len(self.scales)
+        self._trees: Dict[int, MetricKDTree] = {}
+
+    def _mask(self, point: Sequence[float]) -> int:
+        return sum(1 << axis for axis, value in enumerate(point) if not math.isnan(value))
+
+    def add(self, order: int, point: Tuple[float, ...]):
+        mask = self._mask(point)
+        if not mask:
+            return  # Shares no metric with any target
+        tree = self._trees.get(mask)
+        if tree is None:
+            tree = self._trees[mask] = MetricKDTree(self.dims, [a for a in range(self.dims) if mask >> a & 1])
+        tree.insert(order, point)
+
+    def remove(self, order: int, point: Tuple[float, ...]):
+        tree = self._trees.get(self._mask(point))
+        if tree is not None:
+            tree.remove(order, point)
+
+    def best(self, target: Sequence[float], k: int) -> List[int]:
+        """Candidates for the k most similar points over all trees (see MetricKDTree.best)."""
+        target_mask = self._mask(target)
+        candidates: List[int] = []
+        for mask, tree in self._trees.items():
+            shared = target_mask & mask
+            if not shared:
+                continue
+            terms = [(axis, self.scales[axis], self.weights[axis]) for axis in range(self.dims) if shared >> axis & 1]
+            candidates.extend(tree.best(target, terms, k))
+        return candidates
@@ -0,0 +1,202 @@
+"""
+League Byte-Offset Index
+
+This module provides a sidecar index of the raw team CSV, so a single league can
+be read without parsing the whole file. For one FIFA version the index holds:
+
+- The CSV header
+- Per (league, country): the byte ranges of its rows (consecutive rows are merged
+  into one range) and its catalog entry: team count, league level, average rating
+  and the number of teams whose ELO must be estimated
+
+The index is built with one pass over the CSV and saved next to the team storage
+cache (assets/cache) as JSON, keyed by the CSV content hash. A stale index is
+rebuilt automatically.
+"""
+
+import csv
+import hashlib
+import io
+import json
+import os
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from core.storage.team_storage import DEFAULT_CACHE_DIR, TeamRecord, team_record_parser
+
+
+INDEX_FORMAT = 1
+
+
+def _csv_digest(csv_path: str) -> str:
+    """SHA-256 of the CSV content."""
+    digest = hashlib.sha256()
+    with open(csv_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _iter_csv_records(file) -> Iterator[Tuple[int, bytes]]:
+    """
+    Yield (byte offset, raw bytes) of every CSV record of a binary file.
+
+    Records spanning several lines (quoted fields with line breaks) are kept whole.
+    """
+    offset = file.tell()
+    pending = b''
+    start = offset
+    for line in file:
+        if not pending:
+            start = offset
+        pending += line
+        offset += len(line)
+        # An odd number of quotes means a quoted field continues on the next line
+        if pending.count(b'"') % 2 == 0:
+            yield start, pending
+            pending = b''
+    if pending:
+        yield start, pending
+
+
+class LeagueIndex:
+    """Byte ranges and catalog data per (league, country) for one FIFA version."""
+
+    def __init__(self, csv_path: str, fifa_version: float):
+        self.csv_path = csv_path
+        self.fifa_version = fifa_version
+        self.header: List[str] = []
+        # (league_name, country) -> {'ranges': [[offset, length], ...], 'team_count': int,
+        #                            'league_level': int, 'avg_rating': float, 'estimated_count': int}
+        self.leagues: Dict[Tuple[str, str], dict] = {}
+
+    @classmethod
+    def load_or_build(cls, csv_path: str, fifa_version: float = 24.0,
+                      index_path: str = None) -> 'LeagueIndex':
+        """
+        Load the sidecar index, rebuilding it when missing or stale.
+
+        Args:
+            csv_path: Raw team CSV
+            fifa_version: FIFA version to index
+            index_path: Sidecar file, defaults to assets/cache/<csv name>_fifa<version>.index.json
+
+        Returns:
+            LeagueIndex for the current CSV content
+        """
+        if index_path is None:
+            name = os.path.splitext(os.path.basename(csv_path))[0]
+            index_path = os.path.join(DEFAULT_CACHE_DIR, f"{name}_fifa{fifa_version:g}.index.json")
+
+        index = cls(csv_path, fifa_version)
+        source_digest = _csv_digest(csv_path)
+        if not index._load(index_path, source_digest):
+            index.build()
+            index._save(index_path, source_digest)
+        return index
+
+    def build(self):
+        """Index the CSV with a single pass."""
+        self.leagues.clear()
+        totals: Dict[Tuple[str, str], float] = {}
+        with open(self.csv_path, 'rb') as file:
+            records = _iter_csv_records(file)
+            first = next(records, None)
+            if first is None:
+                return
+            self.header = next(csv.reader([first[1].decode('utf-8')]))
+            parse = team_record_parser(self.header, self.fifa_version)
+
+            for offset, raw in records:
+                row = next(csv.reader([raw.decode('utf-8')]), None)
+                record = parse(row) if row else None
+                if record is None:
+                    continue
+                key = (record.league_name, record.country)
+                entry = self.leagues.get(key)
+                if entry is None:
+                    entry = self.leagues[key] = {
+                        'ranges': [],
+                        'team_count': 0,
+                        'league_level': record.league_level,
+                        'avg_rating': 0,
+                        'estimated_count': 0,
+                    }
+                    totals[key] = 0.0
+
+                ranges = entry['ranges']
+                if ranges and ranges[-1][0] + ranges[-1][1] == offset:
+                    ranges[-1][1] += len(raw)
+                else:
+                    ranges.append([offset, len(raw)])
+
+                if record.valid:
+                    entry['team_count'] += 1
+                    overall = record.overall if record.overall is not None else 50.0
+                    totals[key] += overall
+                    if record.overall is None or not 30 <= record.overall <= 100:
+                        entry['estimated_count'] += 1
+
+        for key, entry in self.leagues.items():
+            if entry['team_count']:
+                entry['avg_rating'] = round(totals[key] / entry['team_count'], 1)
+
+    def _save(self, index_path: str, source_digest: str):
+        data = {
+            'format': INDEX_FORMAT,
+            'source_sha256': source_digest,
+            'fifa_version': self.fifa_version,
+            'header': self.header,
+            'leagues': [[league, country, entry] for (league, country), entry in self.leagues.items()],
+        }
+        try:
+            os.makedirs(os.path.dirname(index_path), exist_ok=True)
+            temp_path = f"{index_path}.tmp"
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f)
+            os.replace(temp_path, index_path)
+        except OSError as e:
+            print(f"Warning: Could not write league index: {e}")
+
+    def _load(self, index_path: str, source_digest: str) -> bool:
+        try:
+            with open(index_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return False
+        if data.get('format') != INDEX_FORMAT or data.get('source_sha256') != source_digest \
+                or data.get('fifa_version') != self.fifa_version:
+            return False
+        self.header = data['header']
+        self.leagues = {(league, country): entry for league, country, entry in data['leagues']}
+        return True
+
+    def entry(self, league_name: str, country: str) -> Optional[dict]:
+        """Catalog entry of a league, None if not indexed."""
+        return self.leagues.get((league_name, country))
+
+    def read_records(self, league_name: str, country: str) -> List[TeamRecord]:
+        """
+        Read and parse only the rows of one league, in file order.
+
+        Args:
+            league_name: League name
+            country: League country
+
+        Returns:
+            Team records of the league (valid and reference-only rows)
+        """
+        entry = self.entry(league_name, country)
+        if entry is None:
+            return []
+        parse = team_record_parser(self.header, self.fifa_version)
+        records = []
+        with open(self.csv_path, 'rb') as file:
+            for offset, length in entry['ranges']:
+                file.seek(offset)
+                text = file.read(length).decode('utf-8')
+                # newline='' leaves line breaks inside quoted fields to the csv module
+                for row in csv.reader(io.StringIO(text, newline='')):
+                    record = parse(row)
+                    if record is not None and (record.league_name, record.country) == (league_name, country):
+                        records.append(record)
+        return records
@@ -0,0 +1,456 @@
+"""
+Player Storage
+
+This module provides player-level data for the game, backed by compact columnar
+arrays instead of per-player dictionaries.
+
+Sources:
+- Per-team CSVs in assets/data/<Country>/<League>/<Team>.csv, loaded lazily, one
+  team at a time, on first access. A catalog of the team files is built with a
+  single directory scan.
+- Raw player dumps (e.g. assets/raw/female_players.csv), parsed in byte chunks
+  split at record boundaries and spread over worker processes.
+
+Every loaded set of players is a PlayerTable: NumPy arrays for ratings and ids,
+a position bitmask per player and plain lists for names. Tables build their
+indexes (by club, by position, sorted by overall) on first use.
+"""
+
+import csv
+import hashlib
+import io
+import os
+import pickle
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from core.simulation.goals_calibration import canonical_league_key
+from core.storage.team_storage import DEFAULT_CACHE_DIR
+
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), '..', '..', 'assets', 'data')
+RAW_DIR = os.path.join(os.path.dirname(__file__), '..', '..', 'assets', 'raw')
+
+# Integer identifiers
+ID_COLUMNS = ('player_id', 'club_team_id', 'league_id', 'nationality_id')
+# Ratings and attributes (float32, NaN when missing, e.g. outfield stats of goalkeepers)
+RATING_COLUMNS = (
+    'overall', 'potential', 'age', 'height_cm', 'weight_kg', 'value_eur', 'wage_eur',
+    'fifa_version', 'league_level',
+    'pace', 'shooting', 'passing', 'dribbling', 'defending', 'physic',
+    'goalkeeping_diving', 'goalkeeping_handling', 'goalkeeping_kicking',
+    'goalkeeping_positioning', 'goalkeeping_reflexes',
+)
+TEXT_COLUMNS = ('short_name', 'club_name', 'club_position', 'nationality_name')
+
+# Playing positions, bit i of a player's position mask is POSITIONS[i]
+POSITIONS = ('GK', 'RB', 'LB', 'CB', 'RWB', 'LWB', 'CDM', 'CM', 'CAM', 'RM', 'LM', 'RW', 'LW', 'CF', 'ST')
+POSITION_BITS = {position: 1 << bit for bit, position in enumerate(POSITIONS)}
+POSITION_INDEX = {position: index for index, position in enumerate(POSITIONS)}
+
+# Per-league team summary next to the per-team player CSVs
+LEAGUE_TEAMS_FILE = 'all_teams.csv'
+
+# Target bytes per chunk when parsing raw dumps in parallel
+DEFAULT_CHUNK_BYTES = 512 * 1024
+
+# Bump when the cached PlayerTable layout changes
+CACHE_VERSION = 1
+
+
+def _position_mask(positions: str) -> int:
+    mask = 0
+    for position in positions.split(','):
+        mask |= POSITION_BITS.get(position.strip(), 0)
+    return mask
+
+
+def _float_column(values: List[str]) -> np.ndarray:
+    """Convert a text column to float32, NaN for empty or invalid values."""
+    try:
+        # NumPy parses the strings in one call; empty cells become NaN
+        return np.array([value or 'nan' for value in values], dtype=np.float64).astype(np.float32)
+    except ValueError:
+        converted = []
+        for value in values:
+            try:
+                converted.append(float(value) if value else np.nan)
+            except ValueError:
+                converted.append(np.nan)
+        return np.asarray(converted, dtype=np.float32)
+
+
+class PlayerTable:
+    """Columnar player rows."""
+
+    def __init__(self, ids: Dict[str, np.ndarray], ratings: Dict[str, np.ndarray],
+                 text: Dict[str, List[str]], position_mask: np.ndarray, primary_position: np.ndarray):
+        self.ids = ids
+        self.ratings = ratings
+        self.text = text
+        self.position_mask = position_mask
+        # Index into POSITIONS of the first listed position, -1 if unknown
+        self.primary_position = primary_position
+        self._club_index: Optional[Dict[int, np.ndarray]] = None
+        self._position_index: Optional[Dict[str, np.ndarray]] = None
+        self._overall_order: Optional[np.ndarray] = None
+        self._sorted_overall: Optional[np.ndarray] = None
+
+    @classmethod
+    def from_rows(cls, header: Sequence[str], rows: Iterable[Sequence[str]]) -> 'PlayerTable':
+        """
+        Build a table from CSV rows.
+
+        Args:
+            header: CSV header
+            rows: CSV rows (lists of strings)
+
+        Returns:
+            PlayerTable with one row per CSV row
+        """
+        col = {name: index for index, name in enumerate(header)}
+        width = len(header)
+        # Short rows are padded so every column can be read by index
+        rows = [row if len(row) >= width else list(row) + [''] * (width - len(row)) for row in rows if row]
+
+        def column(name: str) -> List[str]:
+            index = col.get(name)
+            return [row[index] for row in rows] if index is not None else [''] * len(rows)
+
+        ratings = {name: _float_column(column(name)) for name in RATING_COLUMNS}
+        ids = {}
+        for name in ID_COLUMNS:
+            values = _float_column(column(name)).astype(np.float64)
+            ids[name] = np.where(np.isnan(values), -1, values).astype(np.int64)
+        text = {name: [sys.intern(value) for value in column(name)] for name in TEXT_COLUMNS}
+
+        positions = column('player_positions')
+        return cls(
+            ids,
+            ratings,
+            text,
+            np.asarray([_position_mask(value) for value in positions], dtype=np.uint32),
+            np.asarray([POSITION_INDEX.get(value.split(',')[0].strip(), -1) for value in positions], dtype=np.int8),
+        )
+
+    @classmethod
+    def concat(cls, tables: Sequence['PlayerTable']) -> 'PlayerTable':
+        """Concatenate tables (rows in the given order)."""
+        if not tables:
+            return cls.from_rows([], [])
+        return cls(
+            {name: np.concatenate([t.ids[name] for t in tables]) for name in ID_COLUMNS},
+            {name: np.concatenate([t.ratings[name] for t in tables]) for name in RATING_COLUMNS},
+            {name: [value for t in tables for value in t.text[name]] for name in TEXT_COLUMNS},
+            np.concatenate([t.position_mask for t in tables]),
+            np.concatenate([t.primary_position for t in tables]),
+        )
+
+    def __len__(self) -> int:
+        return len(self.position_mask)
+
+    def __getitem__(self, column: str):
+        if column in self.ratings:
+            return self.ratings[column]
+        if column in self.ids:
+            return self.ids[column]
+        return self.text[column]
+
+    def intern_strings(self):
+        """Intern the text columns (tables parsed in worker processes arrive uninterned)."""
+        for name, values in self.text.items():
+            self.text[name] = [sys.intern(value) for value in values]
+
+    def take(self, rows: np.ndarray) -> 'PlayerTable':
+        """Sub-table with the given rows."""
+        return PlayerTable(
+            {name: values[rows] for name, values in self.ids.items()},
+            {name: values[rows] for name, values in self.ratings.items()},
+            {name: [values[row] for row in rows] for name, values in self.text.items()},
+            self.position_mask[rows],
+            self.primary_position[rows],
+        )
+
+    def row(self, index: int) -> dict:
+        """One player as a dictionary."""
+        player = {name: int(values[index]) for name, values in self.ids.items()}
+        player.update({name: float(values[index]) for name, values in self.ratings.items()})
+        player.update({name: values[index] for name, values in self.text.items()})
+        player['positions'] = [p for p in POSITIONS if self.position_mask[index] & POSITION_BITS[p]]
+        primary = int(self.primary_position[index])
+        player['primary_position'] = POSITIONS[primary] if primary >= 0 else None
+        return player
+
+    def rows_for_club(self, club_team_id: int) -> np.ndarray:
+        """Rows of a club's players (index by club_team_id, built on first use)."""
+        if self._club_index is None:
+            clubs = self.ids['club_team_id']
+            order = np.argsort(clubs, kind='stable')
+            keys, starts = np.unique(clubs[order], return_index=True)
+            bounds = list(starts) + [len(order)]
+            self._club_index = {int(key): order[bounds[i]:bounds[i + 1]] for i, key in enumerate(keys)}
+        return self._club_index.get(int(club_team_id), np.empty(0, dtype=np.int64))
+
+    def rows_for_position(self, position: str) -> np.ndarray:
+        """Rows of players who can play a position (index built on first use)."""
+        if self._position_index is None:
+            self._position_index = {p: np.flatnonzero(self.position_mask & bit)
+                                    for p, bit in POSITION_BITS.items()}
+        return self._position_index.get(position, np.empty(0, dtype=np.int64))
+
+    def rows_in_overall_range(self, min_overall: float, max_overall: float) -> np.ndarray:
+        """Rows with overall in [min_overall, max_overall], best first (sorted index on first use)."""
+        if self._overall_order is None:
+            overall = self.ratings['overall']
+            # NaN sorts last; ascending order for searchsorted
+            self._overall_order = np.argsort(overall, kind='stable')
+            self._sorted_overall = overall[self._overall_order]
+        start = np.searchsorted(self._sorted_overall, min_overall, side='left')
+        end = np.searchsorted(self._sorted_overall, max_overall, side='right')
+        return self._overall_order[start:end][::-1]
+
+
+@dataclass(frozen=True)
+class TeamFile:
+    """A per-team player CSV in assets/data."""
+    team_name: str
+    country: str
+    league: str
+    path: str
+
+
+def _read_table(path: str) -> PlayerTable:
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is None:
+            return PlayerTable.from_rows([], [])
+        return PlayerTable.from_rows(header, reader)
+
+
+def _parse_chunk(csv_path: str, header: List[str], start: int, end: int) -> PlayerTable:
+    """Parse the byte range [start, end) of a CSV (worker process entry point)."""
+    with open(csv_path, 'rb') as f:
+        f.seek(start)
+        text = f.read(end - start).decode('utf-8')
+    # newline='' leaves line breaks inside quoted fields to the csv module
+    return PlayerTable.from_rows(header, csv.reader(io.StringIO(text, newline='')))
+
+
+def _chunk_ranges(csv_path: str, chunk_bytes: int) -> Tuple[List[str], List[Tuple[int, int]]]:
+    """
+    Split a CSV into byte ranges at record boundaries.
+
+    Returns:
+        (header, [(start, end), ...])
+    """
+    from core.storage.league_index import _iter_csv_records
+
+    ranges = []
+    with open(csv_path, 'rb') as f:
+        records = _iter_csv_records(f)
+        first = next(records, None)
+        if first is None:
+            return [], []
+        header = next(csv.reader([first[1].decode('utf-8')]))
+        start = end = first[0] + len(first[1])
+        for offset, raw in records:
+            end = offset + len(raw)
+            if end - start >= chunk_bytes:
+                ranges.append((start, end))
+                start = end
+        if end > start:
+            ranges.append((start, end))
+    return header, ranges
+
+
+class PlayerStorage:
+    """
+    Player data store with lazy per-team loading and parallel dump parsing.
+
+    team_tables: {canonical team key: PlayerTable} - Loaded per-team CSVs
+    dumps: {dump name: PlayerTable} - Loaded raw player dumps
+    """
+
+    def __init__(self, data_dir: Optional[str] = DATA_DIR):
+        """
+        Create a storage.
+
+        Args:
+            data_dir: Root of the per-team player CSVs, None for a storage of dumps only
+        """
+        self.data_dir = data_dir
+        self.team_tables: Dict[str, PlayerTable] = {}
+        self.dumps: Dict[str, PlayerTable] = {}
+        self._team_files: Optional[Dict[str, TeamFile]] = None
+
+    @staticmethod
+    def team_key(team_name: str) -> str:
+        """Canonical team key, e.g. "Brighton & Hove Albion" and "Brighton_&_Hove_Albion" match."""
+        return canonical_league_key(team_name)
+
+    def team_files(self) -> Dict[str, TeamFile]:
+        """Catalog of the per-team CSVs by canonical team key (one directory scan)."""
+        if self._team_files is None:
+            catalog = {}
+            if self.data_dir is None:
+                self._team_files = catalog
+                return catalog
+            try:
+                for country in sorted(os.listdir(self.data_dir)):
+                    country_path = os.path.join(self.data_dir, country)
+                    if not os.path.isdir(country_path) or country in ['backups']:
+                        continue
+                    for league in sorted(os.listdir(country_path)):
+                        league_path = os.path.join(country_path, league)
+                        if not os.path.isdir(league_path):
+                            continue
+                        for file_name in os.listdir(league_path):
+                            stem, extension = os.path.splitext(file_name)
+                            # all_teams.csv holds the league's team rows, not players
+                            if extension != '.csv' or file_name == LEAGUE_TEAMS_FILE:
+                                continue
+                            catalog[self.team_key(stem)] = TeamFile(
+                                team_name=stem.replace('_', ' '),
+                                country=country.replace('_', ' '),
+                                league=league.replace('_', ' '),
+                                path=os.path.join(league_path, file_name),
+                            )
+            except OSError:
+                pass
+            self._team_files = catalog
+        return self._team_files
+
+    def find_team_file(self, team_name: str) -> Optional[TeamFile]:
+        """Locate a team's player CSV by team name (any spacing, case or accents)."""
+        return self.team_files().get(self.team_key(team_name))
+
+    def get_team_players(self, team_name: str) -> Optional[PlayerTable]:
+        """
+        Get a team's players, loading its CSV on first access.
+
+        Args:
+            team_name: Team name
+
+        Returns:
+            PlayerTable of the team, or None if there is no player file for it
+        """
+        key = self.team_key(team_name)
+        table = self.team_tables.get(key)
+        if table is None:
+            team_file = self.team_files().get(key)
+            if team_file is None:
+                return None
+            try:
+                table = _read_table(team_file.path)
+            except (OSError, ValueError) as e:
+                print(f"Warning: Could not load players of {team_name}: {e}")
+                return None
+            self.team_tables[key] = table
+        return table
+
+    def get_all_team_players(self) -> PlayerTable:
+        """Players of every per-team CSV in one table (loads the files not loaded yet)."""
+        tables = [self.get_team_players(team_file.team_name) for team_file in self.team_files().values()]
+        return PlayerTable.concat([table for table in tables if table is not None])
+
+    def load_dump(self, name: str = 'female_players', csv_path: str = None,
+                  workers: int = None, chunk_bytes: int = DEFAULT_CHUNK_BYTES,
+                  use_cache: bool = True) -> PlayerTable:
+        """
+        Parse a raw player dump in parallel chunks.
+
+        The file is split into byte ranges at record boundaries; each range is parsed
+        into a PlayerTable by a worker process and the tables are concatenated in order.
+        The parsed table is cached in assets/cache, keyed by the dump content and the
+        parser code.
+
+        Args:
+            name: Dump name, also the file name in assets/raw when csv_path is omitted
+            csv_path: Path of the dump
+            workers: Worker processes, None for the CPU count, 1 to parse in-process
+            chunk_bytes: Target chunk size
+            use_cache: Load from and save to the on-disk cache
+
+        Returns:
+            PlayerTable with every row of the dump
+        """
+        csv_path = csv_path or os.path.join(RAW_DIR, f"{name}.csv")
+        cache_path = os.path.join(DEFAULT_CACHE_DIR, f"{name}.players.pkl")
+        cache_key = self._cache_key(csv_path) if use_cache else None
+        table = self._load_cache(cache_path, cache_key) if use_cache else None
+        if table is not None:
+            self.dumps[name] = table
+            return table
+
+        workers = workers or os.cpu_count() or 1
+        header, ranges = _chunk_ranges(csv_path, chunk_bytes)
+        if not ranges:
+            table = PlayerTable.from_rows(header, [])
+        elif workers == 1 or len(ranges) == 1:
+            table = PlayerTable.concat([_parse_chunk(csv_path, header, start, end) for start, end in ranges])
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                chunks = executor.map(_parse_chunk, [csv_path] * len(ranges), [header] * len(ranges),
+                                      [start for start, _ in ranges], [end for _, end in ranges])
+                table = PlayerTable.concat(list(chunks))
+            table.intern_strings()
+        if use_cache:
+            self._save_cache(cache_path, cache_key, table)
+        self.dumps[name] = table
+        return table
+
+    @staticmethod
+    def _cache_key(csv_path: str) -> str:
+        """Key of a dump cache: CACHE_VERSION, the dump content and this module's source."""
+        digest = hashlib.sha256(str(CACHE_VERSION).encode())
+        for path in (csv_path, __file__):
+            with open(path, 'rb') as f:
+                for chunk in iter(lambda: f.read(1 << 20), b''):
+                    digest.update(chunk)
+        return digest.hexdigest()
+
+    @staticmethod
+    def _save_cache(cache_path: str, cache_key: str, table: PlayerTable):
+        snapshot = {'key': cache_key, 'ids': table.ids, 'ratings': table.ratings, 'text': table.text,
+                    'position_mask': table.position_mask, 'primary_position': table.primary_position}
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            temp_path = f"{cache_path}.tmp"
+            with open(temp_path, 'wb') as f:
+                pickle.dump(snapshot, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, cache_path)
+        except OSError as e:
+            print(f"Warning: Could not write player cache: {e}")
+
+    @staticmethod
+    def _load_cache(cache_path: str, cache_key: str) -> Optional[PlayerTable]:
+        try:
+            with open(cache_path, 'rb') as f:
+                snapshot = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+            return None
+        if not isinstance(snapshot, dict) or snapshot.get('key') != cache_key:
+            return None
+        table = PlayerTable(snapshot['ids'], snapshot['ratings'], snapshot['text'],
+                            snapshot['position_mask'], snapshot['primary_position'])
+        # Unpickled strings are separate copies
+        table.intern_strings()
+        return table
+
+    def get_statistics(self) -> dict:
+        """Get storage statistics."""
+        return {
+            'team_files': len(self.team_files()),
+            'loaded_teams': len(self.team_tables),
+            'loaded_team_players': sum(len(table) for table in self.team_tables.values()),
+            'dumps': {name: len(table) for name, table in self.dumps.items()},
+        }
+
+
+# Global player storage instance
+player_storage = PlayerStorage()
@@ -0,0 +1,232 @@
+"""
+Squad-Derived Team Strength
+
+This module derives attack, midfield and defence ratings from the players in the
+per-team CSVs (assets/data) instead of the team-level columns of the raw team data.
+
+For every club the best XI of a 4-3-3 is picked by primary position: one
+goalkeeper, four defenders, three midfielders and three attackers, each ranked by
+a role score blending overall with the attributes of the role:
+- Defenders: overall, defending, physic
+- Midfielders: overall, passing, dribbling
+- Attackers: overall, shooting, pace, dribbling
+
+Line ratings are the mean role score of the selected players (the goalkeeper counts
+towards defence). Selection and aggregation run over all clubs at once with NumPy
+group operations, and the result is cached in assets/cache keyed by a hash of the
+player files, so it is computed once per data update.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+from core.storage.player_storage import POSITION_INDEX, PlayerStorage, PlayerTable, player_storage
+from core.storage.team_storage import DEFAULT_CACHE_DIR
+
+
+CACHE_FORMAT = 1
+DEFAULT_CACHE_PATH = os.path.join(DEFAULT_CACHE_DIR, 'squad_strength.json')
+
+GOALKEEPER, DEFENCE, MIDFIELD, ATTACK = range(4)
+
+# Players per line in the best XI (4-3-3)
+LINE_SIZES = np.array([1, 4, 3, 3])
+
+# Line of each primary position
+POSITION_LINES = {
+    'GK': GOALKEEPER,
+    'RB': DEFENCE, 'LB': DEFENCE, 'CB': DEFENCE, 'RWB': DEFENCE, 'LWB': DEFENCE,
+    'CDM': MIDFIELD, 'CM': MIDFIELD, 'CAM': MIDFIELD, 'RM': MIDFIELD, 'LM': MIDFIELD,
+    'RW': ATTACK, 'LW': ATTACK, 'CF': ATTACK, 'ST': ATTACK,
+}
+
+# Role score weights per line: (attribute, weight), weights sum to 1
+ROLE_WEIGHTS = {
+    GOALKEEPER: (('overall', 1.0),),
+    DEFENCE: (('overall', 0.6), ('defending', 0.25), ('physic', 0.15)),
+    MIDFIELD: (('overall', 0.6), ('passing', 0.25), ('dribbling', 0.15)),
+    ATTACK: (('overall', 0.6), ('shooting', 0.2), ('pace', 0.1), ('dribbling', 0.1)),
+}
+
+# Share of the goalkeeper in the defence rating
+GOALKEEPER_DEFENCE_WEIGHT = 0.2
+
+# (attack, midfield, defence)
+Strength = Tuple[float, float, float]
+
+
+def _role_scores(players: PlayerTable) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Line and role score of every player.
+
+    Returns:
+        (line per player, -1 for unknown positions; role score per player)
+    """
+    position_lines = np.full(len(POSITION_INDEX) + 1, -1, dtype=np.int8)
+    for position, line in POSITION_LINES.items():
+        position_lines[POSITION_INDEX[position]] = line
+    # primary_position is -1 for unknown positions, which maps to the last slot
+    lines = position_lines[players.primary_position]
+
+    overall = players.ratings['overall'].astype(np.float64)
+    scores = np.full(len(players), np.nan)
+    for line, weights in ROLE_WEIGHTS.items():
+        selected = lines == line
+        score = np.zeros(int(selected.sum()))
+        for attribute, weight in weights:
+            values = players.ratings[attribute][selected].astype(np.float64)
+            # Missing attributes count as the overall rating
+            score += weight * np.where(np.isnan(values), overall[selected], values)
+        scores[selected] = score
+    return lines, scores
+
+
+def compute_squad_strengths(players: PlayerTable) -> Dict[int, Strength]:
+    """
+    Derive attack, midfield and defence of every club from its best XI.
+
+    Args:
+        players: Players of all clubs (club_team_id identifies the club)
+
+    Returns:
+        {club_team_id: (attack, midfield, defence)} for clubs with at least one
+        attacker, midfielder and defender
+    """
+    lines, scores = _role_scores(players)
+    clubs = players.ids['club_team_id']
+    usable = (lines >= 0) & ~np.isnan(scores) & (clubs >= 0)
+    lines, scores, clubs = lines[usable].astype(np.int64), scores[usable], clubs[usable]
+    if not len(scores):
+        return {}
+
+    # Sort by club, line and descending score; rank players within each (club, line) group
+    order = np.lexsort((-scores, lines, clubs))
+    lines, scores, clubs = lines[order], scores[order], clubs[order]
+    club_ids, club_index = np.unique(clubs, return_inverse=True)
+    group = club_index * 4 + lines
+    starts = np.r_[0, np.flatnonzero(np.diff(group)) + 1]
+    group_start = np.repeat(starts, np.diff(np.r_[starts, len(group)]))
+    rank = np.arange(len(group)) - group_start
+    in_xi = rank < LINE_SIZES[lines]
+
+    # Mean score of the selected players per (club, line)
+    groups = len(club_ids) * 4
+    totals = np.bincount(group[in_xi], weights=scores[in_xi], minlength=groups).reshape(-1, 4)
+    counts = np.bincount(group[in_xi], minlength=groups).reshape(-1, 4)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        means = totals / counts
+
+    goalkeeper = means[:, GOALKEEPER]
+    outfield_defence = means[:, DEFENCE]
+    defence = np.where(np.isnan(goalkeeper), outfield_defence,
+                       (1 - GOALKEEPER_DEFENCE_WEIGHT) * outfield_defence + GOALKEEPER_DEFENCE_WEIGHT * goalkeeper)
+    strengths = np.round(np.column_stack((means[:, ATTACK], means[:, MIDFIELD], defence)), 1)
+
+    complete = ~np.isnan(strengths).any(axis=1)
+    return {int(club): tuple(float(value) for value in strength)
+            for club, strength in zip(club_ids[complete], strengths[complete])}
+
+
+def _assets_digest(storage: PlayerStorage) -> str:
+    """SHA-256 over the relative paths and contents of the per-team player CSVs."""
+    digest = hashlib.sha256()
+    for team_file in sorted(storage.team_files().values(), key=lambda f: f.path):
+        digest.update(os.path.relpath(team_file.path, storage.data_dir).encode('utf-8'))
+        with open(team_file.path, 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+class SquadStrengths:
+    """Cached squad-derived strengths by club id."""
+
+    def __init__(self, storage: PlayerStorage = None, cache_path: str = None):
+        self.storage = storage or player_storage
+        self.cache_path = cache_path or DEFAULT_CACHE_PATH
+        self.by_team_id: Dict[int, Strength] = {}
+        # FIFA version of the player data, None if unknown
+        self.fifa_version: Optional[float] = None
+        self._loaded = False
+        # Team storages of several namespaces may load concurrently
+        self._lock = threading.Lock()
+
+    def load(self) -> bool:
+        """
+        Load the strengths from the cache, computing them when the player files changed.
+
+        Returns:
+            bool: True if strengths are available
+        """
+        try:
+            digest = _assets_digest(self.storage)
+        except OSError as e:
+            print(f"Warning: Could not read player data: {e}")
+            self._loaded = True
+            return False
+
+        if not self._load_cache(digest):
+            players = self.storage.get_all_team_players()
+            self.by_team_id = compute_squad_strengths(players)
+            versions, counts = np.unique(players.ratings['fifa_version'], return_counts=True)
+            valid = ~np.isnan(versions)
+            self.fifa_version = float(versions[valid][np.argmax(counts[valid])]) if valid.any() else None
+            self._save_cache(digest)
+        self._loaded = True
+        return bool(self.by_team_id)
+
+    def _load_cache(self, digest: str) -> bool:
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return False
+        if data.get('format') != CACHE_FORMAT or data.get('assets_sha256') != digest:
+            return False
+        self.by_team_id = {int(team_id): tuple(strength) for team_id, strength in data['teams'].items()}
+        self.fifa_version = data.get('fifa_version')
+        return True
+
+    def _save_cache(self, digest: str):
+        data = {
+            'format': CACHE_FORMAT,
+            'assets_sha256': digest,
+            'fifa_version': self.fifa_version,
+            'teams': {str(team_id): list(strength) for team_id, strength in self.by_team_id.items()},
+        }
+        try:
+            os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+            temp_path = f"{self.cache_path}.tmp"
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f)
+            os.replace(temp_path, self.cache_path)
+        except OSError as e:
+            print(f"Warning: Could not write squad strength cache: {e}")
+
+    def get(self, team_id: Optional[int], fifa_version: float = None) -> Optional[Strength]:
+        """
+        Get the squad-derived strength of a club.
+
+        Args:
+            team_id: Club id from the raw team data
+            fifa_version: FIFA version the caller's team data comes from; strengths of
+                player data from another version are not returned
+
+        Returns:
+            (attack, midfield, defence), or None without matching player data
+        """
+        if not self._loaded:
+            with self._lock:
+                if not self._loaded:
+                    self.load()
+        if team_id is None or (fifa_version is not None and fifa_version != self.fifa_version):
+            return None
+        return self.by_team_id.get(team_id)
+
+
+# Global squad strengths instance
+squad_strengths = SquadStrengths()
@@ -0,0 +1,227 @@
+"""
+Columnar Team Index
+
+This module provides a columnar view of the teams held by TeamStorage. Every
+numeric attribute used for filtering is stored in its own NumPy array, aligned
+with a list of Team objects, so predicates over all teams are evaluated as
+vectorized comparisons instead of Python loops.
+
+Columns:
+- overall, attack, midfield, defence
+- international_prestige, domestic_prestige, club_worth
+- league_level
+- league_id, country_id (codes into league_names / country_names)
+
+A rating index (rows sorted by overall rating) answers rating bands with two
+bisections, which the stratified sampler (draw) narrows further by level,
+league, country and excluded team names.
+"""
+
+import random
+from bisect import bisect_left, bisect_right
+from typing import Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+from core.entities.team import Team
+
+
+FLOAT_COLUMNS = (
+    'overall', 'attack', 'midfield', 'defence',
+    'international_prestige', 'domestic_prestige', 'club_worth',
+)
+INT_COLUMNS = ('league_level', 'league_id', 'country_id')
+
+# league_info key of each float column (with its fallback when missing)
+_INFO_KEYS = {
+    'overall': ('overall_rating', 50.0),
+    'attack': ('attack', 50.0),
+    'midfield': ('midfield', 50.0),
+    'defence': ('defence', 50.0),
+    'international_prestige': ('international_prestige', 0.0),
+    'domestic_prestige': ('domestic_prestige', 0.0),
+    'club_worth': ('club_worth', 0.0),
+}
+
+
+class TeamColumns:
+    """
+    Column arrays aligned with a team list.
+
+    Row i of every column describes teams[i]. Teams are kept in the order they
+    were given, so results match iterating over that sequence.
+    """
+
+    def __init__(self, teams: Iterable[Team]):
+        """
+        Build the columns from the teams' league_info.
+
+        Args:
+            teams: Teams to index (usually TeamStorage.teams_by_name.values())
+        """
+        self.teams: List[Team] = list(teams)
+        self.league_names: List[str] = []
+        self.country_names: List[str] = []
+        self._league_ids: Dict[str, int] = {}
+        self._country_ids: Dict[str, int] = {}
+
+        size = len(self.teams)
+        self.columns: Dict[str, np.ndarray] = {name: np.empty(size, dtype=np.float64) for name in FLOAT_COLUMNS}
+        self.columns.update({name: np.empty(size, dtype=np.int32) for name in INT_COLUMNS})
+
+        for row, team in enumerate(self.teams):
+            self._fill_row(row, getattr(team, 'league_info', None) or {})
+
+        # Rating index: rows ordered by overall rating, ratings in that order for bisect
+        self._rating_order = np.argsort(self.columns['overall'], kind='stable')
+        self._sorted_ratings: List[float] = self.columns['overall'][self._rating_order].tolist()
+        self._rows_by_name: Dict[str, int] = {team.name: row for row, team in enumerate(self.teams)}
+
+    def __len__(self) -> int:
+        return len(self.teams)
+
+    def update_teams(self, teams: Iterable[Team]):
+        """
+        Refresh the rows of teams whose league_info changed in place.
+
+        Only the given rows are refilled; the rating index is re-sorted if any row
+        changed. Teams that are not indexed are ignored.
+        """
+        changed = False
+        for team in teams:
+            row = self._rows_by_name.get(team.name)
+            if row is not None and self.teams[row] is team:
+                self._fill_row(row, getattr(team, 'league_info', None) or {})
+                changed = True
+        if changed:
+            self._rating_order = np.argsort(self.columns['overall'], kind='stable')
+            self._sorted_ratings = self.columns['overall'][self._rating_order].tolist()
+
+    def __getitem__(self, column: str) -> np.ndarray:
+        return self.columns[column]
+
+    def _code(self, codes: Dict[str, int], names: List[str], name: str) -> int:
+        code = codes.get(name)
+        if code is None:
+            code = codes[name] = len(names)
+            names.append(name)
+        return code
+
+    def _fill_row(self, row: int, info: dict):
+        for column, (key, default) in _INFO_KEYS.items():
+            value = info.get(key)
+            self.columns[column][row] = default if value is None else value
+        self.columns['league_level'][row] = info.get('league_level') or 1
+        self.columns['league_id'][row] = self._code(self._league_ids, self.league_names, info.get('league_name', ''))
+        self.columns['country_id'][row] = self._code(self._country_ids, self.country_names, info.get('country', ''))
+
+    def mask(self, min_rating: float = None, max_rating: float = None,
+             league_levels: Sequence[int] = None, league_name: str = None,
+             country: str = None) -> np.ndarray:
+        """
+        Evaluate a predicate over all teams.
+
+        Args:
+            min_rating: Minimum overall rating (inclusive)
+            max_rating: Maximum overall rating (inclusive)
+            league_levels: Accepted league levels
+            league_name: League name
+            country: League country
+
+        Returns:
+            Boolean array, True for matching teams
+        """
+        selected = np.ones(len(self.teams), dtype=bool)
+        overall = self.columns['overall']
+        if min_rating is not None:
+            selected &= overall >= min_rating
+        if max_rating is not None:
+            selected &= overall <= max_rating
+        if league_levels is not None:
+            levels = self.columns['league_level']
+            # A handful of levels at most: OR-ed comparisons beat np.isin here
+            level_selected = np.zeros(len(self.teams), dtype=bool)
+            for level in league_levels:
+                level_selected |= levels == level
+            selected &= level_selected
+        if league_name is not None:
+            selected &= self.columns['league_id'] == self._league_ids.get(league_name, -1)
+        if country is not None:
+            selected &= self.columns['country_id'] == self._country_ids.get(country, -1)
+        return selected
+
+    def select(self, selected: np.ndarray) -> List[Team]:
+        """Teams matching a mask, in index order."""
+        return [self.teams[row] for row in np.flatnonzero(selected)]
+
+    def sample(self, count: int, selected: Optional[np.ndarray] = None) -> List[Team]:
+        """
+        Random sample of teams matching a mask.
+
+        Uses the random module, so results follow random.seed(). When fewer teams
+        match than requested, all matching teams are returned in index order.
+
+        Args:
+            count: Number of teams
+            selected: Mask from mask(), all teams when omitted
+
+        Returns:
+            List of distinct teams
+        """
+        rows = np.arange(len(self.teams)) if selected is None else np.flatnonzero(selected)
+        if len(rows) < count:
+            return [self.teams[row] for row in rows]
+        return [self.teams[rows[pick]] for pick in random.sample(range(len(rows)), count)]
+
+    def rating_rows(self, min_rating: float = None, max_rating: float = None) -> np.ndarray:
+        """
+        Rows with an overall rating in [min_rating, max_rating], in rating order.
+
+        Uses the sorted rating index, so the band is found with two bisections.
+        """
+        start = 0 if min_rating is None else bisect_left(self._sorted_ratings, min_rating)
+        end = len(self._sorted_ratings) if max_rating is None else bisect_right(self._sorted_ratings, max_rating)
+        return self._rating_order[start:max(start, end)]
+
+    def draw(self, count: int, min_rating: float = None, max_rating: float = None,
+             league_levels: Sequence[int] = None, league_name: str = None,
+             country: str = None, exclude: Iterable[str] = ()) -> List[Team]:
+        """
+        Draw distinct random teams from a stratum in a single pass.
+
+        The rating band comes from the rating index; level, league, country and
+        excluded names are then filtered on the band's rows only.
+
+        Args:
+            count: Number of teams
+            min_rating: Minimum overall rating (inclusive)
+            max_rating: Maximum overall rating (inclusive)
+            league_levels: Accepted league levels
+            league_name: League name
+            country: League country
+            exclude: Team names that must not be drawn
+
+        Returns:
+            Up to count distinct teams (fewer only when the stratum is smaller)
+        """
+        rows = self.rating_rows(min_rating, max_rating)
+        if league_levels is not None:
+            levels = self.columns['league_level'][rows]
+            keep = np.zeros(len(rows), dtype=bool)
+            for level in league_levels:
+                keep |= levels == level
+            rows = rows[keep]
+        if league_name is not None:
+            rows = rows[self.columns['league_id'][rows] == self._league_ids.get(league_name, -1)]
+        if country is not None:
+            rows = rows[self.columns['country_id'][rows] == self._country_ids.get(country, -1)]
+
+        excluded = [self._rows_by_name[name] for name in exclude if name in self._rows_by_name]
+        if excluded:
+            rows = rows[~np.isin(rows, excluded)]
+
+        if len(rows) <= count:
+            picks = range(len(rows))
+        else:
+            picks = random.sample(range(len(rows)), count)
+        return [self.teams[rows[pick]] for pick in picks]
@@ -0,0 +1,209 @@
+"""
+Multi-Version Team History
+
+This module keeps every FIFA version of the raw team data in one store, so
+historical ratings can be queried and historical seasons built without reparsing
+the CSV for each version.
+
+Storage layout:
+- Per team: the sorted versions it appears in, its first record in full, and for
+  every later version only the fields that changed (delta encoding). Most teams
+  change a handful of ratings between versions, so the store stays close to the
+  size of a single version.
+- Per version: the teams in file order (roster index), used to rebuild a
+  TeamStorage exactly as a single-version load would.
+- Repeated strings (league, country, stadium names) are interned.
+
+Queries are "as of" a version: the latest version of a team not newer than the
+requested one, e.g. ratings as of FC 22.
+"""
+
+import sys
+from bisect import bisect_right
+from typing import Dict, Hashable, Iterator, List, Optional, Tuple
+
+from core.storage.elo_estimator import ELOEstimator
+from core.storage.team_storage import TeamRecord, TeamStorage, DEFAULT_RAW_CSV_PATH
+
+
+# Fields stored per version (the version itself is kept in the per-team version list)
+_FIELDS = tuple(field for field in TeamRecord._fields if field != 'fifa_version')
+_STRING_FIELDS = {_FIELDS.index(name) for name in ('team_name', 'league_name', 'country', 'home_stadium')}
+
+# Changed (field index, value) pairs of one version against the previous one
+Delta = Tuple[Tuple[int, object], ...]
+
+
+class _TeamChain:
+    """Delta-encoded versions of one team."""
+    __slots__ = ('versions', 'base', 'deltas')
+
+    def __init__(self, version: float, values: tuple):
+        self.versions: List[float] = [version]
+        self.base: tuple = values
+        self.deltas: List[Delta] = []
+
+    def values_at(self, position: int) -> tuple:
+        """Field values of the version at the given position in self.versions."""
+        values = list(self.base)
+        for delta in self.deltas[:position]:
+            for index, value in delta:
+                values[index] = value
+        return tuple(values)
+
+    def encode(self, snapshots: List[Tuple[float, tuple]]):
+        """Re-encode the chain from full (version, values) snapshots sorted by version."""
+        self.versions = [version for version, _ in snapshots]
+        self.base = snapshots[0][1]
+        self.deltas = [_delta(previous, current) for (_, previous), (_, current) in zip(snapshots, snapshots[1:])]
+
+
+def _delta(previous: tuple, current: tuple) -> Delta:
+    return tuple((index, value) for index, (old, value) in enumerate(zip(previous, current)) if old != value)
+
+
+class TeamHistory:
+    """All FIFA versions of the raw team data, indexed by (team, version)."""
+
+    def __init__(self):
+        # team key (team_id, or name for rows without id) -> delta-encoded versions
+        self._chains: Dict[Hashable, _TeamChain] = {}
+        # version -> team keys in file order
+        self._rosters: Dict[float, List[Hashable]] = {}
+        self._loaded = False
+
+    def load(self, csv_path: str = None) -> bool:
+        """
+        Load every version of the raw team CSV in a single pass.
+
+        Args:
+            csv_path: Path to male_teams.csv, defaults to assets/raw/male_teams.csv
+
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        self._chains.clear()
+        self._rosters.clear()
+        # Latest values per team while loading, so appending a version costs one comparison
+        latest: Dict[Hashable, tuple] = {}
+        try:
+            for record in TeamStorage._iter_team_records(csv_path or DEFAULT_RAW_CSV_PATH, None):
+                self._add(record, latest)
+        except Exception as e:
+            print(f"Error loading team history: {e}")
+            return False
+        self._loaded = True
+        return True
+
+    def _add(self, record: TeamRecord, latest: Dict[Hashable, tuple]):
+        key = record.team_id or record.team_name
+        version = record.fifa_version
+        values = tuple(sys.intern(value) if index in _STRING_FIELDS else value
+                       for index, value in enumerate(record[:1] + record[2:]))
+
+        chain = self._chains.get(key)
+        if chain is None:
+            self._chains[key] = _TeamChain(version, values)
+        elif version > chain.versions[-1]:
+            chain.deltas.append(_delta(latest[key], values))
+            chain.versions.append(version)
+        else:
+            # Out of order or repeated row: rebuild this team's chain, the last row of a version wins
+            repeated = version in chain.versions
+            snapshots = [(v, chain.values_at(i)) for i, v in enumerate(chain.versions) if v != version]
+            snapshots.append((version, values))
+            snapshots.sort(key=lambda snapshot: snapshot[0])
+            chain.encode(snapshots)
+            latest[key] = chain.values_at(len(chain.versions) - 1)
+            if not repeated:
+                self._rosters.setdefault(version, []).append(key)
+            return
+
+        latest[key] = values
+        self._rosters.setdefault(version, []).append(key)
+
+    @property
+    def versions(self) -> List[float]:
+        """Loaded FIFA versions, oldest first."""
+        return sorted(self._rosters)
+
+    def team_versions(self, team_id: Hashable) -> List[float]:
+        """Versions a team appears in, oldest first."""
+        chain = self._chains.get(team_id)
+        return list(chain.versions) if chain else []
+
+    def record(self, team_id: Hashable, version: float, exact: bool = False) -> Optional[TeamRecord]:
+        """
+        Get a team's record as of a version.
+
+        Args:
+            team_id: Team id from the raw data
+            version: FIFA version, e.g. 22
+            exact: Only return a record from exactly this version
+
+        Returns:
+            TeamRecord of the latest version not newer than the requested one, or None
+        """
+        chain = self._chains.get(team_id)
+        if chain is None:
+            return None
+        position = bisect_right(chain.versions, version) - 1
+        if position < 0 or (exact and chain.versions[position] != version):
+            return None
+        values = chain.values_at(position)
+        return TeamRecord(values[0], chain.versions[position], *values[1:])
+
+    def ratings(self, team_id: Hashable, version: float) -> Optional[dict]:
+        """
+        Get a team's ratings as of a version.
+
+        Returns:
+            Dict with version, overall, attack, midfield and defence, or None if unknown
+        """
+        record = self.record(team_id, version)
+        if record is None:
+            return None
+        return {
+            'version': record.fifa_version,
+            'overall': record.overall,
+            'attack': record.attack,
+            'midfield': record.midfield,
+            'defence': record.defence,
+        }
+
+    def records(self, version: float) -> Iterator[TeamRecord]:
+        """Records of every team in a version, in file order."""
+        for key in self._rosters.get(version, ()):
+            yield self.record(key, version, exact=True)
+
+    def build_storage(self, version: float) -> Optional[TeamStorage]:
+        """
+        Build a TeamStorage for one version from the store (no CSV parsing).
+
+        Args:
+            version: FIFA version to build
+
+        Returns:
+            TeamStorage equivalent to load_from_raw_data for that version, or None
+        """
+        if version not in self._rosters:
+            return None
+        # Own estimator: the reference teams of the live storage stay those of its version
+        storage = TeamStorage(ELOEstimator())
+        if not storage.load_from_records(self.records(version)):
+            return None
+        return storage
+
+    def get_statistics(self) -> dict:
+        """Get history statistics."""
+        return {
+            'loaded': self._loaded,
+            'versions': self.versions,
+            'teams': len(self._chains),
+            'records': sum(len(roster) for roster in self._rosters.values()),
+            'changed_fields': sum(len(delta) for chain in self._chains.values() for delta in chain.deltas),
+        }
+
+
+# Global team history instance
+team_history = TeamHistory()
@@ -0,0 +1,155 @@
+"""
+Team Search Index
+
+This module provides the team name search used by TeamStorage. Names are folded
+(accents stripped, case folded, letters such as "ø" and "ł" transliterated) so
+ASCII queries match "Cádiz", "FC Köln" or "Borussia Mönchengladbach".
+
+The index is built once at load time:
+- Folded full names and name tokens in sorted lists, for prefix lookups by bisection
+- Trigram posting lists, for substring candidates and fuzzy matching
+
+Results are ranked by match type, best first:
+1. Exact name
+2. Name prefix
+3. Every query word is a prefix of a name word
+4. Substring
+5. Fuzzy (trigram similarity), for typos, most similar first
+Ties are broken by shorter name, then alphabetically.
+"""
+
+import re
+import unicodedata
+from bisect import bisect_left
+from collections import defaultdict
+from typing import Dict, Iterable, List, Set, Tuple
+
+from core.entities.team import Team
+
+
+EXACT, PREFIX, TOKEN_PREFIX, SUBSTRING, FUZZY = range(5)
+
+# Minimum Dice coefficient between trigram sets for a fuzzy match
+FUZZY_THRESHOLD = 0.45
+
+# Letters that do not decompose into a base letter plus combining marks
+_TRANSLITERATIONS = str.maketrans({
+    'ø': 'o', 'Ø': 'o', 'ł': 'l', 'Ł': 'l', 'đ': 'd', 'Đ': 'd', 'ð': 'd', 'Ð': 'd',
+    'æ': 'ae', 'Æ': 'ae', 'œ': 'oe', 'Œ': 'oe', 'þ': 'th', 'Þ': 'th', 'ı': 'i',
+})
+_SEPARATORS = re.compile(r'[^0-9a-z]+')
+
+
+def fold(text: str) -> str:
+    """
+    Fold a name for matching: transliterate, strip accents, casefold, collapse separators.
+
+    Args:
+        text: Team name or query
+
+    Returns:
+        Folded text, e.g. "Borussia Mönchengladbach" -> "borussia monchengladbach"
+    """
+    decomposed = unicodedata.normalize('NFKD', text.translate(_TRANSLITERATIONS))
+    stripped = ''.join(ch for ch in decomposed if not unicodedata.combining(ch)).casefold()
+    return _SEPARATORS.sub(' ', stripped).strip()
+
+
+def trigrams(folded: str) -> Set[str]:
+    """Trigrams of a folded text, padded so word starts and ends count."""
+    padded = f"  {folded} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class TeamSearchIndex:
+    """Ranked, accent-insensitive search over team names."""
+
+    def __init__(self, teams: Iterable[Team]):
+        """
+        Build the index.
+
+        Args:
+            teams: Teams to index (names are expected to be unique)
+        """
+        self.teams: List[Team] = list(teams)
+        self._names: List[str] = [fold(team.name) for team in self.teams]
+        # (folded name, team id) and (folded token, team id), sorted for bisection
+        self._sorted_names: List[Tuple[str, int]] = sorted((name, i) for i, name in enumerate(self._names))
+        self._sorted_tokens: List[Tuple[str, int]] = sorted(
+            {(token, i) for i, name in enumerate(self._names) for token in name.split()}
+        )
+        self._trigram_counts: List[int] = []
+        self._postings: Dict[str, List[int]] = defaultdict(list)
+        for i, name in enumerate(self._names):
+            grams = trigrams(name)
+            self._trigram_counts.append(len(grams))
+            for gram in grams:
+                self._postings[gram].append(i)
+
+    @staticmethod
+    def _prefix_range(entries: List[Tuple[str, int]], prefix: str) -> Iterable[Tuple[str, int]]:
+        """Entries whose key starts with prefix."""
+        start = bisect_left(entries, (prefix,))
+        for entry in entries[start:]:
+            if not entry[0].startswith(prefix):
+                break
+            yield entry
+
+    def search(self, query: str, limit: int = 20) -> List[Team]:
+        """
+        Search teams by name.
+
+        Args:
+            query: Full or partial name, with or without accents
+            limit: Maximum number of results
+
+        Returns:
+            Matching teams, best match first
+        """
+        folded = fold(query)
+        if not folded:
+            return self.teams[:limit]
+
+        # team id -> best (lowest) match rank
+        ranks: Dict[int, int] = {}
+
+        for name, i in self._prefix_range(self._sorted_names, folded):
+            ranks[i] = EXACT if name == folded else PREFIX
+
+        # Every query word must prefix some word of the name
+        words = folded.split()
+        token_matches = None
+        for word in words:
+            ids = {i for _, i in self._prefix_range(self._sorted_tokens, word)}
+            token_matches = ids if token_matches is None else token_matches & ids
+            if not token_matches:
+                break
+        for i in token_matches or ():
+            ranks.setdefault(i, TOKEN_PREFIX)
+
+        # Substring and fuzzy candidates share the trigram postings
+        query_grams = trigrams(folded)
+        overlaps: Dict[int, int] = defaultdict(int)
+        for gram in query_grams:
+            for i in self._postings.get(gram, ()):
+                overlaps[i] += 1
+        if len(folded) < 3:
+            # Too short for the inner trigrams of a substring: check every name
+            candidates = range(len(self._names))
+        else:
+            candidates = overlaps
+        for i in candidates:
+            if i not in ranks and folded in self._names[i]:
+                ranks[i] = SUBSTRING
+
+        fuzzy_scores: Dict[int, float] = {}
+        for i, overlap in overlaps.items():
+            if i not in ranks:
+                similarity = 2 * overlap / (len(query_grams) + self._trigram_counts[i])
+                if similarity >= FUZZY_THRESHOLD:
+                    ranks[i] = FUZZY
+                    fuzzy_scores[i] = similarity
+
+        best = sorted(ranks, key=lambda i: (ranks[i], -fuzzy_scores.get(i, 0.0),
+                                            len(self._names[i]), self._names[i]))
+        return [self.teams[i] for i in best[:limit]]
@@ -9,12 +9,197 @@ Key Features:
 - League-based organization for efficient filtering
 - Support for regular data updates from internet sources
 - Backward compatibility with existing Team objects
+- Versioned on-disk cache of the built storage (assets/cache), keyed by the CSV
+  content, the FIFA version and the storage code, rebuilt automatically when stale
+- Lazy mode: only the league catalog is loaded from a byte-offset index
+  (core.storage.league_index), a league's teams when it is selected, and all
+  teams in a background thread for global features
+- Team/coach join index built at load time from the coach_id column; coach
+  records are read from the matching coach CSV on first request
+- Rating overrides from data updates, applied to every load and, on update, to
+  the touched teams only (see apply_rating_updates)
 """
 
 import csv
-from typing import Dict, List, Optional, Tuple
+import dataclasses
+import hashlib
+import os
+import pickle
+import threading
+from typing import Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Set, Tuple
+from core.entities import team as _team_module
 from core.entities.team import Team
-from core.storage.elo_estimator import elo_estimator, TeamMetrics
+from core.storage import elo_estimator as _elo_estimator_module
+from core.storage import elo_index as _elo_index_module
+from core.storage.elo_estimator import ELOEstimator, elo_estimator, TeamMetrics
+from core.storage.elo_estimate_cache import ELOEstimateCache
+from core.storage.team_columns import TeamColumns
+from core.storage.team_search import TeamSearchIndex
+
+
+# Bump when the cached storage layout changes
+CACHE_VERSION = 1
+DEFAULT_CACHE_DIR = os.path.join(os.path.dirname(__file__), '..', '..', 'assets', 'cache')
+
+
+class TeamRecord(NamedTuple):
+    """Typed team row of the raw CSV, as kept by the ingestion pipeline."""
+    team_id: int
+    fifa_version: float
+    team_name: str
+    league_name: str
+    country: str
+    league_level: int
+    overall: Optional[float]
+    attack: float
+    midfield: float
+    defence: float
+    transfer_budget: float
+    club_worth: float
+    home_stadium: str
+    # False when a stored value does not parse; the row then only serves as ELO reference
+    valid: bool
+    # Raw-valued estimator metrics: attack, midfield, defence, international prestige,
+    # domestic prestige, club worth, transfer budget, league level (None when missing)
+    metrics_source: Tuple[Optional[float], ...]
+    # Coach of the team in the coach CSV, None when missing
+    coach_id: Optional[int] = None
+
+
+class _PendingTeam:
+    """Placeholder holding a team's position until its ELO is estimated."""
+    __slots__ = ()
+
+
+def _optional_int(value: str) -> Optional[int]:
+    try:
+        return int(value) if value and value.strip() else None
+    except ValueError:
+        return None
+
+
+def _optional_float(value: str) -> Optional[float]:
+    try:
+        return float(value) if value and value.strip() else None
+    except ValueError:
+        return None
+
+
+def _optional_id(value: str) -> Optional[int]:
+    """Integer id stored as int or float text (e.g. "23180.0")."""
+    number = _optional_float(value)
+    return int(number) if number is not None else None
+
+
+def team_record_parser(header: List[str], fifa_version: Optional[float]) -> Callable[[List[str]], Optional['TeamRecord']]:
+    """
+    Create the row parser of the raw team CSV.
+
+    Each row is parsed once; rows of other versions, international teams and rows
+    without team, league or country are dropped before any numeric parsing.
+
+    Args:
+        header: CSV header row
+        fifa_version: FIFA version to keep, None for all versions
+
+    Returns:
+        Function turning a CSV row into a TeamRecord, or None for dropped rows
+    """
+    col = {name: index for index, name in enumerate(header)}
+    width = len(header)
+    version_col = col['fifa_version']
+    team_col = col['team_name']
+    league_col = col['league_name']
+    country_col = col['nationality_name']
+    overall_col = col['overall']
+    attack_col = col['attack']
+    midfield_col = col['midfield']
+    defence_col = col['defence']
+    budget_col = col['transfer_budget_eur']
+    worth_col = col['club_worth_eur']
+    team_id_col = col['team_id']
+    level_col = col['league_level']
+    stadium_col = col['home_stadium']
+    international_col = col['international_prestige']
+    domestic_col = col['domestic_prestige']
+    coach_col = col.get('coach_id')
+    # Parsed fifa_version strings, None when filtered out (a handful of distinct values per file)
+    parsed_versions: Dict[str, Optional[float]] = {}
+
+    def parse(row: List[str]) -> Optional[TeamRecord]:
+        if len(row) < width:
+            row = row + [''] * (width - len(row))
+
+        version = row[version_col]
+        if version in parsed_versions:
+            row_version = parsed_versions[version]
+        else:
+            try:
+                row_version = float(version)
+                if fifa_version is not None and row_version != fifa_version:
+                    row_version = None
+            except ValueError:
+                row_version = None
+            parsed_versions[version] = row_version
+        if row_version is None:
+            return None
+
+        team_name = row[team_col]
+        league_name = row[league_col]
+        country = row[country_col]
+        if league_name == 'Friendly International' or not team_name or not league_name or not country:
+            return None
+
+        overall_raw = row[overall_col]
+        overall = _optional_float(overall_raw)
+
+        # Values stored on the team; invalid ones keep the row as a reference only
+        valid = True
+        try:
+            if overall is None and overall_raw.strip():
+                raise ValueError(overall_raw)
+            attack = float(row[attack_col]) if row[attack_col] else 50.0
+            midfield = float(row[midfield_col]) if row[midfield_col] else 50.0
+            defence = float(row[defence_col]) if row[defence_col] else 50.0
+            transfer_budget = float(row[budget_col]) if row[budget_col] else 0.0
+            club_worth = float(row[worth_col]) if row[worth_col] else 0.0
+            team_id = int(row[team_id_col]) if row[team_id_col] else 0
+            league_level = int(row[level_col]) if row[level_col] else 1
+        except ValueError:
+            valid = False
+            attack = midfield = defence = transfer_budget = club_worth = 0.0
+            team_id = 0
+            league_level = 1
+
+        return TeamRecord(
+            team_id=team_id,
+            fifa_version=row_version,
+            team_name=team_name,
+            league_name=league_name,
+            country=country,
+            league_level=league_level,
+            overall=overall,
+            attack=attack,
+            midfield=midfield,
+            defence=defence,
+            transfer_budget=transfer_budget,
+            club_worth=club_worth,
+            home_stadium=row[stadium_col],
+            valid=valid,
+            metrics_source=(
+                _optional_float(row[attack_col]),
+                _optional_float(row[midfield_col]),
+                _optional_float(row[defence_col]),
+                _optional_float(row[international_col]),
+                _optional_float(row[domestic_col]),
+                _optional_float(row[worth_col]),
+                _optional_float(row[budget_col]),
+                _optional_int(row[level_col]),
+            ),
+            coach_id=_optional_id(row[coach_col]) if coach_col is not None else None,
+        )
+
+    return parse
 
 
 class TeamStorage:
@@ -25,22 +210,111 @@ class TeamStorage:
     teams_by_name: {team_name: Team} - O(1) lookup by team name
     teams_by_league: {league_name: {country: [Team]}} - Organized by league/country
     league_metadata: {league_name: {country: metadata}} - League information
+    columns: TeamColumns over teams_by_name - Vectorized filtering and sampling
+    search_index: TeamSearchIndex over teams_by_name - Ranked name search
+    coach_by_team: {team_name: coach_id} - Team to coach join index
+    teams_by_coach: {coach_id: [team_name]} - Coach to teams join index
     """
     
-    def __init__(self):
+    def __init__(self, estimator: ELOEstimator = None, squad_strengths: bool = True):
+        """
+        Create an empty storage.
+        
+        Args:
+            estimator: ELO estimator holding this storage's reference teams, defaults to
+                the global estimator (datasets of other namespaces use their own)
+            squad_strengths: Apply the ratings derived from the per-team player files
+                (male clubs, keyed by team id); False for datasets of other namespaces
+        """
+        self.estimator = estimator or elo_estimator
+        self.squad_strengths = squad_strengths
         self.teams_by_name: Dict[str, Team] = {}
         self.teams_by_league: Dict[str, Dict[str, List[Team]]] = {}
         self.league_metadata: Dict[str, Dict[str, dict]] = {}
+        self.columns = TeamColumns(())
+        self.search_index = TeamSearchIndex(())
+        # Lazy mode state (see load_catalog): set once every team is loaded
+        self._complete = threading.Event()
+        self._complete.set()
+        self._lock = threading.RLock()
+        self._league_index = None
+        self._loaded_leagues: Set[Tuple[str, str]] = set()
+        self._raw_source: Optional[Tuple[str, float]] = None
+        self._fill_thread: Optional[threading.Thread] = None
         self._loaded_from_raw = False
+        # Updated storage built in the background, swapped in by swap_pending
+        self._pending: Optional['TeamStorage'] = None
+        self.coach_by_team: Dict[str, int] = {}
+        self.teams_by_coach: Dict[int, List[str]] = {}
+        # Coach CSV matching the loaded team CSV; its records are read on first request
+        self._coach_source: Optional[str] = None
+        self._coaches = None
         self._teams_with_estimated_elo: set = set()  # Track teams with estimated ELO
+        # Persisted estimates of the raw CSV being loaded, None without caching
+        self._estimate_cache: Optional[ELOEstimateCache] = None
+        # Overall ratings from data updates by team name, applied to every load
+        self.rating_overrides: Dict[str, float] = {}
+        # Team name -> (overall, ELO, estimated) before its override, to revert it
+        self._rating_originals: Dict[str, Tuple[float, float, bool]] = {}
     
-    def load_from_raw_data(self, csv_path: str, fifa_version: float = 24.0) -> bool:
+    def load_from_raw_data(self, csv_path: str, fifa_version: float = 24.0, use_cache: bool = True) -> bool:
         """
         Load teams from raw CSV data (internet updates format).
         
+        The built storage is cached in assets/cache. The cache is used only when it was
+        built from the same CSV content, FIFA version and storage code; otherwise the
+        CSV is parsed and the cache rewritten.
+        
         Args:
             csv_path: Path to male_teams.csv file
             fifa_version: FIFA version to filter by
+            use_cache: Load from and save to the on-disk cache
+            
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        self._raw_source = (csv_path, fifa_version)
+        self._set_coach_source(csv_path)
+        cache_key = None
+        if use_cache:
+            try:
+                cache_key = self._cache_key(csv_path, fifa_version)
+            except OSError as e:
+                print(f"Error loading team data: {e}")
+                return False
+            if self._load_cache(self._cache_path(csv_path, fifa_version), cache_key):
+                self._apply_squad_strengths(self._league_teams(), fifa_version)
+                self._refresh_changed(self._apply_rating_overrides(self.teams_by_name.values()))
+                return True
+        
+        # Teams whose estimation inputs did not change reuse their persisted estimates
+        self._estimate_cache = ELOEstimateCache(self._estimate_cache_path(csv_path, fifa_version)) \
+            if use_cache else None
+        if not self._build_from_raw_data(csv_path, fifa_version):
+            return False
+        
+        # The cache holds the team data ratings; squad strengths follow the player files
+        if cache_key is not None:
+            self._save_cache(self._cache_path(csv_path, fifa_version), cache_key)
+        self._apply_squad_strengths(self._league_teams(), fifa_version)
+        self._refresh_changed(self._apply_rating_overrides(self.teams_by_name.values()))
+        return True
+    
+    def _build_from_raw_data(self, csv_path: str, fifa_version: float) -> bool:
+        """Parse the raw CSV and build all lookup structures (see load_from_raw_data)."""
+        return self.load_from_records(self._iter_team_records(csv_path, fifa_version))
+    
+    def load_from_records(self, records: Iterable['TeamRecord']) -> bool:
+        """
+        Build all lookup structures from typed team records of one FIFA version.
+        
+        Records are consumed once. Teams with a valid overall rating get their ELO
+        immediately and are registered as estimator references. Teams needing
+        estimation keep a slot in the lookup structures and are queued; they are
+        estimated once every reference team has been seen.
+        
+        Args:
+            records: Team records in file order (from the raw CSV or TeamHistory)
             
         Returns:
             bool: True if successful, False otherwise
@@ -52,150 +326,73 @@ class TeamStorage:
             self.league_metadata.clear()
             self._teams_with_estimated_elo.clear()
             
-            # Read CSV using built-in csv module - Two-pass approach for ELO estimation
-            all_rows = []
-            teams_needing_estimation = []
+            # (slot marker, league team list, list index, record, metrics) per team needing estimation
+            estimation_queue = []
             
-            with open(csv_path, 'r', encoding='utf-8') as file:
-                reader = csv.DictReader(file)
-                all_rows = list(reader)
+            for record in records:
+                metrics = None
+                calculated_elo = None
+                if record.overall is not None and 30 <= record.overall <= 100:
+                    metrics = self._record_metrics(record)
+                    calculated_elo = self._calculate_elo_from_overall(record.overall)
+                    self.estimator.add_known_team(record.team_name, calculated_elo, metrics)
                 
-            # First pass: Build reference database for ELO estimation
-            for row in all_rows:
-                try:
-                    if (float(row['fifa_version']) != fifa_version or 
-                        row['league_name'] == 'Friendly International'):
-                        continue
-                        
-                    team_name = row['team_name']
-                    league_name = row['league_name'] 
-                    country = row['nationality_name']
-                    
-                    if not team_name or not league_name or not country:
-                        continue
-                    
-                    # If team has valid overall rating, add to reference database
-                    if row['overall'] and row['overall'].strip():
-                        try:
-                            overall_rating = float(row['overall'])
-                            if 30 <= overall_rating <= 100:
-                                metrics = self._create_team_metrics(row, team_name, league_name, country)
-                                calculated_elo = self._calculate_elo_from_overall(overall_rating)
-                                elo_estimator.add_known_team(team_name, calculated_elo, metrics)
-                        except (ValueError, TypeError):
-                            teams_needing_estimation.append(row)
-                    else:
-                        teams_needing_estimation.append(row)
-                        
-                except (ValueError, TypeError, KeyError):
-                    continue
-                
-            # Second pass: Process all teams with ELO estimation for missing data
-            for row in all_rows:
-                try:
-                    # Filter by FIFA version and exclude international teams
-                    if (float(row['fifa_version']) != fifa_version or 
-                        row['league_name'] == 'Friendly International'):
-                        continue
-                        
-                    team_name = row['team_name']
-                    league_name = row['league_name'] 
-                    country = row['nationality_name']
-                    
-                    # Skip teams with empty names
-                    if not team_name or not league_name or not country:
-                        continue
-                    
-                    # Get or estimate ELO
-                    overall_rating = None
-                    calculated_elo = None
-                    
-                    if row['overall'] and row['overall'].strip():
-                        try:
-                            overall_rating = float(row['overall'])
-                            if 30 <= overall_rating <= 100:
-                                calculated_elo = self._calculate_elo_from_overall(overall_rating)
-                        except (ValueError, TypeError):
-                            pass
-                    
-                    # If no valid ELO, estimate using similarity
+                # Rows with invalid numeric data are references only
+                if not record.valid:
                     if calculated_elo is None:
-                        metrics = self._create_team_metrics(row, team_name, league_name, country)
-                        calculated_elo = elo_estimator.estimate_elo(metrics, league_context=True)
-                        # Track teams with estimated ELO
-                        self._teams_with_estimated_elo.add(team_name)
-                        # Store estimation info for debugging
-                        confidence = elo_estimator.get_estimation_confidence(metrics)
-                        if hasattr(self, '_estimation_log'):
-                            self._estimation_log = getattr(self, '_estimation_log', [])
-                            self._estimation_log.append(f"{team_name}: ELO {calculated_elo:.0f} (confidence: {confidence})")
-                    
-                    # Parse other numeric values with fallbacks
-                    try:
-                        if overall_rating is None:
-                            overall_rating = float(row['overall']) if row['overall'] else 50.0
-                        attack = float(row['attack']) if row['attack'] else 50.0
-                        midfield = float(row['midfield']) if row['midfield'] else 50.0
-                        defence = float(row['defence']) if row['defence'] else 50.0
-                        transfer_budget = float(row.get('transfer_budget_eur', 0)) if row.get('transfer_budget_eur') else 0.0
-                        club_worth = float(row.get('club_worth_eur', 0)) if row.get('club_worth_eur') else 0.0
-                        team_id = int(row['team_id']) if row['team_id'] else 0
-                        league_level = int(row.get('league_level', 1)) if row.get('league_level') else 1
-                    except (ValueError, TypeError):
-                        continue  # Skip teams with invalid data
-                    
-                    # Create Team object
-                    team = Team(
-                        name=team_name,
-                        elo=calculated_elo
-                    )
-                    
-                    # Store additional team metadata
-                    team.league_info = {
-                        'league_name': league_name,
-                        'country': country,
-                        'overall_rating': overall_rating,
-                        'attack': attack,
-                        'midfield': midfield,
-                        'defence': defence,
-                        'transfer_budget': transfer_budget,
-                        'club_worth': club_worth,
-                        'home_stadium': row.get('home_stadium', ''),
-                        'team_id': team_id
-                    }
-                    
-                    # Store in lookup structures
-                    self.teams_by_name[team_name] = team
-                    
-                    # Organize by league and country
-                    if league_name not in self.teams_by_league:
-                        self.teams_by_league[league_name] = {}
-                    if country not in self.teams_by_league[league_name]:
-                        self.teams_by_league[league_name][country] = []
-                    
-                    self.teams_by_league[league_name][country].append(team)
-                    
-                    # Store league metadata
-                    if league_name not in self.league_metadata:
-                        self.league_metadata[league_name] = {}
-                    if country not in self.league_metadata[league_name]:
-                        self.league_metadata[league_name][country] = {
-                            'team_count': 0,
-                            'avg_rating': 0,
-                            'league_level': league_level
-                        }
-                    
-                    # Update metadata
-                    meta = self.league_metadata[league_name][country]
-                    meta['team_count'] += 1
-                    
-                except (ValueError, TypeError, KeyError):
-                    # Skip individual team if there are issues
+                        self._teams_with_estimated_elo.add(record.team_name)
                     continue
                 
+                if calculated_elo is None:
+                    # Reserve the team's position until its ELO is estimated
+                    team = _PendingTeam()
+                else:
+                    team = self._make_team(record, calculated_elo)
+                
+                # Store in lookup structures
+                self.teams_by_name[record.team_name] = team
+                
+                # Organize by league and country
+                league_teams = self.teams_by_league.setdefault(record.league_name, {}).setdefault(record.country, [])
+                league_teams.append(team)
+                if calculated_elo is None:
+                    estimation_queue.append((team, league_teams, len(league_teams) - 1, record,
+                                             metrics or self._record_metrics(record)))
+                
+                # Store league metadata
+                meta = self.league_metadata.setdefault(record.league_name, {}).setdefault(record.country, {
+                    'team_count': 0,
+                    'avg_rating': 0,
+                    'league_level': record.league_level
+                })
+                meta['team_count'] += 1
+            
+            # Estimate missing ELOs against the complete reference database, in one batch.
+            # Every FIFA 24 team of the shipped male and female CSVs has an overall
+            # rating, so this queue is empty at startup; the batch path serves data
+            # with unrated teams (older versions, edited or custom CSVs).
+            estimated_elos = self._estimate_elos([entry[4] for entry in estimation_queue])
+            for (pending, league_teams, index, record, metrics), calculated_elo in zip(estimation_queue,
+                                                                                       estimated_elos):
+                # Track teams with estimated ELO
+                self._teams_with_estimated_elo.add(record.team_name)
+                # Store estimation info for debugging
+                confidence = self.estimator.get_estimation_confidence(metrics)
+                if hasattr(self, '_estimation_log'):
+                    self._estimation_log = getattr(self, '_estimation_log', [])
+                    self._estimation_log.append(f"{record.team_name}: ELO {calculated_elo:.0f} (confidence: {confidence})")
+                
+                team = self._make_team(record, calculated_elo)
+                league_teams[index] = team
+                # A later row with the same name owns the lookup slot
+                if self.teams_by_name.get(record.team_name) is pending:
+                    self.teams_by_name[record.team_name] = team
+                
             # Calculate league averages
             self._calculate_league_averages()
+            self.refresh_indexes()
             self._loaded_from_raw = True
+            self._complete.set()
             
             return True
             
@@ -203,12 +400,473 @@ class TeamStorage:
             print(f"Error loading team data: {e}")
             return False
     
+    @staticmethod
+    def _iter_team_records(csv_path: str, fifa_version: Optional[float]) -> Iterator['TeamRecord']:
+        """
+        Stream typed team records of one FIFA version (all versions if None) from the raw CSV.
+        
+        Rows are read and parsed one at a time (see team_record_parser).
+        """
+        with open(csv_path, 'r', encoding='utf-8', newline='') as file:
+            reader = csv.reader(file)
+            header = next(reader, None)
+            if header is None:
+                return
+            parse = team_record_parser(header, fifa_version)
+            for row in reader:
+                record = parse(row)
+                if record is not None:
+                    yield record
+    
+    def _estimate_elos(self, targets: List[TeamMetrics]) -> List[float]:
+        """Estimate ELOs in one batch, reusing and updating the persisted estimates if enabled."""
+        cache = self._estimate_cache
+        if cache is None:
+            return self.estimator.estimate_elos(targets, league_context=True)
+        
+        estimates = [cache.get(self.estimator, metrics) for metrics in targets]
+        missing = [i for i, elo in enumerate(estimates) if elo is None]
+        if missing:
+            for i, elo in zip(missing, self.estimator.estimate_elos([targets[i] for i in missing],
+                                                                    league_context=True)):
+                estimates[i] = elo
+                cache.put(self.estimator, targets[i], elo)
+        cache.save()
+        return estimates
+    
+    @staticmethod
+    def _record_metrics(record: 'TeamRecord') -> TeamMetrics:
+        """Create the ELO estimation metrics of a team record."""
+        (attack, midfield, defence, international_prestige, domestic_prestige,
+         club_worth, transfer_budget, league_level) = record.metrics_source
+        return TeamMetrics(
+            overall=record.overall,
+            attack=attack,
+            midfield=midfield,
+            defence=defence,
+            international_prestige=international_prestige,
+            domestic_prestige=domestic_prestige,
+            club_worth_eur=club_worth,
+            transfer_budget_eur=transfer_budget,
+            league_level=league_level,
+            team_name=record.team_name,
+            league_name=record.league_name,
+            country=record.country
+        )
+    
+    @staticmethod
+    def _make_team(record: 'TeamRecord', elo: float) -> Team:
+        """Create the Team object of a record."""
+        team = Team(
+            name=record.team_name,
+            elo=elo
+        )
+        
+        # Store additional team metadata
+        team.league_info = {
+            'league_name': record.league_name,
+            'country': record.country,
+            'overall_rating': record.overall if record.overall is not None else 50.0,
+            'attack': record.attack,
+            'midfield': record.midfield,
+            'defence': record.defence,
+            'transfer_budget': record.transfer_budget,
+            'club_worth': record.club_worth,
+            'home_stadium': record.home_stadium,
+            'team_id': record.team_id,
+            'league_level': record.league_level,
+            'international_prestige': record.metrics_source[3],
+            'domestic_prestige': record.metrics_source[4],
+            'strength_source': 'team_data',
+            'coach_id': record.coach_id
+        }
+        return team
+    
+    def _league_teams(self) -> Iterator[Team]:
+        """Every team of the league lists, including teams whose name a later row owns."""
+        for countries in self.teams_by_league.values():
+            for teams in countries.values():
+                yield from teams
+    
+    def _apply_squad_strengths(self, teams: Iterable[Team], fifa_version: float):
+        """
+        Replace attack, midfield and defence with the ratings derived from each club's best XI.
+        
+        Teams without player data of the same FIFA version keep the team data ratings, as
+        do all teams of a storage created with squad_strengths False (the player files
+        are male clubs only, and team ids are not unique across datasets).
+        """
+        if not self.squad_strengths:
+            return
+        from core.storage.squad_strength import squad_strengths
+        
+        changed = []
+        for team in teams:
+            strength = squad_strengths.get(team.league_info['team_id'], fifa_version)
+            if strength is not None:
+                team.league_info['attack'], team.league_info['midfield'], team.league_info['defence'] = strength
+                team.league_info['strength_source'] = 'squad'
+                changed.append(team)
+        # The columnar index was built from the team data ratings
+        self.columns.update_teams(changed)
+    
+    def _apply_rating_overrides(self, teams: Iterable[Team]) -> List[Team]:
+        """
+        Set the overridden overall rating (and the ELO derived from it) of teams.
+        
+        Returns:
+            Teams that changed
+        """
+        if not self.rating_overrides:
+            return []
+        changed = []
+        for team in teams:
+            overall = self.rating_overrides.get(team.name)
+            if overall is None or team.league_info.get('overall_rating') == overall:
+                continue
+            self._rating_originals.setdefault(team.name, (team.league_info.get('overall_rating'), team.elo,
+                                                          team.name in self._teams_with_estimated_elo))
+            team.league_info['overall_rating'] = overall
+            team.elo = self._calculate_elo_from_overall(overall)
+            self._teams_with_estimated_elo.discard(team.name)
+            self._update_reference(team)
+            changed.append(team)
+        return changed
+    
+    def _update_reference(self, team: Team):
+        """Give a reference team of the ELO estimator the current rating and ELO of the team."""
+        known = self.estimator.known_teams.get(team.name)
+        if known is None:
+            return
+        overall = team.league_info.get('overall_rating')
+        # Changing a reference changes its league's reference version, which invalidates
+        # the persisted estimates of that league only
+        self.estimator.add_known_team(team.name, team.elo, dataclasses.replace(known[1], overall=overall))
+    
+    def _refresh_changed(self, teams: List[Team]):
+        """Update the columnar index rows and league averages of teams whose rating changed."""
+        if not teams:
+            return
+        self.columns.update_teams(teams)
+        for league_name, country in {(t.league_info['league_name'], t.league_info['country']) for t in teams}:
+            self._calculate_league_average(league_name, country)
+    
+    def apply_rating_updates(self, ratings: Dict[str, float], reverted: Iterable[str] = ()) -> List[Team]:
+        """
+        Apply overall ratings from a data update.
+        
+        The ratings are kept as overrides, so teams loaded later (lazy leagues,
+        reloads) get them too. Only the touched teams are updated: their rows of the
+        columnar index, the averages of their leagues and their ELO estimator
+        references (which invalidates the persisted estimates of those leagues only).
+        
+        Args:
+            ratings: New overall rating by team name
+            reverted: Team names whose override is removed, restoring the rating of
+                the team data
+            
+        Returns:
+            List of teams that changed
+        """
+        with self._lock:
+            self.rating_overrides.update(ratings)
+            changed = self._apply_rating_overrides(
+                team for team in (self.teams_by_name.get(name) for name in ratings) if team is not None)
+            
+            for name in reverted:
+                self.rating_overrides.pop(name, None)
+                original = self._rating_originals.pop(name, None)
+                team = self.teams_by_name.get(name)
+                if original is None or team is None:
+                    continue
+                team.league_info['overall_rating'], team.elo, estimated = original
+                if estimated:
+                    self._teams_with_estimated_elo.add(name)
+                self._update_reference(team)
+                changed.append(team)
+            
+            self._refresh_changed(changed)
+        return changed
+    
+    @staticmethod
+    def _estimate_cache_path(csv_path: str, fifa_version: float) -> str:
+        """Persisted ELO estimates of a raw CSV and FIFA version."""
+        name = os.path.splitext(os.path.basename(csv_path))[0]
+        return os.path.join(DEFAULT_CACHE_DIR, f"{name}_fifa{fifa_version:g}.estimates.json")
+    
+    @staticmethod
+    def _cache_path(csv_path: str, fifa_version: float) -> str:
+        """Cache file for a raw CSV and FIFA version."""
+        name = os.path.splitext(os.path.basename(csv_path))[0]
+        return os.path.join(DEFAULT_CACHE_DIR, f"{name}_fifa{fifa_version:g}.pkl")
+    
+    @staticmethod
+    def _cache_key(csv_path: str, fifa_version: float) -> str:
+        """
+        Key identifying the content a cache was built from.
+        
+        Covers the CSV content, the FIFA version, CACHE_VERSION and the source of the
+        modules that build the storage (including the pickled Team class and the
+        estimator's reference index), so any change to them invalidates the cache.
+        """
+        digest = hashlib.sha256()
+        digest.update(f"{CACHE_VERSION}:{fifa_version}".encode())
+        for path in (csv_path, __file__, _team_module.__file__, _elo_estimator_module.__file__,
+                     _elo_index_module.__file__):
+            with open(path, 'rb') as f:
+                for chunk in iter(lambda: f.read(1 << 20), b''):
+                    digest.update(chunk)
+        return digest.hexdigest()
+    
+    def _save_cache(self, cache_path: str, cache_key: str):
+        """Write the built storage and its ELO reference teams to the cache."""
+        snapshot = {
+            'version': CACHE_VERSION,
+            'key': cache_key,
+            'teams_by_name': self.teams_by_name,
+            'teams_by_league': self.teams_by_league,
+            'league_metadata': self.league_metadata,
+            'teams_with_estimated_elo': self._teams_with_estimated_elo,
+            'known_teams': self.estimator.known_teams,
+        }
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            # Write to a temporary file first so readers never see a partial cache
+            temp_path = f"{cache_path}.tmp"
+            with open(temp_path, 'wb') as f:
+                pickle.dump(snapshot, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, cache_path)
+        except OSError as e:
+            print(f"Warning: Could not write team storage cache: {e}")
+    
+    def _load_cache(self, cache_path: str, cache_key: str) -> bool:
+        """
+        Restore the storage from the cache.
+        
+        Returns:
+            bool: True if the cache exists and was built from the current sources
+        """
+        try:
+            with open(cache_path, 'rb') as f:
+                snapshot = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+            return False
+        
+        if not isinstance(snapshot, dict) or snapshot.get('version') != CACHE_VERSION \
+                or snapshot.get('key') != cache_key:
+            return False
+        
+        self.teams_by_name = snapshot['teams_by_name']
+        self.teams_by_league = snapshot['teams_by_league']
+        self.league_metadata = snapshot['league_metadata']
+        self._teams_with_estimated_elo = snapshot['teams_with_estimated_elo']
+        # Reference teams registered during the original build
+        for team_name, (elo, metrics) in snapshot['known_teams'].items():
+            self.estimator.add_known_team(team_name, elo, metrics)
+        self.refresh_indexes()
+        self._loaded_from_raw = True
+        self._complete.set()
+        return True
+    
+    def load_catalog(self, csv_path: str, fifa_version: float = 24.0) -> bool:
+        """
+        Load only the league catalog; league teams are read on first access.
+        
+        The catalog comes from the byte-offset sidecar index of the CSV (built on first
+        use). get_leagues_by_country and the other catalog queries answer from it, a
+        league's teams are loaded when requested with get_league_teams(league, country),
+        and queries over all teams wait for the full load (see start_background_fill).
+        
+        Args:
+            csv_path: Path to male_teams.csv file
+            fifa_version: FIFA version to filter by
+            
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        from core.storage.league_index import LeagueIndex
+        
+        try:
+            league_index = LeagueIndex.load_or_build(csv_path, fifa_version)
+        except Exception as e:
+            print(f"Error loading team data: {e}")
+            return False
+        
+        with self._lock:
+            self._complete.clear()
+            self.teams_by_name = {}
+            self.teams_by_league = {}
+            self.league_metadata = {}
+            self._teams_with_estimated_elo = set()
+            self._league_index = league_index
+            self._loaded_leagues.clear()
+            self._raw_source = (csv_path, fifa_version)
+            self._set_coach_source(csv_path)
+            self._loaded_from_raw = True
+        return True
+    
+    def start_background_fill(self):
+        """Load every team in a background thread after load_catalog."""
+        with self._lock:
+            if self._complete.is_set() or (self._fill_thread and self._fill_thread.is_alive()):
+                return
+            self._fill_thread = threading.Thread(target=self._fill, name='team-storage-fill', daemon=True)
+            self._fill_thread.start()
+    
+    def wait_until_loaded(self):
+        """Block until every team is loaded (starts the background fill if needed)."""
+        if self._complete.is_set():
+            return
+        self.start_background_fill()
+        self._complete.wait()
+    
+    def _fill(self):
+        """Background fill: build the complete storage and install it."""
+        full = TeamStorage(self.estimator, self.squad_strengths)
+        csv_path, fifa_version = self._raw_source
+        success = full.load_from_raw_data(csv_path, fifa_version)
+        with self._lock:
+            if success:
+                self._install(full)
+            # Never leave waiters blocked, even if the full load failed
+            self._complete.set()
+    
+    def _install(self, full: 'TeamStorage'):
+        """Swap in a complete storage, keeping the Team objects of leagues already handed out."""
+        for league_name, country in self._loaded_leagues:
+            lazy_teams = self.teams_by_league[league_name][country]
+            full.teams_by_league.setdefault(league_name, {})[country] = lazy_teams
+            for team in lazy_teams:
+                current = full.teams_by_name.get(team.name)
+                if current is not None and current.league_info['league_name'] == league_name \
+                        and current.league_info['country'] == country:
+                    full.teams_by_name[team.name] = team
+        
+        self.teams_by_name = full.teams_by_name
+        self.teams_by_league = full.teams_by_league
+        self.league_metadata = full.league_metadata
+        self._teams_with_estimated_elo = full._teams_with_estimated_elo
+        self._loaded_leagues.clear()
+        self._league_index = None
+        if self._apply_rating_overrides(self.teams_by_name.values()):
+            self._calculate_league_averages()
+        self.refresh_indexes()
+    
+    def build_replacement(self) -> Optional['TeamStorage']:
+        """
+        Build a complete copy of this storage from its raw data, off to the side.
+        
+        The copy has its own ELO estimator and the current rating overrides, so it
+        can be updated without touching the storage in use (see stage_replacement).
+        
+        Returns:
+            The new storage, None if nothing was loaded from raw data or loading failed
+        """
+        with self._lock:
+            if self._raw_source is None:
+                return None
+            csv_path, fifa_version = self._raw_source
+            replacement = TeamStorage(ELOEstimator(), self.squad_strengths)
+            replacement.rating_overrides = dict(self.rating_overrides)
+        if not replacement.load_from_raw_data(csv_path, fifa_version):
+            return None
+        return replacement
+    
+    def stage_replacement(self, replacement: 'TeamStorage'):
+        """Keep a storage built with build_replacement until swap_pending installs it."""
+        with self._lock:
+            self._pending = replacement
+    
+    def has_pending(self) -> bool:
+        """Whether a replacement storage is waiting for swap_pending."""
+        return self._pending is not None
+    
+    def swap_pending(self) -> bool:
+        """
+        Install the staged replacement storage, if any.
+        
+        Call it where no team lookups are in flight (e.g. between matches): the
+        replacement's teams, indexes, estimator and overrides replace this storage's
+        in one step under the lock. Team objects already handed out are not changed.
+        
+        Returns:
+            bool: True if a replacement was installed
+        """
+        with self._lock:
+            replacement, self._pending = self._pending, None
+            if replacement is None:
+                return False
+            # A lazy fill still running would install the outdated data over it
+            if not self._complete.is_set():
+                self._pending = replacement
+                return False
+            self.estimator = replacement.estimator
+            self.teams_by_name = replacement.teams_by_name
+            self.teams_by_league = replacement.teams_by_league
+            self.league_metadata = replacement.league_metadata
+            self.columns = replacement.columns
+            self.search_index = replacement.search_index
+            self.coach_by_team = replacement.coach_by_team
+            self.teams_by_coach = replacement.teams_by_coach
+            self._teams_with_estimated_elo = replacement._teams_with_estimated_elo
+            self.rating_overrides = replacement.rating_overrides
+            self._rating_originals = replacement._rating_originals
+            self._estimate_cache = replacement._estimate_cache
+            self._raw_source = replacement._raw_source
+            self._league_index = None
+            self._loaded_leagues.clear()
+            self._loaded_from_raw = True
+        return True
+    
+    def _ensure_league(self, league_name: str, country: str):
+        """Load one league from the byte-offset index if it is not loaded yet."""
+        if self._complete.is_set():
+            return
+        with self._lock:
+            if self._complete.is_set() or (league_name, country) in self._loaded_leagues:
+                return
+            entry = self._league_index.entry(league_name, country)
+            if entry is None:
+                return
+            if not entry['estimated_count']:
+                teams = self.teams_by_league.setdefault(league_name, {}).setdefault(country, [])
+                for record in self._league_index.read_records(league_name, country):
+                    if not record.valid:
+                        continue
+                    team = self._make_team(record, self._calculate_elo_from_overall(record.overall))
+                    self.teams_by_name[record.team_name] = team
+                    teams.append(team)
+                self.league_metadata.setdefault(league_name, {})[country] = {
+                    'team_count': entry['team_count'],
+                    'avg_rating': entry['avg_rating'],
+                    'league_level': entry['league_level']
+                }
+                self._apply_squad_strengths(teams, self._raw_source[1])
+                if self._apply_rating_overrides(teams):
+                    self._calculate_league_average(league_name, country)
+                self._loaded_leagues.add((league_name, country))
+                return
+        # Estimated ELOs need every reference team: wait for the full load
+        self.wait_until_loaded()
+    
+    def _catalog_entries(self) -> Iterator[Tuple[str, str, dict]]:
+        """(league_name, country, catalog entry) while in lazy mode."""
+        for (league_name, country), entry in self._league_index.leagues.items():
+            if entry['team_count']:
+                yield league_name, country, entry
+    
     def get_team(self, team_name: str) -> Optional[Team]:
         """Get team by name - O(1) lookup."""
+        self.wait_until_loaded()
         return self.teams_by_name.get(team_name)
     
     def get_league_teams(self, league_name: str, country: str = None) -> List[Team]:
         """Get all teams from a specific league/country."""
+        if country:
+            self._ensure_league(league_name, country)
+        else:
+            self.wait_until_loaded()
+        
         if league_name not in self.teams_by_league:
             return []
         
@@ -229,6 +887,12 @@ class TeamStorage:
             List of (league_name, country, team_count) tuples
         """
         leagues = []
+        if not self._complete.is_set():
+            for league_name, country, entry in self._catalog_entries():
+                if entry['team_count'] > 10:
+                    leagues.append((league_name, country, entry['team_count']))
+            return sorted(leagues, key=lambda x: (-x[2], x[0], x[1]))
+        
         for league_name, countries in self.teams_by_league.items():
             for country, teams in countries.items():
                 if len(teams) > 10:  # Only leagues with sufficient teams
@@ -245,6 +909,15 @@ class TeamStorage:
         """
         leagues_by_country = {}
         
+        if not self._complete.is_set():
+            for league_name, country, entry in self._catalog_entries():
+                if entry['team_count'] > 10:
+                    leagues_by_country.setdefault(country, []).append(
+                        (league_name, entry['team_count'], entry['estimated_count'] > 0))
+            for country in leagues_by_country:
+                leagues_by_country[country].sort(key=lambda x: (-x[1], x[0]))
+            return dict(sorted(leagues_by_country.items()))
+        
         for league_name, countries in self.teams_by_league.items():
             for country, teams in countries.items():
                 if len(teams) > 10:  # Only leagues with sufficient teams
@@ -264,43 +937,143 @@ class TeamStorage:
     
     def has_estimated_elo_teams(self, league_name: str, country: str) -> bool:
         """Check if a league has teams with estimated ELO."""
+        if not self._complete.is_set():
+            return self.get_estimated_elo_count(league_name, country) > 0
         teams = self.get_league_teams(league_name, country)
         return any(team.name in self._teams_with_estimated_elo for team in teams)
     
     def get_estimated_elo_count(self, league_name: str, country: str) -> int:
         """Get count of teams with estimated ELO in a league."""
+        if not self._complete.is_set():
+            entry = self._league_index.entry(league_name, country)
+            return entry['estimated_count'] if entry else 0
         teams = self.get_league_teams(league_name, country)
         return sum(1 for team in teams if team.name in self._teams_with_estimated_elo)
     
-    def get_random_teams(self, count: int, min_rating: int = 0, max_rating: int = 100) -> List[Team]:
-        """Get random teams within rating range."""
-        import random
+    def refresh_indexes(self):
+        """Rebuild the columnar, search and coach indexes after teams were added, replaced or changed in place."""
+        self.columns = TeamColumns(self.teams_by_name.values())
+        self.search_index = TeamSearchIndex(self.teams_by_name.values())
+        self.coach_by_team = {}
+        self.teams_by_coach = {}
+        for team_name, team in self.teams_by_name.items():
+            coach_id = team.league_info.get('coach_id')
+            if coach_id is not None:
+                self.coach_by_team[team_name] = coach_id
+                self.teams_by_coach.setdefault(coach_id, []).append(team_name)
+    
+    @staticmethod
+    def _coach_csv_path(csv_path: str) -> Optional[str]:
+        """Coach CSV next to a team CSV (male_teams.csv -> male_coaches.csv), None if absent."""
+        directory, name = os.path.split(csv_path)
+        if 'teams' not in name:
+            return None
+        coach_path = os.path.join(directory, name.replace('teams', 'coaches'))
+        return coach_path if os.path.exists(coach_path) else None
+    
+    def _set_coach_source(self, csv_path: str):
+        """Point the lazy coach records at the coach CSV of a team CSV."""
+        coach_source = self._coach_csv_path(csv_path)
+        if coach_source != self._coach_source:
+            self._coach_source = coach_source
+            self._coaches = None
+    
+    def set_coaches(self, coaches: dict):
+        """Use already loaded coach records ({coach_id: CoachRecord}) instead of reading the coach CSV."""
+        with self._lock:
+            self._coaches = coaches
+    
+    def _coach_records(self) -> dict:
+        """Coach records by id, read from the coach CSV on first use."""
+        if self._coaches is None:
+            with self._lock:
+                if self._coaches is None:
+                    from core.storage.coach_storage import read_coaches
+                    
+                    coaches = {}
+                    if self._coach_source:
+                        try:
+                            coaches = read_coaches(self._coach_source)
+                        except OSError as e:
+                            print(f"Warning: Could not load coach data: {e}")
+                    self._coaches = coaches
+        return self._coaches
+    
+    def get_team_coach(self, team_name: str):
+        """
+        Get the coach of a team.
         
-        eligible_teams = [
-            team for team in self.teams_by_name.values()
-            if min_rating <= team.league_info.get('overall_rating', 50) <= max_rating
-        ]
+        Args:
+            team_name: Team name
+            
+        Returns:
+            CoachRecord, or None if the team or its coach is unknown
+        """
+        self.wait_until_loaded()
+        coach_id = self.coach_by_team.get(team_name)
+        if coach_id is None:
+            return None
+        return self._coach_records().get(coach_id)
+    
+    def get_coach_teams(self, coach_id: int) -> List[Team]:
+        """Get the teams coached by a coach."""
+        self.wait_until_loaded()
+        return [self.teams_by_name[team_name] for team_name in self.teams_by_coach.get(coach_id, ())]
+    
+    def get_random_teams(self, count: int, min_rating: int = 0, max_rating: int = 100,
+                         league_levels: List[int] = None, league_name: str = None,
+                         country: str = None) -> List[Team]:
+        """
+        Get random teams within rating range.
         
-        if len(eligible_teams) < count:
-            return eligible_teams
+        Args:
+            count: Number of teams
+            min_rating: Minimum overall rating (inclusive)
+            max_rating: Maximum overall rating (inclusive)
+            league_levels: Only teams from these league levels
+            league_name: Only teams from this league
+            country: Only teams from this country
+            
+        Returns:
+            List of distinct teams, all eligible teams if fewer than count match
+        """
+        self.wait_until_loaded()
+        eligible = self.columns.mask(min_rating, max_rating, league_levels, league_name, country)
+        return self.columns.sample(count, eligible)
+    
+    def sample_teams(self, count: int, min_rating: float = None, max_rating: float = None,
+                     country: str = None, league_levels: List[int] = None,
+                     exclude: Set[str] = frozenset()) -> List[Team]:
+        """
+        Draw distinct random teams from a rating band, country or league level.
         
-        return random.sample(eligible_teams, count)
+        Args:
+            count: Number of teams
+            min_rating: Minimum overall rating (inclusive)
+            max_rating: Maximum overall rating (inclusive)
+            country: Only teams from this country
+            league_levels: Only teams from these league levels
+            exclude: Names of teams that must not be drawn (e.g. teams already in a league)
+            
+        Returns:
+            Up to count distinct teams, fewer only if the stratum has fewer eligible teams
+        """
+        self.wait_until_loaded()
+        return self.columns.draw(count, min_rating, max_rating, league_levels, country=country, exclude=exclude)
     
     def search_teams(self, query: str, limit: int = 20) -> List[Team]:
-        """Search teams by name (case insensitive)."""
-        query_lower = query.lower()
-        matches = []
-        
-        for team_name, team in self.teams_by_name.items():
-            if query_lower in team_name.lower():
-                matches.append(team)
-                if len(matches) >= limit:
-                    break
+        """
+        Search teams by name, accent and case insensitive, best matches first.
         
-        return matches
+        Exact names rank first, then name prefixes, word prefixes, substrings
+        and fuzzy matches (see core.storage.team_search).
+        """
+        self.wait_until_loaded()
+        return self.search_index.search(query, limit)
     
     def get_statistics(self) -> dict:
         """Get storage statistics."""
+        self.wait_until_loaded()
         return {
             'total_teams': len(self.teams_by_name),
             'total_leagues': len(self.teams_by_league),
@@ -353,61 +1126,48 @@ class TeamStorage:
             # Return default ELO for any invalid input
             return 1500.0
     
-    def _create_team_metrics(self, row: dict, team_name: str, league_name: str, country: str) -> TeamMetrics:
-        """Create TeamMetrics object from CSV row data."""
-        def safe_float(value, default=None):
-            try:
-                return float(value) if value and str(value).strip() else default
-            except (ValueError, TypeError):
-                return default
-        
-        def safe_int(value, default=None):
-            try:
-                return int(value) if value and str(value).strip() else default
-            except (ValueError, TypeError):
-                return default
-        
-        return TeamMetrics(
-            overall=safe_float(row.get('overall')),
-            attack=safe_float(row.get('attack')),
-            midfield=safe_float(row.get('midfield')),
-            defence=safe_float(row.get('defence')),
-            international_prestige=safe_float(row.get('international_prestige')),
-            domestic_prestige=safe_float(row.get('domestic_prestige')),
-            club_worth_eur=safe_float(row.get('club_worth_eur')),
-            transfer_budget_eur=safe_float(row.get('transfer_budget_eur')),
-            league_level=safe_int(row.get('league_level')),
-            team_name=team_name,
-            league_name=league_name,
-            country=country
-        )
-
     def _calculate_league_averages(self):
         """Calculate average ratings for each league."""
         for league_name, countries in self.teams_by_league.items():
-            for country, teams in countries.items():
-                if teams:
-                    avg_rating = sum(team.league_info['overall_rating'] for team in teams) / len(teams)
-                    self.league_metadata[league_name][country]['avg_rating'] = round(avg_rating, 1)
+            for country in countries:
+                self._calculate_league_average(league_name, country)
+    
+    def _calculate_league_average(self, league_name: str, country: str):
+        """Calculate the average rating of one league."""
+        teams = self.teams_by_league.get(league_name, {}).get(country)
+        meta = self.league_metadata.get(league_name, {}).get(country)
+        if teams and meta is not None:
+            avg_rating = sum(team.league_info['overall_rating'] for team in teams) / len(teams)
+            meta['avg_rating'] = round(avg_rating, 1)
+
+
+DEFAULT_RAW_CSV_PATH = os.path.join(os.path.dirname(__file__), '..', '..', 'assets', 'raw', 'male_teams.csv')
 
 
 # Global team storage instance
 team_storage = TeamStorage()
 
 
-def initialize_team_storage(csv_path: str = None) -> bool:
+def initialize_team_storage(csv_path: str = None, lazy: bool = False) -> bool:
     """
     Initialize the global team storage system.
     
     Args:
         csv_path: Path to raw team data, defaults to assets/raw/male_teams.csv
+        lazy: Load only the league catalog now, league teams on selection and
+            all teams in the background
         
     Returns:
         bool: True if successful
     """
     if csv_path is None:
-        import os
-        csv_path = os.path.join(os.path.dirname(__file__), '..', '..', 'assets', 'raw', 'male_teams.csv')
+        csv_path = DEFAULT_RAW_CSV_PATH
+    
+    if lazy:
+        if not team_storage.load_catalog(csv_path):
+            return False
+        team_storage.start_background_fill()
+        return True
     
     return team_storage.load_from_raw_data(csv_path)
 
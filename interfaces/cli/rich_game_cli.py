@@ -13,8 +13,8 @@ from interfaces.cli.rich_interface_simple import SimpleRichInterface
 from interfaces.cli.user_input import promotion_and_relegation
 import interfaces.cli.user_input as ti
 from utils.json_save_system import GameData
-from core.storage.team_storage import initialize_team_storage
-from core.storage.data_updater import check_and_update_data
+from core.storage.team_storage import initialize_team_storage, team_storage
+from core.storage.data_updater import start_background_update
 import json
 import os
 
@@ -50,15 +50,23 @@ class RichFFM:
     def _initialize_team_storage(self):
         """Initialize the optimized team storage system if raw data is available."""
         try:
-            success = initialize_team_storage()
+            # Catalog now, selected league on demand, everything else in the background
+            success = initialize_team_storage(lazy=True)
         except Exception:
             pass
             
     def _check_weekly_updates(self):
-        """Check for and perform weekly team rating updates."""
+        """Start the weekly team rating check and update in the background."""
         try:
-            update_performed = check_and_update_data(show_progress=False)
-            if update_performed:
+            # The updated teams are swapped in between matches (see _apply_pending_update)
+            start_background_update()
+        except Exception:
+            pass
+            
+    def _apply_pending_update(self):
+        """Install team ratings updated in the background, if an update finished."""
+        try:
+            if team_storage.swap_pending():
                 self.ui.console.print("📈 Team ratings have been updated with latest data", style="green")
         except Exception:
             pass
@@ -71,6 +79,7 @@ class RichFFM:
     def _main_menu_loop(self):
         """Main menu loop with Rich UI."""
         while True:
+            self._apply_pending_update()
             command = self.ui.display_main_menu()
             
             if command == "help":
@@ -311,6 +320,9 @@ class RichFFM:
         # Clear screen for clean display
         self.ui.console.clear()
         
+        # Between match days: no match is reading team data
+        self._apply_pending_update()
+        
         # Display current standings
         my_team_idx = self.league.get_my_team_index()
         self.ui.display_league_table(self.league, my_team_idx)
@@ -617,31 +629,18 @@ class RichFFM:
                     if team:
                         existing_team_names.add(team.name)
                 
-                # Generate unique teams
-                new_teams = []
-                attempts = 0
-                max_attempts = relegated_count * 10  # Prevent infinite loops
-                
-                while len(new_teams) < relegated_count and attempts < max_attempts:
-                    if use_elite:
-                        # Get elite teams
-                        candidate_teams = team_storage.get_random_teams(relegated_count * 2, min_rating=85, max_rating=100)
-                        if not candidate_teams:
-                            # Fill with good teams if no elite teams available
-                            candidate_teams = team_storage.get_random_teams(relegated_count * 2, min_rating=75, max_rating=84)
-                    else:
-                        # Get mixed quality teams
-                        candidate_teams = team_storage.get_random_teams(relegated_count * 2)
-                    
-                    # Filter out existing teams and already selected teams
-                    selected_names = {team.name for team in new_teams}
-                    for team in candidate_teams:
-                        if (team.name not in existing_team_names and 
-                            team.name not in selected_names and 
-                            len(new_teams) < relegated_count):
-                            new_teams.append(team)
-                    
-                    attempts += 1
+                # Draw unique teams not already in the league
+                if use_elite:
+                    new_teams = team_storage.sample_teams(relegated_count, min_rating=85, max_rating=100,
+                                                          exclude=existing_team_names)
+                    if len(new_teams) < relegated_count:
+                        # Fill with good teams if not enough elite teams are available
+                        new_teams.extend(team_storage.sample_teams(relegated_count - len(new_teams),
+                                                                   min_rating=75, max_rating=84,
+                                                                   exclude=existing_team_names))
+                else:
+                    # Get mixed quality teams
+                    new_teams = team_storage.sample_teams(relegated_count, exclude=existing_team_names)
                 
                 # Add the new teams to promoted_teams list
                 for team in new_teams:
@@ -4,7 +4,7 @@ from utils import screen as su
 from tabulate import tabulate
 
 from core.entities.team import Team
-from stats.gamestats import FootballStatistics
+from stats.gamestats import get_football_statistics
 from core.storage.team_storage import team_storage
 
 
@@ -65,7 +65,7 @@ def existing_league(skip_teams=False):
     return _select_country_then_league(skip_teams)
   else:
     # Fallback to original system
-    stats = FootballStatistics()
+    stats = get_football_statistics()
     available_leagues = []
     for country in stats.countries():
       for league in stats.leagues(country):
@@ -147,12 +147,12 @@ def random_teams():
     if top100:
       teams = [
         Team(name=y['Club'], elo=y['Elo'])
-        for _, y in FootballStatistics().get_top_teams().items()
+        for _, y in get_football_statistics().get_top_teams().items()
       ]
     else:
       teams = [
         Team(name=y['Club'], elo=y['Elo'])
-        for y in FootballStatistics().get_teams()
+        for y in get_football_statistics().get_teams()
       ]
     random.shuffle(teams)
     teams = teams[:number_teams]
@@ -0,0 +1,153 @@
+"""
+Conditional, Streaming clubelo.com Fetcher
+
+This module downloads the daily club ELO ratings of clubelo.com for
+FootballStatistics:
+
+- The response body is parsed as it streams in, row by row, into the
+  {country: {level: {club: {'Rank', 'Elo'}}}} layout of the leagues data; no
+  temporary CSV file is written
+- Requests are conditional: the ETag and Last-Modified of the previous response
+  are sent back (If-None-Match / If-Modified-Since), and a 304 reuses the parsed
+  result cached from that response
+- The parsed result and its validators are cached in a JSON file, so an
+  unchanged feed is never parsed twice
+"""
+
+import csv
+import json
+import os
+from datetime import date, datetime
+from typing import Dict, Iterable, Optional, Tuple
+
+import requests
+
+
+CLUBELO_URL = 'http://api.clubelo.com/'
+CACHE_FORMAT = 1
+
+
+def parse_clubelo_rows(lines: Iterable[str], country_codes: Dict[str, str]) -> Dict[str, Dict[str, dict]]:
+    """
+    Parse clubelo CSV lines (Rank,Club,Country,Level,Elo,...) into leagues data.
+
+    Rows of countries missing from country_codes are skipped, and an unranked club
+    ('None') gets rank -1. Rows with an invalid rank or ELO are skipped and reported
+    once, with the first of them.
+
+    Args:
+        lines: CSV lines, header first (any iterable, e.g. a streamed response)
+        country_codes: Country name by clubelo country code
+
+    Returns:
+        {country: {level: {club: {'Rank': rank, 'Elo': elo}}}}
+    """
+    data: Dict[str, Dict[str, dict]] = {}
+    skipped = 0
+    first_skipped = None
+    for row in csv.DictReader(lines):
+        club = row.get('Club')
+        country = country_codes.get(row.get('Country'))
+        if not club or country is None:
+            continue
+        try:
+            rank = -1 if row['Rank'] == 'None' else int(row['Rank'])
+            record = {'Rank': rank, 'Elo': float(row['Elo'])}
+        except (KeyError, TypeError, ValueError):
+            skipped += 1
+            first_skipped = first_skipped or row
+            continue
+        data.setdefault(country, {}).setdefault(row['Level'], {})[club] = record
+    if skipped:
+        print(f"Warning: Skipped {skipped} clubelo rows with an invalid rank or ELO, first: {first_skipped}")
+    return data
+
+
+class ClubEloFetcher:
+    """Conditional clubelo.com downloads with a cache of the parsed result."""
+
+    def __init__(self, cache_path: str, country_codes: Dict[str, str], base_url: str = CLUBELO_URL,
+                 timeout: float = 10.0, session: requests.Session = None):
+        """
+        Args:
+            cache_path: JSON file holding the parsed result and its validators
+            country_codes: Country name by clubelo country code
+            base_url: Feed URL, the date (YYYY-MM-DD) is appended
+            timeout: Connect and read timeout in seconds
+            session: HTTP session, reused across fetches (a new one if None)
+        """
+        self.cache_path = cache_path
+        self.country_codes = country_codes
+        self.base_url = base_url
+        self.timeout = timeout
+        self.session = session or requests.Session()
+        self._cache: Optional[dict] = None
+
+    def url(self, day: date = None) -> str:
+        return self.base_url + str(day or date.today())
+
+    def _load_cache(self) -> dict:
+        if self._cache is None:
+            self._cache = {}
+            try:
+                with open(self.cache_path, 'r', encoding='utf-8') as f:
+                    cache = json.load(f)
+                if cache.get('format') == CACHE_FORMAT:
+                    self._cache = cache
+            except (OSError, ValueError):
+                pass
+        return self._cache
+
+    def _save_cache(self, cache: dict):
+        self._cache = cache
+        try:
+            temp_path = f"{self.cache_path}.tmp"
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(cache, f, separators=(',', ':'))
+            os.replace(temp_path, self.cache_path)
+        except OSError as e:
+            print(f"Warning: Could not write clubelo cache: {e}")
+
+    def cached(self) -> Optional[Dict[str, Dict[str, dict]]]:
+        """Parsed result of the last downloaded response, None if nothing is cached."""
+        return self._load_cache().get('data')
+
+    def fetch(self, day: date = None) -> Optional[Tuple[Dict[str, Dict[str, dict]], bool]]:
+        """
+        Download the ratings of a day, unless they did not change since the last download.
+
+        Args:
+            day: Day of the ratings, today if None
+
+        Returns:
+            (leagues data, modified) where modified is False when the server answered
+            304 and the cached result is returned; None if the request failed
+        """
+        url = self.url(day)
+        cache = self._load_cache()
+        headers = {}
+        # Validators only apply to the resource they came from
+        if cache.get('url') == url and cache.get('data') is not None:
+            if cache.get('etag'):
+                headers['If-None-Match'] = cache['etag']
+            if cache.get('last_modified'):
+                headers['If-Modified-Since'] = cache['last_modified']
+
+        try:
+            with self.session.get(url, headers=headers, stream=True, timeout=self.timeout) as response:
+                if response.status_code == 304 and headers:
+                    cache['fetched_at'] = datetime.now().isoformat()
+                    self._save_cache(cache)
+                    return cache['data'], False
+                response.raise_for_status()
+                response.encoding = response.encoding or 'utf-8'
+                data = parse_clubelo_rows(response.iter_lines(decode_unicode=True), self.country_codes)
+                validators = {'etag': response.headers.get('ETag'),
+                              'last_modified': response.headers.get('Last-Modified')}
+        except (requests.RequestException, UnicodeDecodeError, csv.Error) as e:
+            print(f"Warning: Could not download clubelo ratings: {e}")
+            return None
+
+        self._save_cache({'format': CACHE_FORMAT, 'url': url, **validators,
+                          'fetched_at': datetime.now().isoformat(), 'data': data})
+        return data, True
@@ -1,9 +1,8 @@
-import csv
-import requests
 import os
-from datetime import date
 import time
 
+from stats.clubelo import ClubEloFetcher, parse_clubelo_rows
+from stats.league_store import LeagueStore
 from utils.database import SaveFile
 
 
@@ -17,25 +16,25 @@ class FootballStatistics:
                code_file='countrycodes.csv',
                data_file='leagues.dat',
                elo_csv='elo.csv',
-               maximum_data_age_seconds=604800):
+               maximum_data_age_seconds=604800,
+               fetcher=None,
+               store_file=None):
     """
     Initialise the instance reading the leagues data and updating the data file if a file called elo.csv is present
+
+    When the data file is older than maximum_data_age_seconds the clubelo ratings are
+    downloaded with a conditional request (see stats.clubelo); an unchanged feed only
+    refreshes the data file age. fetcher defaults to a ClubEloFetcher caching its
+    parsed result next to the data file.
+
+    The leagues data is kept in an indexed store (see stats.league_store), by default
+    the data file name with a .npy extension; a pickled data file (leagues.dat) newer
+    than the store is migrated to it.
     """
 
-    new_data = {}
     country_codes = {}
     self.__relegation_zones = {}
 
-    data_age = (int(time.time()) - os.stat(data_file).st_mtime)
-    get_new_data = data_age > maximum_data_age_seconds
-
-    if get_new_data:
-      url = 'http://api.clubelo.com/' + str(date.today())
-      r = requests.get(url)
-      with open(elo_csv, 'wb') as output_file:
-        output_file.write(r.content)
-      print("\nTeam statistics aligned with real life\n")
-
     with open(code_file, 'r') as file:
       Lines = file.readlines()
     for line in Lines:
@@ -47,67 +46,83 @@ class FootballStatistics:
             relegation_zone)
       except:
         pass
-    self.__datafile = SaveFile(data_file)
-    self.__data = self.__datafile.read_state('__leagues')
-    if not self.__data:
-      self.__data = {}
+    if store_file is None:
+      store_file = os.path.splitext(data_file)[0] + '.npy'
+    self.__store = self.__load_store(data_file, store_file)
+
     try:
-      # read the new data and merge it (not in this block)
+      data_age = int(time.time()) - os.stat(store_file).st_mtime
+    except OSError:
+      data_age = maximum_data_age_seconds + 1
+    new_data = {}
+    result = None
+    if data_age > maximum_data_age_seconds:
+      if fetcher is None:
+        cache_path = os.path.join(os.path.dirname(os.path.abspath(data_file)), 'clubelo_cache.json')
+        fetcher = ClubEloFetcher(cache_path, country_codes)
+      result = fetcher.fetch()
+      if result is not None:
+        new_data, modified = result
+        if modified:
+          print("\nTeam statistics aligned with real life\n")
+        elif len(self.__store) and os.path.exists(store_file):
+          # Unchanged since the last download: already merged
+          new_data = {}
+          os.utime(store_file)
+    if result is None and os.path.exists(elo_csv):
+      # manually placed ratings (or no connection)
       with open(elo_csv, 'r') as file:
-        reader = csv.DictReader(file)
-        for row in reader:
-          if row:
-            team = dict(row)
-            if team['Club'] and team['Country'] in country_codes:
-              country = country_codes[team['Country']]
-              try:
-                if team['Rank'] == 'None':
-                  rank = -1
-                else:
-                  rank = int(team['Rank'])
-                record = {'Rank': rank, 'Elo': float(team['Elo'])}
-                if country in new_data:
-                  try:
-                    new_data[country][team['Level']][team['Club']] = record
-                  except:
-                    new_data[country][team['Level']] = {team['Club']: record}
-                else:
-                  new_data[country] = {}
-                  new_data[country][team['Level']] = {team['Club']: record}
-              except:
-                print('error')
-                pass
-    except:
-      # no updated data is available
-      pass
-    if get_new_data:
-      os.remove(elo_csv)
+        new_data = parse_clubelo_rows(file, country_codes)
+
     if len(new_data) > 0:
-      for country in new_data:
-        self.__data[country] = {}
-        for level in new_data[country]:
-          try:
-            _ = self.__data[country][level]
-          except:
-            self.__data[country][level] = {}
-          for team in new_data[country][level]:
-            self.__data[country][level][team] = new_data[country][level][team]
-      self.__datafile.write_state('__leagues', self.__data)
+      # countries in the new data replace their previous levels
+      data = self.__store.to_leagues()
+      data.update(new_data)
+      self.__store = LeagueStore.from_leagues(data)
+      self.__store.save(store_file)
+
+  @staticmethod
+  def __load_store(data_file, store_file):
+    """
+    Map the indexed store, migrating the pickled data file if it is newer
+    """
+    try:
+      store_mtime = os.stat(store_file).st_mtime
+    except OSError:
+      store_mtime = None
+    try:
+      data_mtime = os.stat(data_file).st_mtime
+    except OSError:
+      data_mtime = None
+
+    if store_mtime is not None and (data_mtime is None or store_mtime >= data_mtime):
+      store = LeagueStore.load(store_file)
+      if store is not None:
+        return store
+    if data_mtime is None:
+      return LeagueStore.from_leagues({})
+
+    store = LeagueStore.from_leagues(SaveFile(data_file).read_state('__leagues') or {})
+    try:
+      store.save(store_file)
+      # the migrated data is as old as the data file it came from
+      os.utime(store_file, (data_mtime, data_mtime))
+    except OSError:
+      pass
+    return store
 
   def countries(self):
-    return self.__data.keys()
+    return self.__store.countries()
 
   def leagues(self, country):
-    try:
-      return self.__data[country].keys()
-    except:
-      return None
+    levels = self.__store.levels(country)
+    return levels if levels else None
 
   def teams(self, country, level):
-    try:
-      return self.__data[country][level]
-    except:
+    clubs = self.__store.level_clubs(country, level)
+    if clubs is None:
       return None
+    return {club: {'Rank': rank, 'Elo': elo} for club, rank, elo in clubs}
 
   def relegation(self, country):
     try:
@@ -120,43 +135,27 @@ class FootballStatistics:
     Extract teams form the retrieved elo database
     lvl and elo ate the threshold used to select the teams
     """
-    teams = []
-    for country in self.__data:
-      for level in self.__data[country]:
-        for team in self.__data[country][level]:
-          try:
-            if int(level
-                   ) <= lvl and self.__data[country][level][team]['Elo'] > elo:
-              teamStat = {
-                'Club': team,
-                'Rank': self.__data[country][level][team]['Rank'],
-                'Elo': self.__data[country][level][team]['Elo']
-              }
-              teams.append(teamStat)
-          except:
-            pass
-    return teams
+    return [{'Club': club, 'Rank': rank, 'Elo': team_elo}
+            for club, rank, team_elo in self.__store.above(lvl, elo)]
 
   def get_top_teams(self, top=1, bottom=100):
     """
     Extract the teams between the top and bottom rankings
     """
-    teams = {}
     if top < 1:
       top = 1
-    for country in self.__data:
-      for level in self.__data[country]:
-        for team in self.__data[country][level]:
-          try:
-            if self.__data[country][level][team]['Rank'] != -1 and self.__data[
-                country][level][team]['Rank'] <= bottom and self.__data[
-                  country][level][team]['Rank'] >= top:
-              teamStat = {
-                'Club': team,
-                'Rank': self.__data[country][level][team]['Rank'],
-                'Elo': self.__data[country][level][team]['Elo']
-              }
-              teams[self.__data[country][level][team]['Rank']] = teamStat
-          except:
-            pass
-    return {k: v for k, v in sorted(teams.items(), key=lambda item: item[0])}
+    return {rank: {'Club': club, 'Rank': rank, 'Elo': elo}
+            for club, rank, elo in self.__store.rank_range(top, bottom)}
+
+
+_shared_statistics = None
+
+
+def get_football_statistics():
+  """
+  Shared FootballStatistics instance, created (and its data refreshed) on first use
+  """
+  global _shared_statistics
+  if _shared_statistics is None:
+    _shared_statistics = FootballStatistics()
+  return _shared_statistics
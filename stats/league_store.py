@@ -0,0 +1,166 @@
+"""
+Indexed League Store
+
+This module keeps the clubelo leagues data of FootballStatistics (country ->
+level -> club -> rank and ELO) as one NumPy structured array with precomputed
+indexes, saved as a .npy file and memory-mapped on load:
+
+- Records are grouped by country and level in the order of the source data, so a
+  level's clubs are one contiguous slice
+- by_rank / rank_sorted: record order by rank and the ranks in that order, so the
+  clubs of a rank range are found by bisection (unranked clubs have rank -1)
+- by_elo / level_sorted / elo_sorted: record order by level then ELO, so the clubs
+  of a level above an ELO threshold are a bisection per level
+
+Rank-range and threshold queries are O(log n + k) for k results, and loading only
+maps the file.
+"""
+
+import os
+from bisect import bisect_left, bisect_right
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+
+# Fields of the stored array, checked on load (a layout change makes old files unreadable)
+STORE_FIELDS = ('club', 'country', 'level', 'rank', 'elo',
+                'by_rank', 'rank_sorted', 'by_elo', 'level_sorted', 'elo_sorted')
+
+
+class LeagueStore:
+    """Clubs with rank and ELO by country and level, indexed by rank and by level and ELO."""
+
+    def __init__(self, records: np.ndarray):
+        self.records = records
+        # Field views, taken once (fields of a structured array are strided, so the
+        # indexes are bisected element-wise rather than copied by np.searchsorted)
+        self._clubs, self._ranks, self._elos = records['club'], records['rank'], records['elo']
+        self._by_rank, self._rank_sorted = records['by_rank'], records['rank_sorted']
+        self._by_elo, self._level_sorted, self._elo_sorted = \
+            records['by_elo'], records['level_sorted'], records['elo_sorted']
+        # (country, level) -> (start, end) of its records; built on first use
+        self._groups: Optional[Dict[Tuple[str, int], Tuple[int, int]]] = None
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    @classmethod
+    def from_leagues(cls, leagues: Dict[str, Dict[str, dict]]) -> 'LeagueStore':
+        """
+        Build a store from the nested leagues data.
+
+        Args:
+            leagues: {country: {level: {club: {'Rank': rank, 'Elo': elo}}}}; levels
+                that are not integers are left out
+
+        Returns:
+            LeagueStore
+        """
+        rows = []
+        for country, levels in leagues.items():
+            for level, clubs in levels.items():
+                try:
+                    level_number = int(level)
+                except (TypeError, ValueError):
+                    continue
+                for club, record in clubs.items():
+                    rows.append((club, country, level_number, int(record['Rank']), float(record['Elo'])))
+
+        club_width = max([len(row[0]) for row in rows] + [1])
+        country_width = max([len(row[1]) for row in rows] + [1])
+        records = np.zeros(len(rows), dtype=[
+            ('club', f'U{club_width}'), ('country', f'U{country_width}'),
+            ('level', 'i2'), ('rank', 'i4'), ('elo', 'f8'),
+            ('by_rank', 'i4'), ('rank_sorted', 'i4'), ('by_elo', 'i4'), ('level_sorted', 'i2'), ('elo_sorted', 'f8'),
+        ])
+        if rows:
+            records['club'], records['country'], records['level'], records['rank'], records['elo'] = zip(*rows)
+        # Stable sorts: equal keys stay in source order
+        records['by_rank'] = np.argsort(records['rank'], kind='stable')
+        records['rank_sorted'] = records['rank'][records['by_rank']]
+        records['by_elo'] = np.lexsort((records['elo'], records['level']))
+        records['level_sorted'] = records['level'][records['by_elo']]
+        records['elo_sorted'] = records['elo'][records['by_elo']]
+        return cls(records)
+
+    @classmethod
+    def load(cls, path: str) -> Optional['LeagueStore']:
+        """Memory-map a saved store, None if the file is missing or has another layout."""
+        try:
+            records = np.load(path, mmap_mode='r', allow_pickle=False)
+        except (OSError, ValueError):
+            return None
+        if records.dtype.names != STORE_FIELDS:
+            return None
+        # Still backed by the mapping, without the per-access overhead of np.memmap
+        return cls(records.view(np.ndarray))
+
+    def save(self, path: str):
+        """Write the store (through a temporary file, so readers never map a partial one)."""
+        temp_path = f"{path}.tmp.npy"
+        np.save(temp_path, np.ascontiguousarray(self.records), allow_pickle=False)
+        os.replace(temp_path, path)
+
+    def to_leagues(self) -> Dict[str, Dict[str, dict]]:
+        """The nested leagues data (see from_leagues), levels as strings."""
+        leagues: Dict[str, Dict[str, dict]] = {}
+        for (country, level), (start, end) in self._level_groups().items():
+            leagues.setdefault(country, {})[str(level)] = {
+                club: {'Rank': rank, 'Elo': elo} for club, rank, elo in self._rows(np.arange(start, end))}
+        return leagues
+
+    def _level_groups(self) -> Dict[Tuple[str, int], Tuple[int, int]]:
+        if self._groups is None:
+            countries, levels = self.records['country'], self.records['level']
+            changes = np.flatnonzero((countries[1:] != countries[:-1]) | (levels[1:] != levels[:-1])) + 1
+            bounds = [0] + changes.tolist() + [len(self.records)]
+            self._groups = {(str(countries[start]), int(levels[start])): (start, end)
+                            for start, end in zip(bounds[:-1], bounds[1:]) if end > start}
+        return self._groups
+
+    def _rows(self, indices) -> List[Tuple[str, int, float]]:
+        """(club, rank, ELO) of records, gathered one column at a time."""
+        indices = np.asarray(indices, dtype=np.intp)
+        return list(zip(self._clubs[indices].tolist(), self._ranks[indices].tolist(), self._elos[indices].tolist()))
+
+    def countries(self) -> List[str]:
+        return list(dict.fromkeys(country for country, _ in self._level_groups()))
+
+    def levels(self, country: str) -> List[str]:
+        """Levels of a country as strings, empty if the country is unknown."""
+        return [str(level) for group_country, level in self._level_groups() if group_country == country]
+
+    def level_clubs(self, country: str, level) -> Optional[List[Tuple[str, int, float]]]:
+        """(club, rank, ELO) of a country's level in source order, None if there is no such level."""
+        try:
+            bounds = self._level_groups().get((country, int(level)))
+        except (TypeError, ValueError):
+            return None
+        if bounds is None:
+            return None
+        return self._rows(np.arange(*bounds))
+
+    def rank_range(self, top: int, bottom: int) -> List[Tuple[str, int, float]]:
+        """(club, rank, ELO) of the ranked clubs with top <= rank <= bottom, by rank."""
+        start = bisect_left(self._rank_sorted, max(top, 0))
+        end = bisect_right(self._rank_sorted, bottom)
+        return self._rows(self._by_rank[start:end])
+
+    def above(self, max_level: int, min_elo: float) -> List[Tuple[str, int, float]]:
+        """
+        (club, rank, ELO) of the clubs with level <= max_level and ELO > min_elo.
+
+        Returns:
+            Clubs by level, then by ascending ELO
+        """
+        level_sorted, elo_sorted = self._level_sorted, self._elo_sorted
+        selected = []
+        start = 0
+        # One bisection per level up to max_level
+        while start < len(level_sorted) and level_sorted[start] <= max_level:
+            end = bisect_right(level_sorted, level_sorted[start], start)
+            first = bisect_right(elo_sorted, min_elo, start, end)
+            selected.append(self._by_elo[first:end])
+            start = end
+        return self._rows(np.concatenate(selected) if selected else ())
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Background Swap Test Script
+
+Checks how a team storage updated in the background replaces the storage in use:
+
+- build_replacement gives a complete storage with its own ELO estimator and a copy
+  of the rating overrides, None if nothing was loaded from raw data
+- swap_pending installs a staged replacement (teams, indexes, estimator and
+  overrides) in one step; Team objects handed out before keep their values
+- swap_pending refuses to swap while a lazy fill is running and keeps the staged
+  replacement until the fill has finished
+- DataUpdater.start_background_update builds, updates and stages a replacement
+  without touching the storage in use
+
+Usage:
+    python tests/background_swap_test.py
+"""
+
+import sys
+import os
+import random
+import shutil
+import tempfile
+
+# Add parent directory to path so we can import from core/
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.storage.data_updater import DataUpdater
+from core.storage.elo_estimator import ELOEstimator
+from core.storage.team_storage import DEFAULT_RAW_CSV_PATH, TeamStorage, initialize_team_storage, team_storage
+
+SEED = 5
+
+
+def check(results, name, condition):
+    results.append((name, bool(condition)))
+    print(f"   {'✅' if condition else '❌'} {name}")
+
+
+def rated_teams(storage, count):
+    return [team for team in storage.teams_by_name.values() if team.league_info.get('overall_rating')][:count]
+
+
+def run_tests(temp_dir):
+    results = []
+
+    print("🏗️  Replacement")
+    check(results, "nothing to rebuild without raw data", TeamStorage(ELOEstimator()).build_replacement() is None)
+    storage = TeamStorage(ELOEstimator(), squad_strengths=False)
+    storage.load_from_raw_data(DEFAULT_RAW_CSV_PATH)
+    overridden, updated = rated_teams(storage, 2)
+    override = min(overridden.league_info['overall_rating'] + 6, 95)
+    storage.apply_rating_updates({overridden.name: override})
+    replacement = storage.build_replacement()
+    check(results, "complete copy with its own estimator", replacement is not None
+          and replacement.estimator is not storage.estimator
+          and set(replacement.teams_by_name) == set(storage.teams_by_name)
+          and replacement.get_team(updated.name) is not updated)
+    check(results, "overrides copied and applied", replacement.rating_overrides == storage.rating_overrides
+          and replacement.rating_overrides is not storage.rating_overrides
+          and replacement.get_team(overridden.name).league_info['overall_rating'] == override)
+
+    new_overall = min(updated.league_info['overall_rating'] + 8, 95)
+    original = (updated.league_info['overall_rating'], updated.elo)
+    replacement.apply_rating_updates({updated.name: new_overall})
+    check(results, "updating the replacement leaves the storage in use", storage.get_team(updated.name) is updated
+          and (updated.league_info['overall_rating'], updated.elo) == original
+          and updated.name not in storage.rating_overrides)
+
+    print("🔁 Swap")
+    check(results, "nothing pending", not storage.has_pending() and not storage.swap_pending())
+    storage.stage_replacement(replacement)
+    check(results, "staged", storage.has_pending() and storage.get_team(updated.name) is updated)
+    check(results, "swapped", storage.swap_pending() and not storage.has_pending())
+    check(results, "teams, indexes and estimator of the replacement",
+          storage.teams_by_name is replacement.teams_by_name and storage.columns is replacement.columns
+          and storage.search_index is replacement.search_index and storage.estimator is replacement.estimator
+          and storage.rating_overrides == {overridden.name: override, updated.name: new_overall})
+    check(results, "queries answer with the new ratings",
+          storage.get_team(updated.name).league_info['overall_rating'] == new_overall
+          and replacement.get_team(updated.name) in storage.search_teams(updated.name))
+    check(results, "handed-out teams unchanged", (updated.league_info['overall_rating'], updated.elo) == original)
+
+    print("⏳ Lazy fill")
+    lazy = TeamStorage(ELOEstimator(), squad_strengths=False)
+    lazy.load_catalog(DEFAULT_RAW_CSV_PATH)
+    league_name, country = updated.league_info['league_name'], updated.league_info['country']
+    handed_out = next(team for team in lazy.get_league_teams(league_name, country) if team.name == updated.name)
+    replacement = lazy.build_replacement()
+    replacement.apply_rating_updates({updated.name: new_overall})
+    lazy.stage_replacement(replacement)
+    # The fill is not started, so it counts as running until wait_until_loaded
+    check(results, "no swap while the fill is running", not lazy.swap_pending() and lazy.has_pending()
+          and lazy.estimator is not replacement.estimator)
+    lazy.wait_until_loaded()
+    check(results, "swapped once the fill finished", lazy.swap_pending() and not lazy.has_pending()
+          and lazy.teams_by_name is replacement.teams_by_name
+          and lazy.get_team(updated.name).league_info['overall_rating'] == new_overall)
+    check(results, "lazily handed-out team unchanged", handed_out.league_info['overall_rating'] == original[0]
+          and lazy.get_team(updated.name) is not handed_out)
+
+    print("🔄 Data updater")
+    initialize_team_storage(lazy=True)
+    team_storage.wait_until_loaded()
+    in_use = dict(team_storage.teams_by_name)
+    elos = {name: team.elo for name, team in in_use.items()}
+    updater = DataUpdater(data_dir=temp_dir)
+    random.seed(SEED)
+    updater.start_background_update()
+    check(results, "update finished", updater.wait_for_background_update(120))
+    check(results, "replacement staged", team_storage.has_pending())
+    check(results, "swapped between matches", team_storage.swap_pending()
+          and team_storage.teams_by_name is not in_use and set(team_storage.teams_by_name) == set(in_use))
+    check(results, "updated ratings installed", any(team.elo != elos[name]
+                                                    for name, team in team_storage.teams_by_name.items()))
+    check(results, "teams in use unchanged", all(team.elo == elos[name] for name, team in in_use.items()))
+    return results
+
+
+def main():
+    print("🧪 Background swap test")
+    temp_dir = tempfile.mkdtemp(prefix="ffm_background_swap_")
+    try:
+        results = run_tests(temp_dir)
+    finally:
+        shutil.rmtree(temp_dir)
+
+    passed = sum(1 for _, ok in results if ok)
+    print(f"\n📋 {passed}/{len(results)} checks passed")
+    return 0 if passed == len(results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Backup Store Test Script
+
+Checks the content-addressed backup store and the backups of DataUpdater:
+
+- A snapshot streams back the records it was created with, and a JSON backup
+  restored from it imports into another store as the same snapshot (once)
+- Unchanged records are stored once: a second snapshot only adds the changed ones
+- prune keeps the most recent snapshots and gc removes the objects only pruned
+  snapshots used, and only those
+- DataUpdater imports a legacy teams_backup_*.json once, even after retention
+  pruned its snapshot
+
+Usage:
+    python tests/backup_store_test.py
+"""
+
+import sys
+import os
+import json
+import shutil
+import tempfile
+from datetime import datetime, timedelta
+
+# Add parent directory to path so we can import from core/
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.entities.team import Team
+from core.storage.backup_store import BackupStore
+from core.storage.data_updater import DataUpdater
+from core.storage.elo_estimator import ELOEstimator
+from core.storage.team_storage import TeamStorage
+
+LEGACY_BACKUP = 'teams_backup_20250725_183203.json'
+
+
+def check(results, name, condition):
+    results.append((name, bool(condition)))
+    print(f"   {'✅' if condition else '❌'} {name}")
+
+
+def make_records(count, changed=()):
+    return [(f"Team {i}", {'name': f"Team {i}", 'elo': 1500 + i + (7 if i in changed else 0),
+                           'league_info': {'league_name': 'Test League', 'country': 'Testland'}})
+            for i in range(count)]
+
+
+def run_tests(temp_dir):
+    results = []
+    start = datetime(2025, 1, 1, 12, 0, 0)
+
+    print("💾 Round trip")
+    store = BackupStore(os.path.join(temp_dir, 'store'))
+    records = make_records(20)
+    first = store.create_snapshot(records, start)
+    check(results, "snapshot id from the timestamp", first == '20250101_120000')
+    check(results, "records streamed back in order", list(store.iter_snapshot(first)) == records)
+    check(results, "snapshot header", store.snapshot_info(first)['team_count'] == 20)
+
+    backup_file = os.path.join(temp_dir, 'restored.json')
+    store.restore(first, backup_file)
+    with open(backup_file, 'r', encoding='utf-8') as f:
+        backup = json.load(f)
+    check(results, "restored JSON backup", backup['team_count'] == 20 and backup['teams'] == dict(records))
+    other = BackupStore(os.path.join(temp_dir, 'other'))
+    imported = other.import_json_backup(backup_file)
+    check(results, "JSON backup imported", imported == first and list(other.iter_snapshot(imported)) == records)
+    check(results, "JSON backup imported once", other.import_json_backup(backup_file) is None)
+
+    print("🧬 Deduplication")
+    objects = store.get_statistics()['objects']
+    check(results, "one object per distinct record", objects == 20)
+    second = store.create_snapshot(make_records(20, changed={3, 4}), start + timedelta(days=7))
+    check(results, "second snapshot adds only changed records", store.get_statistics()['objects'] == 22)
+    check(results, "same-second snapshot gets a suffix",
+          store.create_snapshot(make_records(20, changed={3, 4}), start + timedelta(days=7)) == second + '_2')
+
+    print("🧹 Prune and gc")
+    deleted = store.prune(2)
+    check(results, "oldest snapshot pruned", deleted == [first] and store.snapshots() == [second, second + '_2'])
+    check(results, "objects of pruned snapshot collected", store.get_statistics()['objects'] == 20)
+    check(results, "kept snapshots intact",
+          list(store.iter_snapshot(second)) == make_records(20, changed={3, 4}))
+    orphan = store.put_object({'name': 'Orphan'})
+    check(results, "gc removes unreferenced objects only", store.gc() == 1
+          and not os.path.exists(store._object_path(orphan)) and store.get_statistics()['objects'] == 20)
+    check(results, "nothing to collect", store.gc() == 0)
+
+    print("🗄️  DataUpdater backups")
+    data_dir = os.path.join(temp_dir, 'data')
+    updater = DataUpdater(data_dir=data_dir)
+    updater.backup_retention = 2
+    legacy_source = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                 'assets', 'data', 'backups', LEGACY_BACKUP)
+    shutil.copy2(legacy_source, os.path.join(updater.backup_dir, LEGACY_BACKUP))
+    imports = []
+    import_json_backup = updater.backup_store.import_json_backup
+    updater.backup_store.import_json_backup = lambda path: imports.append(path) or import_json_backup(path)
+
+    storage = TeamStorage(ELOEstimator())
+    for name, record in make_records(10):
+        storage.teams_by_name[name] = Team(name, record['elo'])
+    created = [updater._create_backup(storage) for _ in range(4)]
+    check(results, "backups created", all(created))
+    check(results, "legacy backup imported once", len(imports) == 1)
+    check(results, "retention applied", len(updater.backup_store.snapshots()) == 2
+          and LEGACY_BACKUP[len('teams_backup_'):-len('.json')] not in updater.backup_store.snapshots())
+    check(results, "statistics count objects only", updater.backup_store.get_statistics()['objects'] == 10)
+    return results
+
+
+def main():
+    print("🧪 Backup store test")
+    temp_dir = tempfile.mkdtemp(prefix="ffm_backup_store_")
+    try:
+        results = run_tests(temp_dir)
+    finally:
+        shutil.rmtree(temp_dir)
+
+    passed = sum(1 for _, ok in results if ok)
+    print(f"\n📋 {passed}/{len(results)} checks passed")
+    return 0 if passed == len(results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+clubelo Fetcher Test Script
+
+Runs the clubelo fetcher and FootballStatistics against a local stub HTTP server
+serving a clubelo-style CSV with an ETag and a Last-Modified date:
+
+- A first fetch downloads and parses the streamed body and caches the result
+- A second fetch sends If-None-Match / If-Modified-Since, gets a 304 and returns
+  the cached result without a body
+- A changed feed (new ETag) is downloaded and parsed again
+- A new fetcher instance reads the cached validators from disk
+- A server error leaves the cache untouched and returns None
+- FootballStatistics merges the downloaded ratings into its league store, and a
+  stale store with an unchanged feed only has its age refreshed
+
+Usage:
+    python tests/clubelo_fetcher_test.py
+"""
+
+import sys
+import os
+import shutil
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+# Add parent directory to path so we can import from core/
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from stats.clubelo import ClubEloFetcher
+from stats.gamestats import FootballStatistics
+
+COUNTRY_CODES = {'ENG': 'England', 'ITA': 'Italy'}
+FEED_V1 = (
+    "Rank,Club,Country,Level,Elo,From,To\n"
+    "1,Man City,ENG,1,2050.5,2024-01-01,2024-01-31\n"
+    "2,Inter,ITA,1,1980.0,2024-01-01,2024-01-31\n"
+    "None,Reading,ENG,3,1400.0,2024-01-01,2024-01-31\n"
+    "3,Bayern,GER,1,1990.0,2024-01-01,2024-01-31\n"
+)
+FEED_V2 = FEED_V1.replace("2050.5", "2060.0")
+
+
+class StubFeed:
+    """Feed state served by the stub server and the requests it received."""
+
+    def __init__(self):
+        self.body = FEED_V1
+        self.etag = '"v1"'
+        self.last_modified = 'Mon, 01 Jan 2024 00:00:00 GMT'
+        self.status = 200
+        self.requests = []  # (path, If-None-Match, If-Modified-Since, response status)
+
+
+def make_handler(feed):
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if_none_match = self.headers.get('If-None-Match')
+            if_modified_since = self.headers.get('If-Modified-Since')
+            if feed.status != 200:
+                status = feed.status
+            elif if_none_match == feed.etag or (if_none_match is None and if_modified_since == feed.last_modified):
+                status = 304
+            else:
+                status = 200
+            feed.requests.append((self.path, if_none_match, if_modified_since, status))
+            self.send_response(status)
+            self.send_header('ETag', feed.etag)
+            self.send_header('Last-Modified', feed.last_modified)
+            if status == 200:
+                body = feed.body.encode('utf-8')
+                self.send_header('Content-Type', 'text/csv; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+            else:
+                self.send_header('Content-Length', '0')
+                self.end_headers()
+
+        def log_message(self, format, *args):
+            pass
+
+    return Handler
+
+
+def check(results, name, condition):
+    results.append((name, bool(condition)))
+    print(f"   {'✅' if condition else '❌'} {name}")
+
+
+def run_tests(base_url, feed, temp_dir):
+    results = []
+    cache_path = os.path.join(temp_dir, 'clubelo_cache.json')
+
+    print("🌐 Fetcher")
+    fetcher = ClubEloFetcher(cache_path, COUNTRY_CODES, base_url=base_url)
+    data, modified = fetcher.fetch()
+    check(results, "first fetch downloads", modified and feed.requests[-1][3] == 200)
+    check(results, "rows parsed into leagues data",
+          data == {'England': {'1': {'Man City': {'Rank': 1, 'Elo': 2050.5}},
+                               '3': {'Reading': {'Rank': -1, 'Elo': 1400.0}}},
+                   'Italy': {'1': {'Inter': {'Rank': 2, 'Elo': 1980.0}}}})
+    check(results, "unknown country codes skipped", 'Germany' not in data)
+
+    cached, modified = fetcher.fetch()
+    path, if_none_match, if_modified_since, status = feed.requests[-1]
+    check(results, "validators sent", if_none_match == '"v1"' and if_modified_since == feed.last_modified)
+    check(results, "unchanged feed answers 304 with cached data", status == 304 and not modified and cached == data)
+
+    check(results, "validators persisted", ClubEloFetcher(cache_path, COUNTRY_CODES, base_url=base_url).fetch()[1]
+          is False)
+
+    feed.body, feed.etag = FEED_V2, '"v2"'
+    data, modified = fetcher.fetch()
+    check(results, "changed feed downloaded again",
+          modified and data['England']['1']['Man City']['Elo'] == 2060.0)
+
+    feed.status = 500
+    check(results, "server error returns None", fetcher.fetch() is None)
+    check(results, "cache kept after error", fetcher.cached() == data)
+    feed.status = 200
+
+    print("📊 FootballStatistics")
+    code_file = os.path.join(temp_dir, 'countrycodes.csv')
+    with open(code_file, 'w') as f:
+        f.write("ENG,england,4\nITA,italy,3\n")
+    data_file = os.path.join(temp_dir, 'leagues.dat')
+    store_file = os.path.join(temp_dir, 'leagues.npy')
+    stats_cache = os.path.join(temp_dir, 'stats_cache.json')
+    elo_csv = os.path.join(temp_dir, 'elo.csv')
+
+    stats = FootballStatistics(code_file, data_file, elo_csv,
+                               fetcher=ClubEloFetcher(stats_cache, COUNTRY_CODES, base_url=base_url))
+    check(results, "missing store is downloaded", set(stats.countries()) == {'England', 'Italy'})
+    check(results, "teams by level", stats.teams('England', '1') == {'Man City': {'Rank': 1, 'Elo': 2060.0}})
+    check(results, "top teams", [t['Club'] for t in stats.get_top_teams().values()] == ['Man City', 'Inter'])
+    check(results, "relegation zones", stats.relegation('England') == 4)
+
+    os.utime(store_file, (0, 0))
+    request_count = len(feed.requests)
+    stats = FootballStatistics(code_file, data_file, elo_csv,
+                               fetcher=ClubEloFetcher(stats_cache, COUNTRY_CODES, base_url=base_url))
+    check(results, "stale store sends a conditional request",
+          len(feed.requests) == request_count + 1 and feed.requests[-1][3] == 304)
+    check(results, "store age refreshed on 304", os.stat(store_file).st_mtime > 0)
+    check(results, "data kept on 304", stats.teams('Italy', '1') == {'Inter': {'Rank': 2, 'Elo': 1980.0}})
+
+    request_count = len(feed.requests)
+    FootballStatistics(code_file, data_file, elo_csv,
+                       fetcher=ClubEloFetcher(stats_cache, COUNTRY_CODES, base_url=base_url))
+    check(results, "fresh store sends no request", len(feed.requests) == request_count)
+    return results
+
+
+def main():
+    print("🧪 clubelo fetcher test")
+    feed = StubFeed()
+    server = HTTPServer(('127.0.0.1', 0), make_handler(feed))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    temp_dir = tempfile.mkdtemp(prefix="ffm_clubelo_")
+    try:
+        results = run_tests(f"http://127.0.0.1:{server.server_port}/", feed, temp_dir)
+    finally:
+        server.shutdown()
+        server.server_close()
+        shutil.rmtree(temp_dir)
+
+    passed = sum(1 for _, ok in results if ok)
+    print(f"\n📋 {passed}/{len(results)} checks passed")
+    return 0 if passed == len(results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Coach Index Test Script
+
+Checks the team/coach join index of TeamStorage:
+
+- coach_by_team and teams_by_coach match the coach_id column of the raw CSV
+- A coach of several teams lists all of them; teams without a coach or with a
+  coach missing from the coach CSV have no coach record
+- Coach records are read from the coach CSV next to the team CSV on first request
+- The index is the same after a load from the storage cache
+
+Usage:
+    python tests/coach_index_test.py
+"""
+
+import sys
+import os
+import csv
+import shutil
+import tempfile
+
+# Add parent directory to path so we can import from core/
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.storage.elo_estimator import ELOEstimator
+from core.storage.team_storage import DEFAULT_RAW_CSV_PATH, TeamStorage, initialize_team_storage, team_storage
+
+COACH_HEADER = ['coach_id', 'coach_url', 'short_name', 'long_name', 'dob', 'nationality_name', 'coach_face_url',
+                'nation_flag_url']
+
+
+def check(results, name, condition):
+    results.append((name, bool(condition)))
+    print(f"   {'✅' if condition else '❌'} {name}")
+
+
+def make_row(header, **values):
+    defaults = {'fifa_version': '24.0', 'league_name': 'Test League', 'league_level': '1',
+                'nationality_name': 'Testland', 'overall': '70', 'attack': '70', 'midfield': '70',
+                'defence': '70', 'international_prestige': '5', 'domestic_prestige': '5',
+                'transfer_budget_eur': '1000000', 'club_worth_eur': '50000000', 'home_stadium': 'Ground'}
+    defaults.update(values)
+    return [str(defaults.get(name, '')) for name in header]
+
+
+def scan_coaches(csv_path, team_names):
+    """Coach id per team name from the raw CSV (the last row of a name wins)."""
+    coaches = {}
+    with open(csv_path, 'r', encoding='utf-8', newline='') as f:
+        for row in csv.DictReader(f):
+            if row['team_name'] in team_names and float(row['fifa_version']) == 24.0 and row['coach_id']:
+                coaches[row['team_name']] = int(float(row['coach_id']))
+    return coaches
+
+
+def run_tests(temp_dir):
+    results = []
+    with open(DEFAULT_RAW_CSV_PATH, 'r', encoding='utf-8', newline='') as f:
+        header = next(csv.reader(f))
+
+    print("🧾 Join index")
+    csv_path = os.path.join(temp_dir, 'test_teams.csv')
+    with open(csv_path, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(header)
+        writer.writerows([
+            make_row(header, team_id=1, team_name='Alpha', coach_id='5.0'),
+            make_row(header, team_id=2, team_name='Beta', coach_id='5.0'),
+            make_row(header, team_id=3, team_name='Gamma', coach_id=''),
+            make_row(header, team_id=4, team_name='Delta', coach_id='9'),
+        ])
+    with open(os.path.join(temp_dir, 'test_coaches.csv'), 'w', encoding='utf-8', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(COACH_HEADER)
+        writer.writerow(['5', '', 'A. Coach', 'Arthur Coach', '1970-01-01', 'Testland', '', ''])
+
+    storage = TeamStorage(ELOEstimator(), squad_strengths=False)
+    storage.load_from_raw_data(csv_path, 24.0, use_cache=False)
+    check(results, "team to coach", storage.coach_by_team == {'Alpha': 5, 'Beta': 5, 'Delta': 9})
+    check(results, "coach to teams", storage.teams_by_coach == {5: ['Alpha', 'Beta'], 9: ['Delta']})
+    check(results, "coach records read on first request", storage._coaches is None
+          and storage.get_team_coach('Alpha').short_name == 'A. Coach' and storage._coaches is not None)
+    check(results, "teams of a coach", [team.name for team in storage.get_coach_teams(5)] == ['Alpha', 'Beta'])
+    check(results, "no coach", storage.get_team_coach('Gamma') is None and storage.get_team_coach('Nobody') is None)
+    check(results, "coach missing from the coach CSV", storage.get_team_coach('Delta') is None
+          and storage.get_coach_teams(9)[0].name == 'Delta')
+    check(results, "unknown coach", storage.get_coach_teams(12345) == [])
+
+    print("📄 Real CSV")
+    initialize_team_storage()
+    expected = scan_coaches(DEFAULT_RAW_CSV_PATH, set(team_storage.teams_by_name))
+    check(results, "team to coach matches the CSV", team_storage.coach_by_team == expected)
+    inverse = {}
+    for team_name, coach_id in expected.items():
+        inverse.setdefault(coach_id, set()).add(team_name)
+    check(results, "coach to teams is the inverse", {coach_id: set(names) for coach_id, names
+                                                     in team_storage.teams_by_coach.items()} == inverse)
+    team_name, coach_id = next(iter(expected.items()))
+    check(results, "coach record of a team", team_storage.get_team_coach(team_name).coach_id == coach_id)
+
+    uncached = TeamStorage(ELOEstimator())
+    uncached.load_from_raw_data(DEFAULT_RAW_CSV_PATH, 24.0, use_cache=False)
+    cached = TeamStorage(ELOEstimator())
+    cached.load_from_raw_data(DEFAULT_RAW_CSV_PATH, 24.0)
+    check(results, "same index after a cached load", cached.coach_by_team == uncached.coach_by_team
+          and cached.teams_by_coach == uncached.teams_by_coach)
+    return results
+
+
+def main():
+    print("🧪 Coach index test")
+    temp_dir = tempfile.mkdtemp(prefix="ffm_coaches_")
+    try:
+        results = run_tests(temp_dir)
+    finally:
+        shutil.rmtree(temp_dir)
+
+    passed = sum(1 for _, ok in results if ok)
+    print(f"\n📋 {passed}/{len(results)} checks passed")
+    return 0 if passed == len(results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
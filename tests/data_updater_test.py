@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Data Updater Test Script
+
+Checks the incremental EA Sports update path of DataUpdater:
+
+- diff_rows finds inserted, updated, deleted and unchanged rows (a later row with
+  the same key wins)
+- An update applies changed ratings through TeamStorage.apply_rating_updates and
+  journals one entry with the applied changes
+- Rows that were applied or rejected as too small a change keep their fingerprint;
+  rows of unknown teams or with an invalid overall rating do not, so they are
+  retried by the next update
+- Rows removed from the file revert their team to the rating and ELO of the team
+  data, and the overrides are restored onto a newly loaded storage
+
+Usage:
+    python tests/data_updater_test.py
+"""
+
+import sys
+import os
+import csv
+import json
+import shutil
+import tempfile
+
+# Add parent directory to path so we can import from core/
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.storage.data_updater import DataUpdater, diff_rows, row_fingerprint
+from core.storage.elo_estimator import ELOEstimator
+from core.storage.team_storage import DEFAULT_RAW_CSV_PATH, TeamStorage
+
+
+def check(results, name, condition):
+    results.append((name, bool(condition)))
+    print(f"   {'✅' if condition else '❌'} {name}")
+
+
+def write_feed(path, rows):
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=['team_name', 'overall'])
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def read_journal(updater):
+    with open(updater.journal_file, 'r', encoding='utf-8') as f:
+        return [json.loads(line) for line in f]
+
+
+def new_storage():
+    storage = TeamStorage(ELOEstimator())
+    storage.load_from_raw_data(DEFAULT_RAW_CSV_PATH)
+    return storage
+
+
+def run_tests(temp_dir):
+    results = []
+
+    print("🔍 diff_rows")
+    previous = {'A': row_fingerprint({'team_name': 'A', 'overall': '70'}),
+                'B': row_fingerprint({'team_name': 'B', 'overall': '71'}),
+                'C': row_fingerprint({'team_name': 'C', 'overall': '72'})}
+    rows = [{'team_name': 'A', 'overall': '70'}, {'team_name': 'B', 'overall': '60'},
+            {'team_name': 'D', 'overall': '65'}, {'team_name': 'D', 'overall': '66'}, {'team_name': ' ', 'overall': '1'}]
+    fingerprints, changed, inserted, deleted = diff_rows(rows, previous)
+    check(results, "unchanged row skipped", 'A' not in changed and fingerprints['A'] == previous['A'])
+    check(results, "updated and inserted rows", set(changed) == {'B', 'D'} and inserted == ['D'])
+    check(results, "later duplicate wins", changed['D']['overall'] == '66')
+    check(results, "deleted rows", deleted == ['C'])
+    check(results, "rows without a key ignored", set(fingerprints) == {'A', 'B', 'D'})
+
+    print("📥 Update")
+    storage = new_storage()
+    teams = [team for team in storage.teams_by_name.values() if team.league_info.get('overall_rating')][:3]
+    raised, kept, fixed = teams
+    originals = {team.name: (team.league_info['overall_rating'], team.elo) for team in teams}
+    new_overall = min(originals[raised.name][0] + 8, 95)
+    updater = DataUpdater(data_dir=temp_dir)
+    feed = os.path.join(temp_dir, 'ea_sports.csv')
+    write_feed(feed, [
+        {'team_name': raised.name, 'overall': new_overall},
+        {'team_name': kept.name, 'overall': originals[kept.name][0]},  # too small a change
+        {'team_name': fixed.name, 'overall': 'n/a'},                   # invalid, retried
+        {'team_name': 'Nowhere FC', 'overall': 70},                    # unknown, retried
+    ])
+    check(results, "update applied", updater._update_from_ea_sports_csv(feed, storage))
+    check(results, "rating and ELO updated", raised.league_info['overall_rating'] == new_overall
+          and raised.elo != originals[raised.name][1])
+    check(results, "override kept by the storage", storage.rating_overrides == {raised.name: new_overall})
+    state = updater._load_feed_state()
+    check(results, "fingerprints of applied and rejected rows only",
+          set(state['fingerprints']) == {raised.name, kept.name})
+    journal = read_journal(updater)
+    check(results, "one journal entry with the applied change", len(journal) == 1 and journal[0]['changes'] == [
+        {'team': raised.name, 'op': 'insert', 'overall': [originals[raised.name][0], new_overall]}])
+
+    write_feed(feed, [
+        {'team_name': raised.name, 'overall': new_overall},
+        {'team_name': kept.name, 'overall': originals[kept.name][0]},
+        {'team_name': fixed.name, 'overall': originals[fixed.name][0] + 8},
+        {'team_name': 'Nowhere FC', 'overall': 70},
+    ])
+    check(results, "skipped rows retried", updater._update_from_ea_sports_csv(feed, storage)
+          and fixed.league_info['overall_rating'] == originals[fixed.name][0] + 8)
+    journal = read_journal(updater)
+    check(results, "only retried rows in the second entry", len(journal) == 2
+          and journal[1]['inserted'] == 2 and journal[1]['updated'] == 0)
+
+    print("↩️  Revert")
+    write_feed(feed, [{'team_name': kept.name, 'overall': originals[kept.name][0]},
+                      {'team_name': fixed.name, 'overall': originals[fixed.name][0] + 8}])
+    check(results, "removed row reverted", updater._update_from_ea_sports_csv(feed, storage)
+          and (raised.league_info['overall_rating'], raised.elo) == originals[raised.name])
+    check(results, "override removed", raised.name not in storage.rating_overrides
+          and raised.name not in updater._load_feed_state()['overrides'])
+    check(results, "delete journaled", read_journal(updater)[-1]['changes'] == [
+        {'team': raised.name, 'op': 'delete', 'overall': [new_overall, None]}])
+
+    reloaded = new_storage()
+    check(results, "overrides restored on a new storage", updater.restore_rating_overrides(reloaded) == 1
+          and reloaded.get_team(fixed.name).league_info['overall_rating'] == originals[fixed.name][0] + 8
+          and reloaded.get_team(raised.name).league_info['overall_rating'] == originals[raised.name][0])
+    return results
+
+
+def main():
+    print("🧪 Data updater test")
+    temp_dir = tempfile.mkdtemp(prefix="ffm_data_updater_")
+    try:
+        results = run_tests(temp_dir)
+    finally:
+        shutil.rmtree(temp_dir)
+
+    passed = sum(1 for _, ok in results if ok)
+    print(f"\n📋 {passed}/{len(results)} checks passed")
+    return 0 if passed == len(results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Dataset Registry Test Script
+
+Checks the namespaced datasets loaded by DatasetRegistry:
+
+- Every dataset of both namespaces loads; the "male" namespace is the game's
+  global team and player storage
+- The "female" teams have their own ELO estimator, with only women's teams as
+  references, no squad strengths and the same teams and ELOs as a standalone load
+- The female player dump and the coaches of each namespace match their CSVs, and
+  the coach records are shared with the namespace's team storage
+- Loading a subset of namespaces or kinds, unknown kinds and missing files
+
+Usage:
+    python tests/dataset_registry_test.py
+"""
+
+import sys
+import os
+
+# Add parent directory to path so we can import from core/
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.storage.coach_storage import read_coaches
+from core.storage.dataset_registry import COACHES, PLAYERS, TEAMS, DatasetRegistry
+from core.storage.elo_estimator import ELOEstimator
+from core.storage.player_storage import RAW_DIR, _read_table, player_storage
+from core.storage.team_storage import TeamStorage, team_storage
+
+FEMALE_TEAMS = os.path.join(RAW_DIR, 'female_teams.csv')
+
+
+def check(results, name, condition):
+    results.append((name, bool(condition)))
+    print(f"   {'✅' if condition else '❌'} {name}")
+
+
+def run_tests():
+    results = []
+
+    print("📦 Namespaces")
+    registry = DatasetRegistry()
+    loaded = registry.load()
+    check(results, "every dataset loaded", loaded == {name: {TEAMS: True, PLAYERS: True, COACHES: True}
+                                                      for name in ('male', 'female')})
+    male, female = registry.namespace('male'), registry.namespace('female')
+    check(results, "male namespace is the game's storage", male.teams is team_storage
+          and male.players is player_storage)
+    check(results, "separate team storages", female.teams is not team_storage
+          and not set(female.teams.teams_by_name) & set(male.teams.teams_by_name))
+
+    print("👩 Female teams")
+    female_names = {record.team_name for record in TeamStorage._iter_team_records(FEMALE_TEAMS, 24.0)}
+    check(results, "own ELO estimator", female.teams.estimator is not male.teams.estimator)
+    check(results, "only women's teams as references", female.teams.estimator.known_teams
+          and set(female.teams.estimator.known_teams) <= female_names)
+    check(results, "no squad strengths", not any(team.league_info.get('strength_source') == 'squad'
+                                                 for team in female.teams.teams_by_name.values()))
+    standalone = TeamStorage(ELOEstimator(), squad_strengths=False)
+    standalone.load_from_raw_data(FEMALE_TEAMS, 24.0, use_cache=False)
+    check(results, "same teams and ELOs as a standalone load",
+          {name: team.elo for name, team in female.teams.teams_by_name.items()}
+          == {name: team.elo for name, team in standalone.teams_by_name.items()})
+    leagues = {team.league_info['league_name'] for team in female.teams.teams_by_name.values()}
+    check(results, "league names interned", all(
+        team.league_info['league_name'] is sys.intern(team.league_info['league_name'])
+        for team in female.teams.teams_by_name.values()) and leagues)
+
+    print("🧑‍🏫 Players and coaches")
+    dump = _read_table(os.path.join(RAW_DIR, 'female_players.csv'))
+    check(results, "female player dump", len(female.players.dumps['female_players']) == len(dump)
+          and female.players.data_dir is None)
+    check(results, "coach records per namespace",
+          female.coaches == read_coaches(os.path.join(RAW_DIR, 'female_coaches.csv'))
+          and male.coaches == read_coaches(os.path.join(RAW_DIR, 'male_coaches.csv')))
+    team_name, coach_id = next(iter(female.teams.coach_by_team.items()))
+    check(results, "coach records shared with the teams",
+          female.teams._coach_records() is female.coaches
+          and female.teams.get_team_coach(team_name) == female.coaches.get(coach_id))
+    statistics = registry.get_statistics()
+    check(results, "statistics", statistics['female']['teams'] == len(female.teams.teams_by_name)
+          and statistics['male']['coaches'] == len(male.coaches))
+
+    print("🎛️  Subsets and errors")
+    subset = DatasetRegistry()
+    check(results, "one namespace, one kind", subset.load(['female'], [TEAMS]) == {'female': {TEAMS: True}}
+          and subset.namespace('male') is None and subset.namespace('female').players is None)
+    try:
+        subset.register('female', 'stadiums', None)
+        check(results, "unknown kind rejected", False)
+    except ValueError:
+        check(results, "unknown kind rejected", True)
+    subset.register('female', TEAMS, os.path.join(RAW_DIR, 'missing_teams.csv'))
+    check(results, "missing file reported", subset.load(['female'], [TEAMS]) == {'female': {TEAMS: False}})
+    return results
+
+
+def main():
+    print("🧪 Dataset registry test")
+    results = run_tests()
+    passed = sum(1 for _, ok in results if ok)
+    print(f"\n📋 {passed}/{len(results)} checks passed")
+    return 0 if passed == len(results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+ELO Estimate Cache Test Script
+
+Checks the persistent ELO estimate cache:
+
+- Estimates are found again after a save and reload, keyed by the team's metrics
+  and the league context flag
+- A changed or added reference team invalidates the estimates of its league and of
+  the other leagues of its country, and no others
+- A file written by other estimator code is ignored
+- A warm team storage load estimates nothing and gives the ELOs of a load without
+  the cache; after a reference changed, only the teams of its country are
+  estimated again
+
+Usage:
+    python tests/elo_estimate_cache_test.py
+"""
+
+import sys
+import os
+import csv
+import dataclasses
+import json
+import shutil
+import tempfile
+
+# Add parent directory to path so we can import from core/
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.storage.elo_estimate_cache import ELOEstimateCache
+from core.storage.elo_estimator import ELOEstimator, TeamMetrics
+from core.storage.team_storage import DEFAULT_RAW_CSV_PATH, TeamStorage
+
+# (league, country) contexts; A and B share a country
+CONTEXTS = (('League A', 'Xland'), ('League B', 'Xland'), ('League C', 'Yland'))
+
+
+def check(results, name, condition):
+    results.append((name, bool(condition)))
+    print(f"   {'✅' if condition else '❌'} {name}")
+
+
+def metrics(name, league_name, country, overall=None, worth=10 ** 7):
+    return TeamMetrics(overall=overall, attack=65, midfield=66, defence=64, international_prestige=3,
+                       domestic_prestige=5, club_worth_eur=worth, league_level=1, team_name=name,
+                       league_name=league_name, country=country)
+
+
+def make_estimator():
+    estimator = ELOEstimator()
+    for league_name, country in CONTEXTS:
+        for i in range(4):
+            estimator.add_known_team(f"{league_name} {i}", 1400 + 40 * i,
+                                     metrics(f"{league_name} {i}", league_name, country, 60 + 3 * i))
+    return estimator
+
+
+def cached_contexts(cache, estimator, targets):
+    """Contexts whose target estimate is still cached."""
+    return {(target.league_name, target.country) for target in targets
+            if cache.get(estimator, target) is not None}
+
+
+def make_row(header, **values):
+    defaults = {'fifa_version': '24.0', 'league_level': '1', 'attack': '70', 'midfield': '70', 'defence': '70',
+                'international_prestige': '5', 'domestic_prestige': '5', 'transfer_budget_eur': '1000000',
+                'club_worth_eur': '50000000', 'home_stadium': 'Ground'}
+    defaults.update(values)
+    return [str(defaults.get(name, '')) for name in header]
+
+
+def write_csv(csv_path, header, reference_overall):
+    """Per context four rated teams and two teams without overall."""
+    rows = []
+    for c, (league_name, country) in enumerate(CONTEXTS):
+        for i in range(6):
+            overall = '' if i >= 4 else 60 + 3 * i
+            if (c, i) == (0, 0):
+                overall = reference_overall
+            rows.append(make_row(header, team_id=10 * c + i, team_name=f"{league_name} {i}", league_name=league_name,
+                                 nationality_name=country, overall=overall, club_worth_eur=10 ** 6 * (i + 5)))
+    with open(csv_path, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(header)
+        writer.writerows(rows)
+
+
+def load_storage(csv_path, cache_path=None):
+    """Storage built from the CSV, with the estimate cache at cache_path if given."""
+    storage = TeamStorage(ELOEstimator(), squad_strengths=False)
+    storage._estimate_cache = ELOEstimateCache(cache_path) if cache_path else None
+    storage.load_from_records(TeamStorage._iter_team_records(csv_path, 24.0))
+    return storage
+
+
+def run_tests(temp_dir):
+    results = []
+
+    print("💾 Round trip")
+    cache_path = os.path.join(temp_dir, 'estimates.json')
+    estimator = make_estimator()
+    targets = [metrics(f"{league_name} new", league_name, country) for league_name, country in CONTEXTS]
+    cache = ELOEstimateCache(cache_path)
+    for target in targets:
+        cache.put(estimator, target, estimator.estimate_elo(target))
+    cache.save()
+    cache = ELOEstimateCache(cache_path)
+    check(results, "estimates found after reload", all(cache.get(estimator, target) == estimator.estimate_elo(target)
+                                                        for target in targets) and cache.hits == len(targets))
+    check(results, "league context flag is part of the key", cache.get(estimator, targets[0], False) is None)
+    check(results, "changed metrics miss", cache.get(estimator, dataclasses.replace(targets[0], attack=80)) is None)
+
+    print("🧭 Per-context invalidation")
+    estimator.add_known_team('League A 0', 1555, metrics('League A 0', 'League A', 'Xland', 61))
+    check(results, "changed reference invalidates its country only",
+          cached_contexts(cache, estimator, targets) == {CONTEXTS[2]})
+    for target in targets[:2]:
+        cache.put(estimator, target, estimator.estimate_elo(target))
+    estimator.add_known_team('League C 9', 1480, metrics('League C 9', 'League C', 'Yland', 63))
+    check(results, "added reference invalidates its country only",
+          cached_contexts(cache, estimator, targets) == set(CONTEXTS[:2]))
+    estimator.add_known_team('League A 0', 1555, metrics('League A 0', 'League A', 'Xland', 61))
+    check(results, "rewriting the same reference keeps the estimates",
+          cached_contexts(cache, estimator, targets) == set(CONTEXTS[:2]))
+
+    cache.save()
+    with open(cache_path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    check(results, "dropped contexts not saved", set(data['contexts']) == {f"{league}\0{country}"
+                                                                          for league, country in CONTEXTS[:2]})
+    data['code'] = 'other estimator'
+    with open(cache_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f)
+    check(results, "other estimator code ignored", ELOEstimateCache(cache_path).get(estimator, targets[0]) is None)
+
+    print("🏟️  Team storage")
+    with open(DEFAULT_RAW_CSV_PATH, 'r', encoding='utf-8', newline='') as f:
+        header = next(csv.reader(f))
+    csv_path = os.path.join(temp_dir, 'teams.csv')
+    cache_path = os.path.join(temp_dir, 'teams.estimates.json')
+    write_csv(csv_path, header, 60)
+    cold = load_storage(csv_path, cache_path)
+    check(results, "cold load estimates every team", (cold._estimate_cache.hits, cold._estimate_cache.misses) == (0, 6))
+    warm = load_storage(csv_path, cache_path)
+    uncached = load_storage(csv_path)
+    check(results, "warm load estimates nothing", (warm._estimate_cache.hits, warm._estimate_cache.misses) == (6, 0))
+    check(results, "same ELOs as without the cache", {name: team.elo for name, team in warm.teams_by_name.items()}
+          == {name: team.elo for name, team in uncached.teams_by_name.items()})
+
+    write_csv(csv_path, header, 75)
+    changed = load_storage(csv_path, cache_path)
+    uncached = load_storage(csv_path)
+    check(results, "changed reference re-estimates its country only",
+          (changed._estimate_cache.hits, changed._estimate_cache.misses) == (2, 4))
+    check(results, "same ELOs as without the cache after the change",
+          {name: team.elo for name, team in changed.teams_by_name.items()}
+          == {name: team.elo for name, team in uncached.teams_by_name.items()})
+    return results
+
+
+def main():
+    print("🧪 ELO estimate cache test")
+    temp_dir = tempfile.mkdtemp(prefix="ffm_estimates_")
+    try:
+        results = run_tests(temp_dir)
+    finally:
+        shutil.rmtree(temp_dir)
+
+    passed = sum(1 for _, ok in results if ok)
+    print(f"\n📋 {passed}/{len(results)} checks passed")
+    return 0 if passed == len(results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
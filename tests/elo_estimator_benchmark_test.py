@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+"""
+ELO Estimator Accuracy and Throughput Benchmark
+
+Measures how accurate and how fast the ELO estimator is on real team data:
+
+- Teams of assets/raw/male_teams.csv with a valid overall rating get their ELO from
+  the overall (as at load time); a --hide fraction of them is held out
+- The remaining teams are the estimator's references; every held-out team is
+  estimated by each estimation method, the fallback, the full estimate_elo chain
+  and the batch estimate_elos
+- Per method: coverage (share of teams the method returns an estimate for), MAE and
+  RMSE against the overall-derived ELO, and estimates per second
+- Calibration: errors of estimate_elo grouped by get_estimation_confidence label
+
+--drop-overall also removes the overall rating of held-out teams, like the teams
+that really need estimation at load time (without it overall similarity recovers
+the held-out ELOs almost exactly).
+
+Results are printed as JSON (or written with --output). With --baseline the MAE and
+RMSE of every method are compared with a stored report (by default the one in
+tests/baselines recorded with the default settings, with or without --drop-overall
+as requested) and the exit code is 1 when
+any got worse by more than --tolerance ELO points; estimates per second are reported
+as ratios to the baseline (throughput depends on the machine). --save-baseline writes
+the report as the new baseline.
+
+Usage:
+    python tests/elo_estimator_benchmark_test.py
+    python tests/elo_estimator_benchmark_test.py --drop-overall --baseline
+    python tests/elo_estimator_benchmark_test.py --baseline
+    python tests/elo_estimator_benchmark_test.py --drop-overall --hide 0.3 --save-baseline my_baseline.json
+"""
+
+import sys
+import os
+import argparse
+import dataclasses
+import json
+import math
+import random
+import time
+
+# Add parent directory to path so we can import from core/
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.storage.elo_estimator import ELOEstimator
+from core.storage.team_storage import DEFAULT_RAW_CSV_PATH, TeamStorage
+
+BASELINE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baselines')
+# Baselines recorded with the default settings, with and without --drop-overall
+DEFAULT_BASELINE_PATH = os.path.join(BASELINE_DIR, 'elo_estimator_benchmark.json')
+DROP_OVERALL_BASELINE_PATH = os.path.join(BASELINE_DIR, 'elo_estimator_benchmark_drop_overall.json')
+# argparse value of --baseline / --save-baseline given without a path
+DEFAULT_BASELINE = 'default'
+CONFIDENCE_LABELS = ('high', 'medium', 'low')
+
+
+def load_teams(csv_path, fifa_version):
+    """(metrics, overall-derived ELO) of every team with a valid overall rating."""
+    storage = TeamStorage(ELOEstimator())
+    teams = []
+    for record in storage._iter_team_records(csv_path, fifa_version):
+        if record.overall is not None and 30 <= record.overall <= 100:
+            teams.append((storage._record_metrics(record), storage._calculate_elo_from_overall(record.overall)))
+    return teams
+
+
+def split_teams(teams, hide, seed, drop_overall):
+    """Estimator with the references added, and the held-out (metrics, true ELO) pairs."""
+    rng = random.Random(seed)
+    hidden = set(rng.sample(range(len(teams)), int(round(len(teams) * hide))))
+    estimator = ELOEstimator()
+    targets = []
+    for index, (metrics, elo) in enumerate(teams):
+        if index in hidden:
+            target = dataclasses.replace(metrics, overall=None) if drop_overall else metrics
+            targets.append((target, elo))
+        else:
+            estimator.add_known_team(metrics.team_name, elo, metrics)
+    return estimator, targets
+
+
+def error_stats(errors):
+    """MAE and RMSE of a list of errors, None when empty."""
+    if not errors:
+        return {'mae': None, 'rmse': None}
+    return {
+        'mae': round(sum(abs(e) for e in errors) / len(errors), 2),
+        'rmse': round(math.sqrt(sum(e * e for e in errors) / len(errors)), 2),
+    }
+
+
+def run_method(estimate, targets):
+    """Run one estimation function over all targets and measure accuracy and speed."""
+    start = time.perf_counter()
+    estimates = estimate([metrics for metrics, _ in targets])
+    elapsed = time.perf_counter() - start
+
+    errors = [estimated - elo for estimated, (_, elo) in zip(estimates, targets)
+              if estimated and 1000 <= estimated <= 2000]
+    return {
+        'coverage': round(len(errors) / len(targets), 4) if targets else 0.0,
+        **error_stats(errors),
+        'estimates_per_second': round(len(targets) / elapsed, 1) if elapsed > 0 else None,
+    }, estimates
+
+
+def per_team(method, league_context):
+    """Per-team estimation method as a function of the target list (None on errors)."""
+    def estimate(targets):
+        estimates = []
+        for metrics in targets:
+            try:
+                estimates.append(method(metrics, league_context))
+            except Exception:
+                estimates.append(None)
+        return estimates
+    return estimate
+
+
+def run_benchmark(args):
+    teams = load_teams(args.csv, args.fifa_version)
+    estimator, targets = split_teams(teams, args.hide, args.seed, args.drop_overall)
+    context = not args.no_league_context
+
+    methods = [
+        ('overall_similarity', per_team(estimator._estimate_by_overall_similarity, context)),
+        ('multi_metric_similarity', per_team(estimator._estimate_by_multi_metric_similarity, context)),
+        ('league_context', per_team(estimator._estimate_by_league_context, context)),
+        ('prestige_similarity', per_team(estimator._estimate_by_prestige_similarity, context)),
+        ('fallback', lambda ts: [estimator._get_fallback_elo(m) for m in ts]),
+        ('estimate_elo', lambda ts: [estimator.estimate_elo(m, context) for m in ts]),
+        ('estimate_elos', lambda ts: estimator.estimate_elos(ts, context)),
+    ]
+    results = {}
+    chain_estimates = None
+    for name, estimate in methods:
+        results[name], estimates = run_method(estimate, targets)
+        if name == 'estimate_elo':
+            chain_estimates = estimates
+
+    # Calibration: errors of the full chain by confidence label
+    calibration = {}
+    for label in CONFIDENCE_LABELS:
+        errors = [estimated - elo for estimated, (metrics, elo) in zip(chain_estimates, targets)
+                  if estimator.get_estimation_confidence(metrics) == label]
+        calibration[label] = {'teams': len(errors), **error_stats(errors)}
+
+    return {
+        'settings': {
+            'csv': os.path.basename(args.csv),
+            'fifa_version': args.fifa_version,
+            'hide': args.hide,
+            'seed': args.seed,
+            'drop_overall': args.drop_overall,
+            'league_context': context,
+        },
+        'reference_teams': len(estimator.known_teams),
+        'held_out_teams': len(targets),
+        'methods': results,
+        'calibration': calibration,
+    }
+
+
+def compare_with_baseline(report, baseline, tolerance):
+    """Regressions of MAE/RMSE and throughput ratios against a baseline report."""
+    regressions = []
+    throughput = {}
+    if baseline.get('settings') != report['settings']:
+        regressions.append('baseline was recorded with different settings')
+        return regressions, throughput
+    for name, result in report['methods'].items():
+        expected = baseline['methods'].get(name)
+        if expected is None:
+            continue
+        for metric in ('mae', 'rmse'):
+            if result[metric] is None or expected[metric] is None:
+                if result[metric] != expected[metric]:
+                    regressions.append(f"{name}: {metric} {expected[metric]} -> {result[metric]}")
+            elif result[metric] > expected[metric] + tolerance:
+                regressions.append(f"{name}: {metric} {expected[metric]} -> {result[metric]}")
+        if result['coverage'] < expected['coverage']:
+            regressions.append(f"{name}: coverage {expected['coverage']} -> {result['coverage']}")
+        if result['estimates_per_second'] and expected.get('estimates_per_second'):
+            throughput[name] = round(result['estimates_per_second'] / expected['estimates_per_second'], 2)
+    return regressions, throughput
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='ELO estimator accuracy and throughput benchmark')
+    parser.add_argument('--csv', default=DEFAULT_RAW_CSV_PATH, help='raw team CSV')
+    parser.add_argument('--fifa-version', type=float, default=24.0, help='FIFA version of the teams')
+    parser.add_argument('--hide', type=float, default=0.2, help='fraction of teams held out')
+    parser.add_argument('--seed', type=int, default=0, help='random seed of the held-out selection')
+    parser.add_argument('--drop-overall', action='store_true', help='remove the overall rating of held-out teams')
+    parser.add_argument('--no-league-context', action='store_true', help='estimate without league context')
+    parser.add_argument('--baseline', nargs='?', const=DEFAULT_BASELINE, default=None,
+                        help='compare with a baseline report (default: tests/baselines/elo_estimator_benchmark.json, '
+                             'elo_estimator_benchmark_drop_overall.json with --drop-overall)')
+    parser.add_argument('--tolerance', type=float, default=0.5, help='accepted MAE/RMSE increase in ELO points')
+    parser.add_argument('--save-baseline', nargs='?', const=DEFAULT_BASELINE, default=None, metavar='PATH',
+                        help='write the report as a baseline (default: as for --baseline)')
+    parser.add_argument('--output', default=None, help='write the JSON report to this file')
+    args = parser.parse_args()
+    default_path = DROP_OVERALL_BASELINE_PATH if args.drop_overall else DEFAULT_BASELINE_PATH
+    if args.baseline == DEFAULT_BASELINE:
+        args.baseline = default_path
+    if args.save_baseline == DEFAULT_BASELINE:
+        args.save_baseline = default_path
+    return args
+
+
+def main():
+    args = parse_args()
+    report = run_benchmark(args)
+
+    status = 0
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        regressions, throughput = compare_with_baseline(report, baseline, args.tolerance)
+        report['baseline'] = {'path': args.baseline, 'regressions': regressions, 'throughput_ratio': throughput}
+        status = 1 if regressions else 0
+
+    text = json.dumps(report, indent=2)
+    for path in (args.output, args.save_baseline):
+        if path:
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(text + '\n')
+    print(text)
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
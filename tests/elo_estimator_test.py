@@ -0,0 +1,298 @@
+#!/usr/bin/env python3
+"""
+ELO Estimator Test Script
+
+Checks the ELO estimator against slower reference computations on real team data
+(references are the teams of assets/raw/male_teams.csv with a valid overall
+rating, a seeded share of them is held out as targets):
+
+- Batch estimation (estimate_elos) gives the same estimates as estimate_elo per
+  team, with and without league context, also for targets with missing, zero,
+  non-numeric, NaN or overflowing metric values
+- The shipped FIFA 24 team data has no team to estimate, so the batch path only
+  runs for the held-out teams of this test, not at startup
+- The similarity methods answer from their spatial indexes with the same
+  estimates as a scan over every known team, for several held-out splits, for
+  targets between groups of tied overall ratings, and after references were added
+  and overwritten
+- The per-league aggregates (league context estimates, confidence labels and
+  league summaries) equal sums over the known teams of the league from scratch
+  after references moved between leagues, lost their overall rating or changed ELO
+
+Usage:
+    python tests/elo_estimator_test.py
+"""
+
+import sys
+import os
+import dataclasses
+import math
+import random
+
+# Add parent directory to path so we can import from core/
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.storage.elo_estimator import _ESTIMATION_ERRORS, ELOEstimator, TeamMetrics
+from core.storage.team_storage import DEFAULT_RAW_CSV_PATH, TeamStorage
+
+RAW_TEAM_CSVS = (DEFAULT_RAW_CSV_PATH, os.path.join(os.path.dirname(DEFAULT_RAW_CSV_PATH), 'female_teams.csv'))
+HIDE = 0.3
+SEED = 11
+SPLIT_SEEDS = (0, 2, 5, 7, 11)
+# (target overall, reference overalls): a group of ties on the nearer side must not
+# fill the top 5 with the ties of the other side
+TIED_RATINGS = ((84, [82, 82, 82, 83, 85, 85]), (84, [82] + [85] * 12 + [83]),
+                (70, [69.5] * 7 + [71] + [68] * 3), (60, [60] * 3 + [59, 61] * 4 + [58]))
+TOLERANCE = 1e-6
+SIMILARITY_METHODS = ('_estimate_by_overall_similarity', '_estimate_by_multi_metric_similarity',
+                      '_estimate_by_prestige_similarity')
+
+
+def check(results, name, condition):
+    results.append((name, bool(condition)))
+    print(f"   {'✅' if condition else '❌'} {name}")
+
+
+def load_teams():
+    """(metrics, overall-derived ELO) of every team with a valid overall rating."""
+    storage = TeamStorage(ELOEstimator())
+    return [(storage._record_metrics(record), storage._calculate_elo_from_overall(record.overall))
+            for record in storage._iter_team_records(DEFAULT_RAW_CSV_PATH, 24.0)
+            if record.overall is not None and 30 <= record.overall <= 100]
+
+
+class ScanEstimator(ELOEstimator):
+    """Estimator whose similarity methods score every known team instead of the index candidates."""
+
+    def _candidates(self, orders):
+        return list(self.known_teams.values())
+
+
+def split_teams(teams, rng, estimator_class=ELOEstimator):
+    """Estimator with the references added, and the held-out metrics."""
+    hidden = set(rng.sample(range(len(teams)), int(len(teams) * HIDE)))
+    estimator = estimator_class()
+    targets = []
+    for index, (metrics, elo) in enumerate(teams):
+        if index in hidden:
+            targets.append(metrics)
+        else:
+            estimator.add_known_team(metrics.team_name, elo, metrics)
+    return estimator, targets
+
+
+def invalid_targets(template):
+    """Targets whose metric values make some similarity methods fail or skip them."""
+    return [
+        TeamMetrics(),
+        dataclasses.replace(template, overall=None, attack=None, midfield=None, defence=None),
+        dataclasses.replace(template, overall=0, club_worth_eur=0),
+        dataclasses.replace(template, overall='n/a'),
+        dataclasses.replace(template, attack='strong', international_prestige='high'),
+        dataclasses.replace(template, club_worth_eur=-5),
+        dataclasses.replace(template, club_worth_eur=float('nan'), overall=float('nan')),
+        dataclasses.replace(template, club_worth_eur=1e308, domestic_prestige=1e308),
+        dataclasses.replace(template, overall=None, international_prestige=None, domestic_prestige=None,
+                            club_worth_eur=None),
+        dataclasses.replace(template, league_name='No League', country='Nowhere'),
+    ]
+
+
+def same_estimates(estimates, expected):
+    # The per-team fallback gives NaN for a NaN overall rating; the batch must too
+    return len(estimates) == len(expected) and all(
+        abs(a - b) <= TOLERANCE or (math.isnan(a) and math.isnan(b)) for a, b in zip(estimates, expected))
+
+
+def method_estimates(estimator, name, targets, league_context):
+    """Estimates of one method, the error type name where it raises."""
+    method = getattr(estimator, name)
+    estimates = []
+    for metrics in targets:
+        try:
+            estimates.append(method(metrics, league_context))
+        except _ESTIMATION_ERRORS as e:
+            estimates.append(type(e).__name__)
+    return estimates
+
+
+def same_method_estimates(estimator, scan, targets):
+    """Whether the indexed similarity methods equal the scans for all targets."""
+    for name in SIMILARITY_METHODS:
+        for league_context in (True, False):
+            indexed = method_estimates(estimator, name, targets, league_context)
+            expected = method_estimates(scan, name, targets, league_context)
+            # None or an error name where the method gives no estimate
+            missing = [a if a is None or isinstance(a, str) else 0 for a in indexed]
+            if missing != [b if b is None or isinstance(b, str) else 0 for b in expected] or not same_estimates(
+                    [a for a, m in zip(indexed, missing) if m == 0], [b for b, m in zip(expected, missing) if m == 0]):
+                print(f"      mismatch: {name}, league_context={league_context}")
+                return False
+    return True
+
+
+def overwrite_references(estimators, teams, rng):
+    """Add and overwrite references with changed metrics and ELOs in every estimator."""
+    for metrics, elo in rng.sample(teams, 150):
+        changed = dataclasses.replace(
+            metrics, overall=rng.randint(45, 90), attack=rng.choice((None, rng.randint(40, 90))),
+            club_worth_eur=rng.choice((None, 0, rng.randint(10 ** 5, 10 ** 9))),
+            league_name=rng.choice((metrics.league_name, 'Moved League')))
+        new_elo = min(2000, max(1000, elo + rng.uniform(-150, 150)))
+        for estimator in estimators:
+            estimator.add_known_team(metrics.team_name, new_elo, changed)
+
+
+def tied_estimators(ratings):
+    """Indexed and scanning estimators with references at the given overall ratings."""
+    estimators = (ELOEstimator(), ScanEstimator())
+    for index, overall in enumerate(ratings):
+        metrics = TeamMetrics(overall=overall, team_name=f"Tied {index}", league_name='Tied League',
+                              country='Tiedland')
+        for estimator in estimators:
+            estimator.add_known_team(metrics.team_name, 1200 + 25 * index, metrics)
+    return estimators
+
+
+def league_teams(estimator, league_name, country):
+    return [(elo, metrics) for elo, metrics in estimator.known_teams.values()
+            if (metrics.league_name, metrics.country) == (league_name, country)]
+
+
+def scan_league_context(estimator, target):
+    """League context estimate from the known teams of the target's league."""
+    teams = league_teams(estimator, target.league_name, target.country)
+    if not target.league_name or len(teams) < 3:
+        return None
+    average_elo = sum(elo for elo, _ in teams) / len(teams)
+    overalls = [float(metrics.overall) for _, metrics in teams if metrics.overall]
+    if target.overall and overalls:
+        relative_strength = float(target.overall) / (sum(overalls) / len(overalls))
+        return max(1000, min(2000, average_elo + (relative_strength - 1) * 100))
+    return average_elo
+
+
+def scan_summary(estimator, league_name, country):
+    """League summary from the known teams of the league."""
+    teams = league_teams(estimator, league_name, country)
+    if not teams:
+        return None
+    overalls = [float(metrics.overall) for _, metrics in teams if metrics.overall]
+    return {
+        'team_count': len(teams),
+        'average_elo': sum(elo for elo, _ in teams) / len(teams),
+        'average_overall': sum(overalls) / len(overalls) if overalls else None,
+        'min_overall': min(overalls) if overalls else None,
+        'max_overall': max(overalls) if overalls else None,
+    }
+
+
+def scan_confidence(estimator, target):
+    """Confidence label counting the known teams of the target's league."""
+    available = sum(1 for value in (target.overall, target.attack, target.midfield, target.defence,
+                                    target.international_prestige, target.domestic_prestige) if value)
+    if available >= 4 and len(league_teams(estimator, target.league_name, target.country)) >= 3:
+        return "high"
+    if available >= 2 and len(estimator.known_teams) >= 10:
+        return "medium"
+    return "low"
+
+
+def same_summary(summary, expected):
+    if summary is None or expected is None:
+        return summary is expected
+    return summary.keys() == expected.keys() and all(
+        summary[key] == expected[key] if summary[key] is None or expected[key] is None
+        else abs(summary[key] - expected[key]) <= TOLERANCE for key in summary)
+
+
+def move_references(estimator, teams, rng):
+    """Overwrite references with other leagues and countries, missing overall ratings and new ELOs."""
+    contexts = sorted({(metrics.league_name, metrics.country) for metrics, _ in teams})
+    for metrics, elo in rng.sample(teams, 300):
+        league_name, country = rng.choice(contexts) if rng.random() < 0.4 else (metrics.league_name, metrics.country)
+        changed = dataclasses.replace(metrics, league_name=league_name, country=country,
+                                      overall=rng.choice((None, 0, metrics.overall, rng.randint(40, 95))))
+        estimator.add_known_team(metrics.team_name, min(2000, max(1000, elo + rng.uniform(-200, 200))), changed)
+
+
+def run_tests():
+    results = []
+    rng = random.Random(SEED)
+    teams = load_teams()
+    estimator, targets = split_teams(teams, rng)
+    without_overall = [dataclasses.replace(metrics, overall=None) for metrics in targets]
+    invalid = invalid_targets(targets[0])
+
+    print("📦 Batch estimation")
+    splits = []  # (estimator, scanning estimator, {batch name: targets}) per held-out split
+    for seed in SPLIT_SEEDS:
+        split, split_targets = split_teams(teams, random.Random(seed))
+        scan, _ = split_teams(teams, random.Random(seed), ScanEstimator)
+        splits.append((split, scan, {
+            "held-out teams": split_targets,
+            "teams without overall": [dataclasses.replace(metrics, overall=None) for metrics in split_targets],
+            "invalid metrics": invalid,
+        }))
+    for league_context in (True, False):
+        label = "with" if league_context else "without"
+        for name in ("held-out teams", "teams without overall", "invalid metrics"):
+            check(results, f"{name}, {label} league context", all(
+                same_estimates(split.estimate_elos(batches[name], league_context),
+                               [split.estimate_elo(metrics, league_context) for metrics in batches[name]])
+                for split, _, batches in splits))
+    check(results, "no references", same_estimates(ELOEstimator().estimate_elos(targets[:20] + invalid),
+                                                   [ELOEstimator().estimate_elo(m) for m in targets[:20] + invalid]))
+    check(results, "empty batch", estimator.estimate_elos([]) == [])
+    shipped = [TeamStorage(ELOEstimator(), squad_strengths=False) for _ in RAW_TEAM_CSVS]
+    check(results, "no team of the shipped data needs estimation", all(
+        storage.load_from_raw_data(csv_path, 24.0, use_cache=False) and not storage._teams_with_estimated_elo
+        for storage, csv_path in zip(shipped, RAW_TEAM_CSVS)))
+
+    print("🌳 Indexed similarity")
+    for name in ("held-out teams", "teams without overall", "invalid metrics"):
+        check(results, f"{name} match the scan", all(same_method_estimates(split, scan, batches[name])
+                                                      for split, scan, batches in splits))
+    tied_matches = []
+    for overall, ratings in TIED_RATINGS:
+        indexed, tied_scan = tied_estimators(ratings)
+        probe = TeamMetrics(overall=overall, league_name='Tied League', country='Tiedland')
+        tied_matches.append(same_method_estimates(indexed, tied_scan, [probe])
+                            and same_estimates([indexed.estimate_elo(probe)], [tied_scan.estimate_elo(probe)]))
+    check(results, "tied overall ratings match the scan", all(tied_matches))
+    scan, _ = split_teams(teams, random.Random(SEED), ScanEstimator)
+    overwrite_references((estimator, scan), teams, rng)
+    check(results, "match the scan after overwrites", same_method_estimates(estimator, scan, targets)
+          and same_estimates(estimator.estimate_elos(targets), [scan.estimate_elo(m) for m in targets]))
+
+    print("📊 League aggregates")
+    move_references(estimator, teams, rng)
+    contexts = sorted({(metrics.league_name, metrics.country) for metrics, _ in teams}) + [('No League', 'Nowhere')]
+    check(results, "league summaries equal sums from scratch", all(
+        same_summary(estimator.get_league_summary(*context), scan_summary(estimator, *context))
+        for context in contexts))
+    check(results, "context sizes", all(len(partition.orders) == len(league_teams(estimator, *context))
+                                        for context, partition in estimator._contexts.items()))
+    probes = targets + without_overall + [dataclasses.replace(metrics, league_name='No League')
+                                          for metrics in targets[:20]]
+    context_estimates = [estimator._estimate_by_league_context(metrics, True) for metrics in probes]
+    expected = [scan_league_context(estimator, metrics) for metrics in probes]
+    check(results, "league context estimates equal the scan",
+          [a is None for a in context_estimates] == [b is None for b in expected]
+          and same_estimates([a for a in context_estimates if a is not None], [b for b in expected if b is not None]))
+    check(results, "confidence labels equal the scan", all(
+        estimator.get_estimation_confidence(metrics) == scan_confidence(estimator, metrics)
+        for metrics in probes + invalid))
+    return results
+
+
+def main():
+    print("🧪 ELO estimator test")
+    results = run_tests()
+    passed = sum(1 for _, ok in results if ok)
+    print(f"\n📋 {passed}/{len(results)} checks passed")
+    return 0 if passed == len(results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
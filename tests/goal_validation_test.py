@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+"""
+Sequential Goal Calibration Validation
+
+Validates the match engine against the league targets in assets/league_average_goals.csv
+with sequential testing instead of fixed-length seasons:
+
+- Leagues are sharded across worker processes
+- Each league plays double round-robin seasons with the real engine (play_match)
+  and keeps running mean/variance (Welford) of goals per match and draws; the teams
+  are the league's teams as the game loads them (ELO, and the attack and defence
+  ratings the engine's attack factor reads), or equal strength teams
+  with --no-team-data
+- A league stops as soon as the confidence intervals are decided: the goals interval
+  lies entirely inside (pass) or outside (fail) target +/- tolerance, and the draw rate
+  interval lies entirely inside or outside the accepted draw band
+- Leagues still undecided after --max-matches are reported as inconclusive
+
+Results are printed as JSON (or written with --output). The exit code is 1 when any
+league fails, so the runner can gate engine changes.
+
+Usage:
+    python tests/goal_validation_test.py
+    python tests/goal_validation_test.py --leagues "Premier League" "Serie A" --output results.json
+"""
+
+import sys
+import os
+import argparse
+import json
+import math
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from statistics import NormalDist
+
+# Add parent directory to path so we can import from core/
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.entities.team import Team
+from core.simulation.calibration_context import CalibrationContext
+from core.simulation.goals_calibration import DEFAULT_CSV_PATH, canonical_league_key, read_league_targets
+from core.simulation.simulator import play_match
+
+DEFAULT_TEAMS = 20
+DEFAULT_ELO = 1500
+# Team data ratings read by the match engine (simulator.attack_factor)
+STRENGTH_KEYS = ('attack', 'defence', 'strength_source')
+
+
+class RunningStat:
+    """Running mean and variance (Welford's algorithm)."""
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+
+    def add(self, value):
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+
+    @property
+    def variance(self):
+        return self._m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    def interval(self, z):
+        """Normal confidence interval of the mean."""
+        half_width = z * math.sqrt(self.variance / self.count) if self.count else math.inf
+        return self.mean - half_width, self.mean + half_width
+
+
+def decide(interval, low, high):
+    """'pass' if the interval lies inside [low, high], 'fail' if outside, else None."""
+    if low <= interval[0] and interval[1] <= high:
+        return 'pass'
+    if interval[1] < low or interval[0] > high:
+        return 'fail'
+    return None
+
+
+def validate_league(task):
+    """
+    Run one league until its goals and draw rate checks are decided.
+
+    Args:
+        task: dict with league, target, teams ((ELO, ratings) pairs) and the test settings
+
+    Returns:
+        dict: JSON-ready result for the league
+    """
+    random.seed(task['seed'])
+    z = NormalDist().inv_cdf(0.5 + task['confidence'] / 2)
+    target = task['target']
+    goals_band = (target - task['tolerance'], target + task['tolerance'])
+    draw_band = tuple(task['draw_band'])
+
+    calibration = CalibrationContext(task['league'])
+    goals = RunningStat()
+    draws = RunningStat()
+    goals_verdict = draws_verdict = None
+    seasons = 0
+
+    while goals.count < task['max_matches']:
+        # Fresh teams every season, as the engine updates ratings after each match
+        teams = []
+        for i, (elo, ratings) in enumerate(task['teams']):
+            team = Team(f"Team_{i + 1}", elo)
+            if ratings:
+                team.league_info = dict(ratings)
+            teams.append(team)
+        calibration.reset()
+        for home in teams:
+            for away in teams:
+                if home is away:
+                    continue
+                home_goals, away_goals = play_match(home, away, calibration=calibration)
+                calibration.record(home_goals, away_goals)
+                goals.add(home_goals + away_goals)
+                draws.add(1.0 if home_goals == away_goals else 0.0)
+        seasons += 1
+
+        if goals.count >= task['min_matches']:
+            goals_verdict = decide(goals.interval(z), *goals_band)
+            draws_verdict = decide(draws.interval(z), *draw_band)
+            if goals_verdict and draws_verdict:
+                break
+
+    if goals_verdict == 'fail' or draws_verdict == 'fail':
+        status = 'fail'
+    elif goals_verdict and draws_verdict:
+        status = 'pass'
+    else:
+        status = 'inconclusive'
+
+    return {
+        'league': task['league'],
+        'status': status,
+        'target': target,
+        'matches': goals.count,
+        'seasons': seasons,
+        'fitted_profile': not calibration.profile.feedback,
+        'goals': {
+            'mean': round(goals.mean, 4),
+            'interval': [round(bound, 4) for bound in goals.interval(z)],
+            'verdict': goals_verdict or 'inconclusive',
+        },
+        'draw_rate': {
+            'mean': round(draws.mean, 4),
+            'interval': [round(bound, 4) for bound in draws.interval(z)],
+            'band': list(draw_band),
+            'verdict': draws_verdict or 'inconclusive',
+        },
+    }
+
+
+def build_tasks(args):
+    """One task per league in the goals CSV, optionally filtered by --leagues."""
+    teams_by_key = {}
+    if not args.no_team_data:
+        from core.simulation.calibration_fitter import league_teams
+        teams_by_key = league_teams()
+
+    wanted = {canonical_league_key(name) for name in args.leagues} if args.leagues else None
+    tasks = []
+    for index, (country, league, target) in enumerate(read_league_targets(DEFAULT_CSV_PATH)):
+        key = canonical_league_key(country + league)
+        if wanted is not None and key not in wanted and canonical_league_key(league) not in wanted:
+            continue
+        league_teams = teams_by_key.get(key)
+        if league_teams and len(league_teams) >= 2:
+            # Only what the engine reads, so tasks stay small for the worker processes
+            teams = [(team.elo, {name: team.league_info.get(name) for name in STRENGTH_KEYS})
+                     for team in league_teams]
+        else:
+            teams = [(DEFAULT_ELO, None)] * DEFAULT_TEAMS
+        tasks.append({
+            'league': f"{country} - {league}",
+            'target': target,
+            'teams': teams,
+            'seed': args.seed + index,
+            'confidence': args.confidence,
+            'tolerance': args.tolerance,
+            'draw_band': args.draw_band,
+            'min_matches': args.min_matches,
+            'max_matches': args.max_matches,
+        })
+    return tasks
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='Sequential validation of league goal averages')
+    parser.add_argument('--leagues', nargs='*', help='league names to validate (default: all)')
+    parser.add_argument('--confidence', type=float, default=0.99, help='confidence level of the intervals')
+    parser.add_argument('--tolerance', type=float, default=0.10, help='accepted goals per match error')
+    parser.add_argument('--draw-band', type=float, nargs=2, default=(0.15, 0.35), metavar=('LOW', 'HIGH'),
+                        help='accepted draw rate band')
+    parser.add_argument('--min-matches', type=int, default=300, help='matches before the first check')
+    parser.add_argument('--max-matches', type=int, default=20000, help='matches before giving up')
+    parser.add_argument('--workers', type=int, default=None, help='worker processes (default: CPU count)')
+    parser.add_argument('--seed', type=int, default=0, help='base random seed')
+    parser.add_argument('--no-team-data', action='store_true', help='use equal strength teams only')
+    parser.add_argument('--output', default=None, help='write the JSON report to this file')
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    start = time.time()
+    tasks = build_tasks(args)
+
+    with ProcessPoolExecutor(max_workers=args.workers) as executor:
+        results = list(executor.map(validate_league, tasks))
+
+    report = {
+        'confidence': args.confidence,
+        'tolerance': args.tolerance,
+        'draw_band': list(args.draw_band),
+        'elapsed_seconds': round(time.time() - start, 2),
+        'summary': {status: sum(1 for r in results if r['status'] == status)
+                    for status in ('pass', 'fail', 'inconclusive')},
+        'leagues': results,
+    }
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(text)
+    print(text)
+    return 1 if report['summary']['fail'] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
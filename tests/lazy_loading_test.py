@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Lazy Loading Test Script
+
+Checks the byte-offset league index and the lazy mode of TeamStorage against an
+eager load of the same CSV:
+
+- LeagueIndex.read_records returns the same records as the streamed CSV for every
+  league, including names with quoted line breaks and characters str.splitlines
+  would break on (\\x1c, \\u2028); the sidecar is reused and rebuilt when the CSV
+  changes
+- After load_catalog, the catalog queries answer like the eager storage and a
+  league read on access has the same teams, ELOs and league data
+- A league with estimated ELOs waits for the full load
+- After the background fill, the lazy storage equals the eager one and keeps the
+  Team objects it already handed out
+
+Usage:
+    python tests/lazy_loading_test.py
+"""
+
+import sys
+import os
+import csv
+import glob
+import shutil
+import tempfile
+
+# Add parent directory to path so we can import from core/
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.storage.elo_estimator import ELOEstimator
+from core.storage.league_index import LeagueIndex
+from core.storage.team_storage import DEFAULT_CACHE_DIR, DEFAULT_RAW_CSV_PATH, TeamStorage
+
+TEST_CSV_NAME = 'lazy_loading_test_teams'
+
+
+def check(results, name, condition):
+    results.append((name, bool(condition)))
+    print(f"   {'✅' if condition else '❌'} {name}")
+
+
+def make_row(header, **values):
+    defaults = {'fifa_version': '24.0', 'league_name': 'Test League', 'league_level': '1',
+                'nationality_name': 'Testland', 'overall': '70', 'attack': '70', 'midfield': '70',
+                'defence': '70', 'international_prestige': '5', 'domestic_prestige': '5',
+                'transfer_budget_eur': '1000000', 'club_worth_eur': '50000000', 'home_stadium': 'Ground'}
+    defaults.update(values)
+    return [str(defaults.get(name, '')) for name in header]
+
+
+def write_csv(csv_path):
+    """Two interleaved leagues, one of them with an estimated ELO."""
+    with open(DEFAULT_RAW_CSV_PATH, 'r', encoding='utf-8', newline='') as f:
+        header = next(csv.reader(f))
+    rows = [
+        make_row(header, team_id=1, team_name='Alpha', overall=75),
+        make_row(header, team_id=2, team_name='Sep\x1cArated', overall=71),
+        make_row(header, team_id=3, team_name='Second A', league_name='Second League', overall=62),
+        make_row(header, team_id=4, team_name='Line\nBreak', overall=69),
+        make_row(header, team_id=5, team_name='Second B', league_name='Second League', overall=''),
+        make_row(header, team_id=6, team_name='Para\u2028Graph', overall=66),
+        make_row(header, team_id=7, team_name='Old', fifa_version='23.0'),
+        make_row(header, team_id=8, team_name='Second C', league_name='Second League', overall=58),
+    ]
+    with open(csv_path, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(header)
+        writer.writerows(rows)
+    return header
+
+
+def same_teams(teams, expected):
+    return [(team.name, team.elo, team.league_info) for team in teams] == \
+        [(team.name, team.elo, team.league_info) for team in expected]
+
+
+def run_tests(temp_dir):
+    results = []
+
+    print("🗂️  League index")
+    csv_path = os.path.join(temp_dir, f"{TEST_CSV_NAME}.csv")
+    header = write_csv(csv_path)
+    index_path = os.path.join(temp_dir, 'teams.index.json')
+    index = LeagueIndex.load_or_build(csv_path, 24.0, index_path)
+    streamed = list(TeamStorage._iter_team_records(csv_path, 24.0))
+    check(results, "one entry per league", set(index.leagues) == {('Test League', 'Testland'),
+                                                                  ('Second League', 'Testland')})
+    check(results, "catalog counts", index.entry('Test League', 'Testland')['team_count'] == 4
+          and index.entry('Second League', 'Testland')['estimated_count'] == 1)
+    check(results, "interleaved rows give several ranges", len(index.entry('Test League', 'Testland')['ranges']) == 3)
+    check(results, "read_records matches the stream", all(
+        index.read_records(league, country) == [record for record in streamed
+                                                if (record.league_name, record.country) == (league, country)]
+        for league, country in index.leagues))
+    check(results, "separator characters kept in names",
+          [record.team_name for record in index.read_records('Test League', 'Testland')]
+          == ['Alpha', 'Sep\x1cArated', 'Line\nBreak', 'Para\u2028Graph'])
+    check(results, "unknown league", index.read_records('No League', 'Testland') == [])
+
+    builds = []
+    build = LeagueIndex.build
+    LeagueIndex.build = lambda self: builds.append(self) or build(self)
+    try:
+        check(results, "sidecar reused", LeagueIndex.load_or_build(csv_path, 24.0, index_path).leagues == index.leagues
+              and not builds)
+        with open(csv_path, 'a', encoding='utf-8', newline='') as f:
+            csv.writer(f).writerow(make_row(header, team_id=9, team_name='Late', overall=64))
+        rebuilt = LeagueIndex.load_or_build(csv_path, 24.0, index_path)
+    finally:
+        LeagueIndex.build = build
+    check(results, "stale sidecar rebuilt", len(builds) == 1
+          and rebuilt.entry('Test League', 'Testland')['team_count'] == 5)
+
+    print("⏳ Estimated league")
+    eager = TeamStorage(ELOEstimator(), squad_strengths=False)
+    eager.load_from_raw_data(csv_path, 24.0, use_cache=False)
+    lazy = TeamStorage(ELOEstimator(), squad_strengths=False)
+    check(results, "catalog loaded", lazy.load_catalog(csv_path, 24.0))
+    check(results, "league without estimates read alone",
+          same_teams(lazy.get_league_teams('Test League', 'Testland'), eager.get_league_teams('Test League', 'Testland'))
+          and not lazy._complete.is_set())
+    check(results, "league with estimates waits for the full load",
+          same_teams(lazy.get_league_teams('Second League', 'Testland'),
+                     eager.get_league_teams('Second League', 'Testland')) and lazy._complete.is_set())
+
+    print("💤 Real CSV")
+    eager = TeamStorage(ELOEstimator())
+    eager.load_from_raw_data(DEFAULT_RAW_CSV_PATH, 24.0, use_cache=False)
+    lazy = TeamStorage(ELOEstimator())
+    lazy.load_catalog(DEFAULT_RAW_CSV_PATH, 24.0)
+    check(results, "available leagues from the catalog", lazy.get_available_leagues() == eager.get_available_leagues())
+    check(results, "leagues by country from the catalog",
+          lazy.get_leagues_by_country() == eager.get_leagues_by_country())
+
+    leagues = [(league, country) for league, country, _ in eager.get_available_leagues()[::5]]
+    handed = {key: lazy.get_league_teams(*key) for key in leagues}
+    check(results, f"{len(leagues)} leagues read on access match",
+          all(same_teams(handed[key], eager.get_league_teams(*key)) for key in leagues))
+    check(results, "no full load yet", not lazy._complete.is_set() and len(lazy.teams_by_name) < len(eager.teams_by_name))
+
+    lazy.wait_until_loaded()
+    check(results, "same teams after the fill", set(lazy.teams_by_name) == set(eager.teams_by_name))
+    check(results, "same ELOs and league data after the fill", all(
+        team.elo == eager.teams_by_name[name].elo and team.league_info == eager.teams_by_name[name].league_info
+        for name, team in lazy.teams_by_name.items()))
+    check(results, "handed-out teams kept", all(
+        all(a is b for a, b in zip(lazy.get_league_teams(*key), teams)) for key, teams in handed.items()))
+    owners = [team for teams in handed.values() for team in teams if lazy.teams_by_name[team.name] is team]
+    check(results, "indexes cover every team", len(lazy.columns) == len(lazy.teams_by_name)
+          and all(lazy.search_teams(team.name, 1) == [team] for team in owners))
+    return results
+
+
+def main():
+    print("🧪 Lazy loading test")
+    temp_dir = tempfile.mkdtemp(prefix="ffm_lazy_")
+    try:
+        results = run_tests(temp_dir)
+    finally:
+        shutil.rmtree(temp_dir)
+        # The background fill caches the test CSV next to the real caches
+        for path in glob.glob(os.path.join(DEFAULT_CACHE_DIR, f"{TEST_CSV_NAME}_*")):
+            os.remove(path)
+
+    passed = sum(1 for _, ok in results if ok)
+    print(f"\n📋 {passed}/{len(results)} checks passed")
+    return 0 if passed == len(results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+League Store Test Script
+
+Checks the indexed league store against the nested leagues data it replaces:
+
+- A store built from leagues.dat, saved and memory-mapped back gives the same
+  countries, levels and teams as the nested dict
+- get_teams and get_top_teams of FootballStatistics return the same teams as
+  scans of the nested dict, for a grid of level / ELO thresholds and rank ranges
+- A pickled data file is migrated to the store once, keeping its age, and a
+  newer data file is migrated again
+- Query and load times of the store and of the nested-dict scans are reported
+
+Usage:
+    python tests/league_store_test.py
+    python tests/league_store_test.py --data-file leagues.dat --repeat 200
+"""
+
+import sys
+import os
+import argparse
+import pickle
+import shutil
+import tempfile
+import time
+
+# Add parent directory to path so we can import from core/
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from stats.gamestats import FootballStatistics
+from stats.league_store import LeagueStore
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CODE_FILE = os.path.join(PROJECT_ROOT, 'assets', 'archive', 'countrycodes.csv')
+ELO_GRID = (0, 1200, 1500, 1700, 1900)
+RANK_RANGES = ((1, 100), (1, 10), (50, 60), (0, 5000), (300, 200))
+
+
+def scan_teams(data, lvl, elo):
+    """Teams with level <= lvl and ELO > elo, scanning the nested data."""
+    return [{'Club': club, 'Rank': record['Rank'], 'Elo': record['Elo']}
+            for levels in data.values() for level, clubs in levels.items() if int(level) <= lvl
+            for club, record in clubs.items() if record['Elo'] > elo]
+
+
+def scan_top_teams(data, top, bottom):
+    """Ranked teams with top <= rank <= bottom by rank, scanning the nested data."""
+    top = max(top, 1)
+    teams = {}
+    for levels in data.values():
+        for clubs in levels.values():
+            for club, record in clubs.items():
+                if record['Rank'] != -1 and top <= record['Rank'] <= bottom:
+                    teams[record['Rank']] = {'Club': club, 'Rank': record['Rank'], 'Elo': record['Elo']}
+    return dict(sorted(teams.items()))
+
+
+def sort_key(team):
+    return team['Club'], team['Rank'], team['Elo']
+
+
+def check(results, name, condition):
+    results.append((name, bool(condition)))
+    print(f"   {'✅' if condition else '❌'} {name}")
+
+
+def timed(function, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        function()
+    return (time.perf_counter() - start) / repeat * 1e6
+
+
+def run_tests(data_file, repeat, temp_dir):
+    results = []
+    with open(data_file, 'rb') as f:
+        data = pickle.load(f)['__leagues']
+
+    print("🗂️  Store")
+    store_file = os.path.join(temp_dir, 'leagues.npy')
+    LeagueStore.from_leagues(data).save(store_file)
+    store = LeagueStore.load(store_file)
+    check(results, "store is memory-mapped", store is not None and store.records.base is not None)
+    check(results, "round trip equals nested data", store.to_leagues() == data)
+    check(results, "countries in source order", store.countries() == list(data))
+    check(results, "missing level", store.level_clubs('Nowhere', '1') is None)
+    check(results, "empty store", len(LeagueStore.from_leagues({})) == 0
+          and LeagueStore.from_leagues({}).above(10, 0) == [])
+
+    print("📊 FootballStatistics")
+    # Country codes with the relegation column FootballStatistics reads
+    code_file = os.path.join(temp_dir, 'countrycodes.csv')
+    with open(CODE_FILE, 'r') as source, open(code_file, 'w') as f:
+        f.writelines(line.strip() + ',-1\n' for line in source if line.strip())
+    stats_data_file = os.path.join(temp_dir, 'leagues.dat')
+    shutil.copy2(data_file, stats_data_file)
+    migrated_store = os.path.join(temp_dir, 'leagues.npy')
+    os.remove(migrated_store)
+    age = os.stat(stats_data_file).st_mtime
+    # A huge maximum age keeps the test offline
+    stats = FootballStatistics(code_file, stats_data_file, maximum_data_age_seconds=float('inf'))
+    check(results, "data file migrated", os.path.exists(migrated_store))
+    check(results, "migrated store keeps the data file age", os.stat(migrated_store).st_mtime == age)
+
+    for lvl in (1, 2, 10):
+        for elo in ELO_GRID:
+            if sorted(stats.get_teams(lvl, elo), key=sort_key) != sorted(scan_teams(data, lvl, elo), key=sort_key):
+                check(results, f"get_teams({lvl}, {elo})", False)
+    check(results, "get_teams matches the scan", all(name[:9] != 'get_teams' for name, _ in results))
+    for top, bottom in RANK_RANGES:
+        check(results, f"get_top_teams({top}, {bottom})",
+              list(stats.get_top_teams(top, bottom).items()) == list(scan_top_teams(data, top, bottom).items()))
+    country = next(iter(data))
+    level = next(iter(data[country]))
+    check(results, "leagues and teams", list(stats.leagues(country)) == list(data[country])
+          and stats.teams(country, level) == data[country][level])
+
+    with open(stats_data_file, 'rb') as f:
+        newer = pickle.load(f)
+    newer['__leagues'] = {country: data[country]}
+    with open(stats_data_file, 'wb') as f:
+        pickle.dump(newer, f)
+    os.utime(stats_data_file, (age + 10, age + 10))
+    stats = FootballStatistics(code_file, stats_data_file, maximum_data_age_seconds=float('inf'))
+    check(results, "newer data file migrated again", list(stats.countries()) == [country])
+
+    print("⏱️  Timings (µs per call)")
+    timings = {
+        'load store (mmap)': timed(lambda: LeagueStore.load(store_file), repeat),
+        'load leagues.dat (pickle)': timed(lambda: pickle.load(open(data_file, 'rb')), repeat),
+        'top 10 (store)': timed(lambda: store.rank_range(1, 10), repeat),
+        'top 10 (scan)': timed(lambda: scan_top_teams(data, 1, 10), repeat),
+        'level <= 1, ELO > 1800 (store)': timed(lambda: store.above(1, 1800), repeat),
+        'level <= 1, ELO > 1800 (scan)': timed(lambda: scan_teams(data, 1, 1800), repeat),
+    }
+    for name, micros in timings.items():
+        print(f"   {name:32s} {micros:10.1f}")
+    return results
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='Indexed league store test')
+    parser.add_argument('--data-file', default=os.path.join(PROJECT_ROOT, 'leagues.dat'),
+                        help='pickled leagues data')
+    parser.add_argument('--repeat', type=int, default=100, help='calls per timing')
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    print("🧪 League store test")
+    temp_dir = tempfile.mkdtemp(prefix="ffm_league_store_")
+    try:
+        results = run_tests(args.data_file, args.repeat, temp_dir)
+    finally:
+        shutil.rmtree(temp_dir)
+
+    passed = sum(1 for _, ok in results if ok)
+    print(f"\n📋 {passed}/{len(results)} checks passed")
+    return 0 if passed == len(results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Player Storage Test Script
+
+Checks the columnar player storage against plain csv.reader parsing:
+
+- A raw dump parsed in byte chunks, in-process or in worker processes, equals the
+  file read in one pass, also for names with quoted line breaks and characters
+  str.splitlines would break on (\\x1c, \\u2028)
+- The dump cache is reused and rebuilt when the dump changes
+- Per-team CSVs are catalogued with one directory scan and loaded one team at a
+  time on first access, found by any spelling of the team name
+- The club, position and overall indexes select the same rows as a scan
+
+Usage:
+    python tests/player_storage_test.py
+"""
+
+import sys
+import os
+import csv
+import shutil
+import tempfile
+
+import numpy as np
+
+# Add parent directory to path so we can import from core/
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.storage.player_storage import (ID_COLUMNS, LEAGUE_TEAMS_FILE, POSITIONS, RATING_COLUMNS, RAW_DIR,
+                                         TEXT_COLUMNS, PlayerStorage, _read_table)
+from core.storage.team_storage import DEFAULT_CACHE_DIR
+
+DUMP_PATH = os.path.join(RAW_DIR, 'female_players.csv')
+TEST_DUMP_NAME = 'player_storage_test_dump'
+
+
+def check(results, name, condition):
+    results.append((name, bool(condition)))
+    print(f"   {'✅' if condition else '❌'} {name}")
+
+
+def same_table(table, expected):
+    """Whether two tables hold the same rows in the same order."""
+    return len(table) == len(expected) \
+        and all(np.array_equal(table.ids[name], expected.ids[name]) for name in ID_COLUMNS) \
+        and all(np.array_equal(table.ratings[name], expected.ratings[name], equal_nan=True) for name in RATING_COLUMNS) \
+        and all(table.text[name] == expected.text[name] for name in TEXT_COLUMNS) \
+        and np.array_equal(table.position_mask, expected.position_mask) \
+        and np.array_equal(table.primary_position, expected.primary_position)
+
+
+def write_players(path, header, rows):
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(header)
+        writer.writerows(rows)
+
+
+def make_player(header, **values):
+    defaults = {'player_id': '1', 'fifa_version': '24.0', 'short_name': 'A. Player', 'overall': '70',
+                'player_positions': 'ST, CF', 'club_team_id': '10', 'club_name': 'Test FC',
+                'nationality_name': 'Testland'}
+    defaults.update(values)
+    return [str(defaults.get(name, '')) for name in header]
+
+
+def run_tests(temp_dir):
+    results = []
+    with open(DUMP_PATH, 'r', encoding='utf-8', newline='') as f:
+        header = next(csv.reader(f))
+
+    print("🧩 Chunked dump parsing")
+    expected = _read_table(DUMP_PATH)
+    storage = PlayerStorage(None)
+    check(results, "in-process chunks equal one pass",
+          same_table(storage.load_dump('female_players', DUMP_PATH, workers=1, chunk_bytes=64 * 1024,
+                                       use_cache=False), expected))
+    parallel = storage.load_dump('female_players', DUMP_PATH, workers=2, chunk_bytes=256 * 1024, use_cache=False)
+    check(results, "worker process chunks equal one pass", same_table(parallel, expected))
+    check(results, "dump registered", storage.dumps['female_players'] is parallel
+          and storage.get_statistics()['dumps'] == {'female_players': len(expected)})
+
+    names = ['Plain', 'Sep\x1cArated', 'Para\u2028Graph', 'Line\nBreak', 'Next\x85Line', 'Quote "Q"']
+    dump_path = os.path.join(temp_dir, f"{TEST_DUMP_NAME}.csv")
+    write_players(dump_path, header, [make_player(header, player_id=i, short_name=name)
+                                      for i, name in enumerate(names)])
+    # One record per chunk
+    table = storage.load_dump(TEST_DUMP_NAME, dump_path, workers=1, chunk_bytes=1, use_cache=False)
+    check(results, "separator characters kept in names", table.text['short_name'] == names
+          and same_table(table, _read_table(dump_path)))
+
+    print("💾 Dump cache")
+    first = storage.load_dump(TEST_DUMP_NAME, dump_path, workers=1)
+    cache_path = os.path.join(DEFAULT_CACHE_DIR, f"{TEST_DUMP_NAME}.players.pkl")
+    cached = PlayerStorage._load_cache(cache_path, PlayerStorage._cache_key(dump_path))
+    check(results, "cache written for the dump content", cached is not None and same_table(cached, first))
+    write_players(dump_path, header, [make_player(header, player_id=i, short_name=name)
+                                      for i, name in enumerate(names[:2])])
+    check(results, "stale cache rebuilt", len(PlayerStorage(None).load_dump(TEST_DUMP_NAME, dump_path, workers=1)) == 2)
+
+    print("📁 Per-team files")
+    data_dir = os.path.join(temp_dir, 'data')
+    league_dir = os.path.join(data_dir, 'Test_Country', 'Test_League')
+    os.makedirs(league_dir)
+    os.makedirs(os.path.join(data_dir, 'backups', 'Old'))
+    for team_name, count in (('Atlético_Test', 3), ('Brighton_&_Hove_Test', 2)):
+        write_players(os.path.join(league_dir, f"{team_name}.csv"), header,
+                      [make_player(header, player_id=i, club_name=team_name) for i in range(count)])
+    write_players(os.path.join(league_dir, LEAGUE_TEAMS_FILE), ['team_id', 'team_name'], [['1', 'Atlético Test']])
+
+    storage = PlayerStorage(data_dir)
+    files = storage.team_files()
+    check(results, "catalog skips league summaries", sorted(f.team_name for f in files.values())
+          == ['Atlético Test', 'Brighton & Hove Test'])
+    check(results, "any spelling finds the file", storage.find_team_file('atletico test') is not None
+          and storage.find_team_file('Brighton & Hove Test') == storage.find_team_file('brighton_&_hove_test'))
+    check(results, "nothing loaded before access", storage.get_statistics()['loaded_teams'] == 0)
+    players = storage.get_team_players('Atletico Test')
+    check(results, "one team loaded on access", len(players) == 3 and storage.get_statistics()['loaded_teams'] == 1)
+    check(results, "loaded team reused", storage.get_team_players('ATLÉTICO TEST') is players)
+    check(results, "unknown team", storage.get_team_players('Nobody FC') is None)
+    check(results, "all teams in one table", len(storage.get_all_team_players()) == 5)
+
+    real = PlayerStorage()
+    team_file = sorted(real.team_files().values(), key=lambda f: f.path)[0]
+    check(results, "real team file equals one pass",
+          same_table(real.get_team_players(team_file.team_name), _read_table(team_file.path)))
+
+    print("🗂️  Indexes")
+    clubs = expected.ids['club_team_id']
+    club = int(clubs[len(clubs) // 2])
+    check(results, "rows of a club", sorted(expected.rows_for_club(club)) == list(np.flatnonzero(clubs == club))
+          and len(expected.rows_for_club(-12345)) == 0)
+    check(results, "rows of each position", all(
+        list(expected.rows_for_position(position))
+        == [row for row in range(len(expected)) if position in expected.row(row)['positions']]
+        for position in POSITIONS))
+    overall = expected.ratings['overall']
+    rows = expected.rows_in_overall_range(70, 80)
+    check(results, "rows in an overall range, best first",
+          sorted(rows) == list(np.flatnonzero((overall >= 70) & (overall <= 80)))
+          and all(overall[a] >= overall[b] for a, b in zip(rows, rows[1:])))
+    return results
+
+
+def main():
+    print("🧪 Player storage test")
+    temp_dir = tempfile.mkdtemp(prefix="ffm_players_")
+    try:
+        results = run_tests(temp_dir)
+    finally:
+        shutil.rmtree(temp_dir)
+        cache_path = os.path.join(DEFAULT_CACHE_DIR, f"{TEST_DUMP_NAME}.players.pkl")
+        if os.path.exists(cache_path):
+            os.remove(cache_path)
+
+    passed = sum(1 for _, ok in results if ok)
+    print(f"\n📋 {passed}/{len(results)} checks passed")
+    return 0 if passed == len(results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Squad Strength Test Script
+
+Checks the squad-derived team ratings and how the match engine reads them:
+
+- compute_squad_strengths gives, for every club of the player files, the same
+  ratings as a per-club scan picking the best 4-3-3 by role score
+- The strengths are cached keyed by the player files and only returned for the
+  FIFA version of the player data
+- The team storage applies them to every club with player data (also clubs whose
+  name a later row owns), the others keep the team data ratings
+- attack_factor only applies between two teams with squad ratings, and a saved and
+  restored team keeps the ratings it was saved with
+
+Usage:
+    python tests/squad_strength_test.py
+"""
+
+import sys
+import os
+import json
+import math
+import shutil
+import tempfile
+from collections import defaultdict
+
+# Add parent directory to path so we can import from core/
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.entities.team import Team
+from core.simulation.simulator import MAX_ATTACK_FACTOR, MIN_ATTACK_FACTOR, STRENGTH_SCALE, attack_factor
+from core.storage.player_storage import player_storage
+from core.storage.squad_strength import (GOALKEEPER_DEFENCE_WEIGHT, LINE_SIZES, POSITION_LINES, ROLE_WEIGHTS,
+                                         SquadStrengths, compute_squad_strengths, squad_strengths)
+from core.storage.team_storage import initialize_team_storage, team_storage
+from utils.json_save_system import JsonEncoder
+
+GOALKEEPER, DEFENCE, MIDFIELD, ATTACK = range(4)
+
+
+def check(results, name, condition):
+    results.append((name, bool(condition)))
+    print(f"   {'✅' if condition else '❌'} {name}")
+
+
+def scan_strengths(players):
+    """Best-XI ratings per club, one player at a time."""
+    clubs = defaultdict(lambda: defaultdict(list))
+    for row in range(len(players)):
+        player = players.row(row)
+        line = POSITION_LINES.get(player['primary_position'])
+        if line is None or player['club_team_id'] < 0 or math.isnan(player['overall']):
+            continue
+        score = sum(weight * (player['overall'] if math.isnan(player[attribute]) else player[attribute])
+                    for attribute, weight in ROLE_WEIGHTS[line])
+        clubs[player['club_team_id']][line].append(score)
+
+    strengths = {}
+    for club, lines in clubs.items():
+        means = {line: sum(sorted(scores, reverse=True)[:LINE_SIZES[line]]) / min(len(scores), LINE_SIZES[line])
+                 for line, scores in lines.items()}
+        if not all(line in means for line in (DEFENCE, MIDFIELD, ATTACK)):
+            continue
+        defence = means[DEFENCE]
+        if GOALKEEPER in means:
+            defence = (1 - GOALKEEPER_DEFENCE_WEIGHT) * defence + GOALKEEPER_DEFENCE_WEIGHT * means[GOALKEEPER]
+        strengths[club] = (means[ATTACK], means[MIDFIELD], defence)
+    return strengths
+
+
+def run_tests(temp_dir):
+    results = []
+
+    print("⚽ Best XI")
+    players = player_storage.get_all_team_players()
+    computed = compute_squad_strengths(players)
+    expected = scan_strengths(players)
+    check(results, "same clubs as the scan", set(computed) == set(expected) and len(computed) > 500)
+    check(results, "same ratings as the scan", all(
+        all(abs(a - b) <= 0.05 + 1e-9 for a, b in zip(computed[club], expected[club])) for club in computed))
+
+    print("💾 Cache")
+    cache_path = os.path.join(temp_dir, 'squad_strength.json')
+    strengths = SquadStrengths(player_storage, cache_path)
+    check(results, "computed and cached", strengths.load() and os.path.exists(cache_path)
+          and strengths.by_team_id == computed)
+    with open(cache_path, 'r', encoding='utf-8') as f:
+        digest = json.load(f)['assets_sha256']
+    cached = SquadStrengths(player_storage, cache_path)
+    check(results, "cache reused", cached._load_cache(digest)
+          and cached.by_team_id == computed and cached.fifa_version == strengths.fifa_version)
+    club = next(iter(computed))
+    check(results, "only for the player data version", strengths.get(club, strengths.fifa_version) == computed[club]
+          and strengths.get(club, strengths.fifa_version - 1) is None and strengths.get(None) is None)
+
+    print("🏟️  Team storage")
+    initialize_team_storage()
+    league_teams = [team for countries in team_storage.teams_by_league.values()
+                    for teams in countries.values() for team in teams]
+    version = team_storage._raw_source[1]
+    squad = [team for team in league_teams if squad_strengths.get(team.league_info['team_id'], version)]
+    check(results, "clubs with player data rated from their squad", squad and all(
+        team.league_info['strength_source'] == 'squad'
+        and (team.league_info['attack'], team.league_info['midfield'], team.league_info['defence'])
+        == squad_strengths.get(team.league_info['team_id'], version) for team in squad))
+    squad_ids = {id(team) for team in squad}
+    check(results, "other clubs keep the team data ratings", all(
+        team.league_info.get('strength_source') != 'squad' for team in league_teams if id(team) not in squad_ids))
+    check(results, "shadowed duplicate names rated too", any(team_storage.teams_by_name[team.name] is not team
+                                                             for team in squad))
+
+    print("🎯 Attack factor")
+    home, away = squad[0], squad[1]
+    factor = 1 + (home.league_info['attack'] - away.league_info['defence']) / STRENGTH_SCALE
+    check(results, "squad against squad", attack_factor(home, away)
+          == min(max(factor, MIN_ATTACK_FACTOR), MAX_ATTACK_FACTOR))
+    other = next(team for team in league_teams if id(team) not in squad_ids)
+    check(results, "team data ratings play at 1.0", attack_factor(home, other) == attack_factor(other, home) == 1.0)
+    check(results, "custom team plays at 1.0", attack_factor(home, Team('Custom', 1500)) == 1.0)
+    strong, weak = Team('Strong'), Team('Weak')
+    strong.league_info = {'attack': 99, 'defence': 99, 'strength_source': 'squad'}
+    weak.league_info = {'attack': 1, 'defence': 1, 'strength_source': 'squad'}
+    check(results, "factor clamped", attack_factor(strong, weak) == MAX_ATTACK_FACTOR
+          and attack_factor(weak, strong) == MIN_ATTACK_FACTOR)
+
+    restored = Team(full_definition=json.loads(JsonEncoder().encode(home)))
+    check(results, "saved team keeps its ratings", restored.league_info == home.league_info
+          and attack_factor(restored, away) == attack_factor(home, away))
+    return results
+
+
+def main():
+    print("🧪 Squad strength test")
+    temp_dir = tempfile.mkdtemp(prefix="ffm_squad_")
+    try:
+        results = run_tests(temp_dir)
+    finally:
+        shutil.rmtree(temp_dir)
+
+    passed = sum(1 for _, ok in results if ok)
+    print(f"\n📋 {passed}/{len(results)} checks passed")
+    return 0 if passed == len(results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Team Columns Test Script
+
+Checks the NumPy columnar index of TeamStorage against plain Python scans of the
+teams:
+
+- Every column row matches the league_info of the team in the same row
+- mask() selects the same teams as a scan for a grid of rating bands, league
+  levels, leagues and countries
+- get_random_teams gives the same teams as the list-based sampling it replaced
+  under the same random seed
+- update_teams refreshes changed rows and the rating index
+
+Usage:
+    python tests/team_columns_test.py
+"""
+
+import sys
+import os
+import random
+
+# Add parent directory to path so we can import from core/
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.storage.team_columns import TeamColumns
+from core.storage.team_storage import initialize_team_storage, team_storage
+
+RATING_BANDS = ((None, None), (0, 100), (60, 70), (75, None), (None, 55), (90, 80))
+LEVEL_SETS = (None, [1], [2, 3], [9])
+
+
+def check(results, name, condition):
+    results.append((name, bool(condition)))
+    print(f"   {'✅' if condition else '❌'} {name}")
+
+
+def scan(teams, min_rating=None, max_rating=None, league_levels=None, league_name=None, country=None):
+    """Teams matching a predicate, scanning league_info."""
+    matches = []
+    for team in teams:
+        info = team.league_info
+        overall = info.get('overall_rating', 50.0)
+        if min_rating is not None and overall < min_rating:
+            continue
+        if max_rating is not None and overall > max_rating:
+            continue
+        if league_levels is not None and (info.get('league_level') or 1) not in league_levels:
+            continue
+        if league_name is not None and info.get('league_name') != league_name:
+            continue
+        if country is not None and info.get('country') != country:
+            continue
+        matches.append(team)
+    return matches
+
+
+def run_tests():
+    results = []
+    initialize_team_storage()
+    teams = list(team_storage.teams_by_name.values())
+    columns = team_storage.columns
+
+    print("📐 Columns")
+    check(results, "one row per team", len(columns) == len(teams) and columns.teams == teams)
+    check(results, "rows match league_info", all(
+        columns['overall'][row] == team.league_info['overall_rating']
+        and columns['attack'][row] == team.league_info['attack']
+        and columns['league_level'][row] == team.league_info['league_level']
+        and columns.league_names[columns['league_id'][row]] == team.league_info['league_name']
+        and columns.country_names[columns['country_id'][row]] == team.league_info['country']
+        for row, team in enumerate(teams)))
+
+    print("🔎 Masks")
+    team = teams[len(teams) // 2]
+    leagues = (None, team.league_info['league_name'], 'No Such League')
+    countries = (None, team.league_info['country'])
+    mismatches = 0
+    for min_rating, max_rating in RATING_BANDS:
+        for levels in LEVEL_SETS:
+            for league_name in leagues:
+                for country in countries:
+                    selected = columns.select(columns.mask(min_rating, max_rating, levels, league_name, country))
+                    if selected != scan(teams, min_rating, max_rating, levels, league_name, country):
+                        mismatches += 1
+    check(results, "masks match the scan", mismatches == 0)
+
+    print("🎲 Random teams")
+    same = True
+    for seed, (count, min_rating, max_rating) in enumerate(((5, 0, 100), (10, 60, 70), (3, 80, 90), (50, 85, 86))):
+        random.seed(seed)
+        drawn = team_storage.get_random_teams(count, min_rating, max_rating)
+        random.seed(seed)
+        eligible = scan(teams, min_rating, max_rating)
+        expected = eligible if len(eligible) < count else random.sample(eligible, count)
+        same &= drawn == expected
+    check(results, "same teams as list sampling with the same seed", same)
+
+    print("🔁 Updates")
+    index = TeamColumns(teams)
+    lowest = index.teams[index.rating_rows()[0]]
+    original = lowest.league_info['overall_rating']
+    try:
+        lowest.league_info['overall_rating'] = 99.5
+        index.update_teams([lowest])
+        check(results, "changed row refilled", index['overall'][index.teams.index(lowest)] == 99.5)
+        check(results, "rating index re-sorted", index.teams[index.rating_rows()[-1]] is lowest
+              and index.select(index.mask(99.5)) == [lowest])
+    finally:
+        lowest.league_info['overall_rating'] = original
+    return results
+
+
+def main():
+    print("🧪 Team columns test")
+    results = run_tests()
+    passed = sum(1 for _, ok in results if ok)
+    print(f"\n📋 {passed}/{len(results)} checks passed")
+    return 0 if passed == len(results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
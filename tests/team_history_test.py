@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Team History Test Script
+
+Checks the multi-version team history against single-version loads:
+
+- Every version of the raw CSV is loaded in one pass
+- A storage built from the history for a version has the same teams, ELOs and
+  league averages as load_from_raw_data for that version
+- As-of queries return the latest version not newer than the requested one
+- Building older versions does not change the ELO reference teams of the global
+  team storage
+
+Usage:
+    python tests/team_history_test.py
+"""
+
+import sys
+import os
+
+# Add parent directory to path so we can import from core/
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.storage.elo_estimator import ELOEstimator
+from core.storage.team_history import TeamHistory
+from core.storage.team_storage import DEFAULT_RAW_CSV_PATH, TeamStorage, initialize_team_storage, team_storage
+
+
+def check(results, name, condition):
+    results.append((name, bool(condition)))
+    print(f"   {'✅' if condition else '❌'} {name}")
+
+
+def team_summary(storage):
+    """(name, ELO, league, country) of every team, sorted by name."""
+    return sorted((name, round(team.elo, 6), team.league_info['league_name'], team.league_info['country'])
+                  for name, team in storage.teams_by_name.items())
+
+
+def run_tests():
+    results = []
+
+    print("📚 History")
+    history = TeamHistory()
+    check(results, "all versions loaded", history.load() and len(history.versions) > 1)
+    oldest, latest = history.versions[0], history.versions[-1]
+
+    direct = TeamStorage(ELOEstimator())
+    direct.load_from_raw_data(DEFAULT_RAW_CSV_PATH, latest, use_cache=False)
+    built = history.build_storage(latest)
+    check(results, f"FIFA {latest:g} storage equals a direct load", team_summary(built) == team_summary(direct))
+    check(results, "league metadata equal", built.league_metadata == direct.league_metadata)
+    check(results, "unknown version", history.build_storage(1.0) is None)
+
+    team_id = next(iter(history._rosters[latest]))
+    versions = history.team_versions(team_id)
+    check(results, "as-of query between versions",
+          history.record(team_id, versions[0] + 0.5).fifa_version == versions[0])
+    check(results, "exact query misses a missing version", history.record(team_id, versions[0] + 0.5, exact=True)
+          is None)
+
+    print("🔒 Global storage isolation")
+    initialize_team_storage()
+    references = {name: (elo, metrics) for name, (elo, metrics) in team_storage.estimator.known_teams.items()}
+    elos = {name: team.elo for name, team in team_storage.teams_by_name.items()}
+    history.build_storage(oldest)
+    history.build_storage(history.versions[len(history.versions) // 2])
+    check(results, "reference teams unchanged", team_storage.estimator.known_teams == references)
+    check(results, "team ELOs unchanged", {name: team.elo for name, team in team_storage.teams_by_name.items()}
+          == elos)
+    return results
+
+
+def main():
+    print("🧪 Team history test")
+    results = run_tests()
+    passed = sum(1 for _, ok in results if ok)
+    print(f"\n📋 {passed}/{len(results)} checks passed")
+    return 0 if passed == len(results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Team Ingestion Test Script
+
+Checks the single-pass streaming ingestion of the raw team CSV:
+
+- The row parser drops rows of other FIFA versions, international friendlies and
+  rows without team, league or country; rows with invalid numbers only serve as
+  ELO references
+- Teams without an overall rating keep their position in their league and are
+  estimated against every reference team of the file; a later row with the same
+  name owns the name lookup
+- On the real CSV, the streamed storage has the same teams and ELOs as a two-pass
+  load (all references first, then one estimate per team)
+
+Usage:
+    python tests/team_ingestion_test.py
+"""
+
+import sys
+import os
+import csv
+import shutil
+import tempfile
+import types
+
+# Add parent directory to path so we can import from core/
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.storage.elo_estimator import ELOEstimator
+from core.storage.team_storage import DEFAULT_RAW_CSV_PATH, TeamStorage, _PendingTeam
+
+
+def check(results, name, condition):
+    results.append((name, bool(condition)))
+    print(f"   {'✅' if condition else '❌'} {name}")
+
+
+def read_header():
+    with open(DEFAULT_RAW_CSV_PATH, 'r', encoding='utf-8', newline='') as f:
+        return next(csv.reader(f))
+
+
+def make_row(header, **values):
+    defaults = {'team_id': '1', 'fifa_version': '24.0', 'league_name': 'Test League', 'league_level': '1',
+                'nationality_name': 'Testland', 'overall': '70', 'attack': '70', 'midfield': '70',
+                'defence': '70', 'international_prestige': '5', 'domestic_prestige': '5',
+                'transfer_budget_eur': '1000000', 'club_worth_eur': '50000000', 'home_stadium': 'Ground'}
+    defaults.update(values)
+    return [str(defaults.get(name, '')) for name in header]
+
+
+def two_pass_elos(storage_class, csv_path, fifa_version):
+    """ELO by team name from a two-pass load: every reference first, then one estimate per team."""
+    records = list(storage_class._iter_team_records(csv_path, fifa_version))
+    helper = storage_class(ELOEstimator())
+    for record in records:
+        if record.overall is not None and 30 <= record.overall <= 100:
+            helper.estimator.add_known_team(record.team_name, helper._calculate_elo_from_overall(record.overall),
+                                            storage_class._record_metrics(record))
+    elos = {}
+    for record in records:
+        if not record.valid:
+            continue
+        if record.overall is not None and 30 <= record.overall <= 100:
+            elos[record.team_name] = helper._calculate_elo_from_overall(record.overall)
+        else:
+            elos[record.team_name] = helper.estimator.estimate_elo(storage_class._record_metrics(record))
+    return elos
+
+
+def run_tests(temp_dir):
+    results = []
+    header = read_header()
+
+    print("🧾 Rows")
+    csv_path = os.path.join(temp_dir, 'teams.csv')
+    rows = [
+        make_row(header, team_id=1, team_name='Alpha', overall=75),
+        make_row(header, team_id=2, team_name='Beta', overall=''),                    # estimated
+        make_row(header, team_id=3, team_name='Gamma', overall=68),
+        make_row(header, team_id=4, team_name='Old', fifa_version='23.0'),            # other version
+        make_row(header, team_id=5, team_name='Nation', league_name='Friendly International'),
+        make_row(header, team_id=6, team_name='Nowhere', nationality_name=''),       # no country
+        make_row(header, team_id=7, team_name='Broken', overall=72, attack='n/a'),   # reference only
+        make_row(header, team_id=8, team_name='Alpha', overall=77),                  # duplicate name
+        make_row(header, team_id=9, team_name='Other', league_name='Second League', overall=60)[:20],  # short row
+    ]
+    with open(csv_path, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(header)
+        writer.writerows(rows)
+
+    stream = TeamStorage._iter_team_records(csv_path, 24.0)
+    check(results, "records are streamed", isinstance(stream, types.GeneratorType))
+    records = list(stream)
+    check(results, "filtered rows dropped", [record.team_name for record in records]
+          == ['Alpha', 'Beta', 'Gamma', 'Broken', 'Alpha', 'Other'])
+    check(results, "invalid numbers keep a reference-only row",
+          [record.valid for record in records] == [True, True, True, False, True, True])
+    check(results, "all versions without a filter", len(list(TeamStorage._iter_team_records(csv_path, None))) == 7)
+
+    storage = TeamStorage(ELOEstimator())
+    check(results, "storage loaded", storage.load_from_records(TeamStorage._iter_team_records(csv_path, 24.0)))
+    league = storage.teams_by_league['Test League']['Testland']
+    check(results, "league keeps file order", [team.name for team in league] == ['Alpha', 'Beta', 'Gamma', 'Alpha'])
+    check(results, "no placeholder left", not any(isinstance(team, _PendingTeam) for team in league))
+    check(results, "later duplicate owns the name", storage.teams_by_name['Alpha'] is league[3]
+          and storage.teams_by_name['Alpha'].league_info['team_id'] == 8)
+    check(results, "reference-only row not a team", 'Broken' not in storage.teams_by_name
+          and 'Broken' in storage.estimator.known_teams)
+    check(results, "estimated teams tracked", storage._teams_with_estimated_elo == {'Beta'})
+    check(results, "short row padded", storage.teams_by_name['Other'].league_info['league_name'] == 'Second League')
+    check(results, "league metadata counts teams", storage.league_metadata['Test League']['Testland']['team_count']
+          == 4)
+
+    print("📄 Real CSV")
+    streamed = TeamStorage(ELOEstimator())
+    streamed.load_from_raw_data(DEFAULT_RAW_CSV_PATH, 24.0, use_cache=False)
+    expected = two_pass_elos(TeamStorage, DEFAULT_RAW_CSV_PATH, 24.0)
+    check(results, "same teams as a two-pass load", set(streamed.teams_by_name) == set(expected))
+    check(results, "same ELOs as a two-pass load",
+          all(abs(team.elo - expected[name]) < 1e-9 for name, team in streamed.teams_by_name.items()))
+    return results
+
+
+def main():
+    print("🧪 Team ingestion test")
+    temp_dir = tempfile.mkdtemp(prefix="ffm_ingestion_")
+    try:
+        results = run_tests(temp_dir)
+    finally:
+        shutil.rmtree(temp_dir)
+
+    passed = sum(1 for _, ok in results if ok)
+    print(f"\n📋 {passed}/{len(results)} checks passed")
+    return 0 if passed == len(results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Team Sampler Test Script
+
+Checks the exclusion-aware stratified sampler (TeamStorage.sample_teams over
+TeamColumns.draw) against plain Python scans of the teams:
+
+- Drawn teams are distinct, inside the requested stratum (rating band, country,
+  league levels) and never excluded
+- A stratum smaller than the request returns all its eligible teams
+- Draws follow random.seed() and, over many draws, reach every eligible team
+
+Usage:
+    python tests/team_sampler_test.py
+"""
+
+import sys
+import os
+import random
+
+# Add parent directory to path so we can import from core/
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.storage.team_storage import initialize_team_storage, team_storage
+
+STRATA = (
+    {},
+    {'min_rating': 85, 'max_rating': 100},
+    {'min_rating': 60, 'max_rating': 70, 'league_levels': [1]},
+    {'league_levels': [2]},
+    {'max_rating': 55},
+)
+
+
+def check(results, name, condition):
+    results.append((name, bool(condition)))
+    print(f"   {'✅' if condition else '❌'} {name}")
+
+
+def eligible(teams, min_rating=None, max_rating=None, country=None, league_levels=None, exclude=()):
+    """Names of the teams of a stratum, scanning league_info."""
+    names = set()
+    for team in teams:
+        info = team.league_info
+        if min_rating is not None and info['overall_rating'] < min_rating:
+            continue
+        if max_rating is not None and info['overall_rating'] > max_rating:
+            continue
+        if country is not None and info['country'] != country:
+            continue
+        if league_levels is not None and info['league_level'] not in league_levels:
+            continue
+        if team.name not in exclude:
+            names.add(team.name)
+    return names
+
+
+def run_tests():
+    results = []
+    initialize_team_storage()
+    teams = list(team_storage.teams_by_name.values())
+    country = teams[0].league_info['country']
+    rng = random.Random(7)
+
+    print("🎯 Strata")
+    inside = distinct = True
+    for stratum in STRATA + ({'country': country},):
+        pool = eligible(teams, **stratum)
+        exclude = set(rng.sample(sorted(pool), min(len(pool), 5)))
+        for count in (1, 10, 40):
+            drawn = [team.name for team in team_storage.sample_teams(count, exclude=exclude, **stratum)]
+            distinct &= len(drawn) == len(set(drawn))
+            inside &= set(drawn) <= pool - exclude and len(drawn) == min(count, len(pool - exclude))
+    check(results, "drawn teams inside the stratum and not excluded", inside)
+    check(results, "drawn teams distinct", distinct)
+
+    pool = eligible(teams, country=country)
+    check(results, "small stratum returned whole",
+          {team.name for team in team_storage.sample_teams(len(pool) + 10, country=country)} == pool)
+    check(results, "unknown country", team_storage.sample_teams(5, country='Atlantis') == [])
+    check(results, "everything excluded", team_storage.sample_teams(5, country=country, exclude=pool) == [])
+
+    print("🎲 Randomness")
+    random.seed(42)
+    first = team_storage.sample_teams(10, min_rating=60, max_rating=75)
+    random.seed(42)
+    check(results, "same seed, same draw", team_storage.sample_teams(10, min_rating=60, max_rating=75) == first)
+    pool = eligible(teams, min_rating=80, max_rating=100)
+    seen = set()
+    for _ in range(400):
+        seen.update(team.name for team in team_storage.sample_teams(5, min_rating=80, max_rating=100))
+    check(results, "every eligible team reached", seen == pool)
+    return results
+
+
+def main():
+    print("🧪 Team sampler test")
+    results = run_tests()
+    passed = sum(1 for _, ok in results if ok)
+    print(f"\n📋 {passed}/{len(results)} checks passed")
+    return 0 if passed == len(results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
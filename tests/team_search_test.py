@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Team Search Test Script
+
+Checks the accent-insensitive team search index:
+
+- Folding strips accents, case and separators and transliterates letters such as
+  "ø" and "ł"
+- Results are ranked exact name, name prefix, word prefixes, substring, fuzzy
+- On the real teams, the indexed search returns the same teams in the same order
+  as a scan that ranks every name, for queries derived from the names (prefixes,
+  substrings, words, typos, accented and short queries)
+
+Usage:
+    python tests/team_search_test.py
+"""
+
+import sys
+import os
+import random
+
+# Add parent directory to path so we can import from core/
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.entities.team import Team
+from core.storage.team_search import (EXACT, FUZZY, FUZZY_THRESHOLD, PREFIX, SUBSTRING, TOKEN_PREFIX,
+                                      TeamSearchIndex, fold, trigrams)
+from core.storage.team_storage import initialize_team_storage, team_storage
+
+
+def check(results, name, condition):
+    results.append((name, bool(condition)))
+    print(f"   {'✅' if condition else '❌'} {name}")
+
+
+def scan_search(teams, query, limit):
+    """Rank every team name with the index's rules, without the index."""
+    folded = fold(query)
+    if not folded:
+        return teams[:limit]
+    query_grams = trigrams(folded)
+    ranked = []
+    for team in teams:
+        name = fold(team.name)
+        tokens = name.split()
+        score = 0.0
+        if name == folded:
+            rank = EXACT
+        elif name.startswith(folded):
+            rank = PREFIX
+        elif all(any(token.startswith(word) for token in tokens) for word in folded.split()):
+            rank = TOKEN_PREFIX
+        elif folded in name:
+            rank = SUBSTRING
+        else:
+            grams = trigrams(name)
+            score = 2 * len(query_grams & grams) / (len(query_grams) + len(grams))
+            if score < FUZZY_THRESHOLD:
+                continue
+            rank = FUZZY
+        ranked.append(((rank, -score, len(name), name), team))
+    ranked.sort(key=lambda entry: entry[0])
+    return [team for _, team in ranked[:limit]]
+
+
+def queries_from(names, rng):
+    """Queries derived from real names."""
+    queries = ['', 'fc', 'a', 'united', 'real', 'zzzz', 'Bayern München', 'MONCHENGLADBACH']
+    for name in rng.sample(names, 40):
+        folded = fold(name)
+        queries.append(name)
+        queries.append(name[:max(1, len(name) // 2)])
+        queries.append(folded.split()[-1])
+        if len(folded) > 6:
+            start = rng.randrange(len(folded) - 4)
+            queries.append(folded[start:start + 4])
+            typo = rng.randrange(len(folded))
+            queries.append(folded[:typo] + 'x' + folded[typo + 1:])
+    return queries
+
+
+def run_tests():
+    results = []
+
+    print("🔤 Folding")
+    check(results, "accents and case", fold("Borussia Mönchengladbach") == "borussia monchengladbach")
+    check(results, "transliteration", fold("Bodø/Glimt") == "bodo glimt" and fold("Łódź") == "lodz")
+    check(results, "separators collapsed", fold("  1. FC  Köln ") == "1 fc koln")
+
+    print("🏅 Ranking")
+    names = ['Real Madrid', 'Real', 'Real Sociedad', 'Madrid Real Club', 'Unreal FC', 'Rael Betis', 'Cádiz']
+    index = TeamSearchIndex([Team(name, 1500) for name in names])
+    check(results, "exact, prefix, words, substring", [team.name for team in index.search('real', 10)] ==
+          ['Real', 'Real Madrid', 'Real Sociedad', 'Madrid Real Club', 'Unreal FC'])
+    check(results, "fuzzy match for a typo", [team.name for team in index.search('real madird', 10)][:1]
+          == ['Real Madrid'])
+    check(results, "word prefixes in any order", [team.name for team in index.search('madr rea', 10)][:2]
+          == ['Real Madrid', 'Madrid Real Club'])
+    check(results, "accent-insensitive", [team.name for team in index.search('cadiz')] == ['Cádiz'])
+    check(results, "limit", len(index.search('r', 2)) == 2)
+
+    print("📚 Real teams")
+    initialize_team_storage()
+    teams = list(team_storage.teams_by_name.values())
+    rng = random.Random(3)
+    queries = queries_from(list(team_storage.teams_by_name), rng)
+    mismatches = [query for query in queries
+                  if team_storage.search_teams(query, 20) != scan_search(teams, query, 20)]
+    check(results, f"{len(queries)} queries match the scan", not mismatches)
+    for query in mismatches[:5]:
+        print(f"      mismatch: {query!r}")
+    check(results, "every team finds itself first",
+          all(team_storage.search_teams(team.name, 1) == [team] for team in teams))
+    return results
+
+
+def main():
+    print("🧪 Team search test")
+    results = run_tests()
+    passed = sum(1 for _, ok in results if ok)
+    print(f"\n📋 {passed}/{len(results)} checks passed")
+    return 0 if passed == len(results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())